@@ -1,9 +1,48 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace, FrozenInstanceError
 from CoolProp.CoolProp import PropsSI, PhaseSI
-from functools import cached_property
+from functools import cached_property, cache
 from typing import Literal, Optional
+from weakref import WeakValueDictionary
 from scipy import constants
 
+# Pool of FlowStates shared between components, equal states are only constructed once (see FlowState.get)
+_FLOWSTATE_POOL: WeakValueDictionary = WeakValueDictionary()
+
+
+@cache
+def _field_names(flow_state_class: type) -> tuple[str, ...]:
+    return tuple(state_field.name for state_field in fields(flow_state_class))
+
+
+def _raise_frozen(self, name, *args):
+    raise FrozenInstanceError(f'Cannot change [{name}] of an interned {type(self).__name__}, '
+                              f'use fast_replace or FlowState.get to create a changed copy instead')
+
+
+def _get_interned(flow_state_class: type, state_dict: dict) -> 'FlowState':
+    """Recreate an interned FlowState from its mutable class and attributes, used to copy and pickle them."""
+    flow_state = object.__new__(flow_state_class)
+    flow_state.__dict__.update(state_dict)
+    return FlowState.get(flow_state)
+
+
+@cache
+def _frozen_variant(flow_state_class: type) -> type:
+    """Read-only subclass that interned states of flow_state_class are switched to, see FlowState.get.
+
+    Constructing it (e.g. through dataclasses.replace) returns a new mutable flow_state_class instance instead.
+    """
+    return type(flow_state_class.__name__, (flow_state_class,), {
+        '__slots__': (),
+        '__qualname__': flow_state_class.__qualname__,
+        '__module__': flow_state_class.__module__,
+        '_mutable_class': flow_state_class,
+        '__new__': lambda cls, *args, **kwargs: flow_state_class(*args, **kwargs),
+        '__setattr__': _raise_frozen,
+        '__delattr__': _raise_frozen,
+        '__reduce__': lambda self: (_get_interned, (flow_state_class, dict(self.__dict__))),
+    })
+
 
 @dataclass
 class FlowState:
@@ -19,6 +58,40 @@ class FlowState:
     mass_flow: Optional[float]  # [kg/s]
     type: Literal['oxidizer', 'fuel', 'other']
 
+    @staticmethod
+    def get(base_flow_state: 'FlowState', **changes) -> 'FlowState':
+        """Return a copy of base_flow_state with the given field changes, equal to dataclasses.replace.
+
+        Logically identical states are interned, so the returned FlowState can be shared with other components and
+        raises a FrozenInstanceError when changed in place.
+        """
+        flow_state_class = getattr(type(base_flow_state), '_mutable_class', type(base_flow_state))
+        key = (flow_state_class,) + tuple(changes[name] if name in changes else getattr(base_flow_state, name)
+                                          for name in _field_names(flow_state_class))
+        flow_state = _FLOWSTATE_POOL.get(key)
+        if flow_state is None:
+            flow_state = replace(base_flow_state, **changes)
+            object.__setattr__(flow_state, '__class__', _frozen_variant(flow_state_class))
+            _FLOWSTATE_POOL[key] = flow_state
+        return flow_state
+
+    def fast_replace(self, **changes) -> 'FlowState':
+        """Return a copy with the given field changes, equal to dataclasses.replace but without calling __init__.
+
+        Cached properties of FlowState only depend on the propellant, they are kept unless the propellant_name changes.
+        Subclasses that derive state in __post_init__ (e.g. DynamicFlowState) fall back to dataclasses.replace.
+        """
+        if hasattr(self, '__post_init__'):
+            return replace(self, **changes)
+        flow_state = object.__new__(getattr(type(self), '_mutable_class', type(self)))
+        state_dict = flow_state.__dict__
+        state_dict.update(self.__dict__)
+        if 'propellant_name' in changes:
+            state_dict.pop('molar_mass', None)
+            state_dict.pop('specific_gas_constant', None)
+        state_dict.update(changes)
+        return flow_state
+
     @property
     def print_pretty_dict(self):
         from collections import defaultdict
@@ -4,6 +4,10 @@ from dataclasses import dataclass, field
 from EngineComponents.Abstract.StructuralComponent import StructuralComponent
 from math import pi
 
+_THREE_OVER_4PI = 3 / (4 * pi)
+_ONE_THIRD = 1 / 3
+
+
 @dataclass
 class PressureComponent(StructuralComponent):
     @property
@@ -49,7 +53,7 @@ class NewPressureComponent(StructuralComponent):
     @property
     def radius(self):
         if self.geometry == 'sphere':
-            return (3 * self.volume / 4 / pi)**(1 / 3)
+            return (self.volume * _THREE_OVER_4PI) ** _ONE_THIRD
         else:
             return (self.volume / (pi * self.length)) ** 0.5
 
@@ -62,5 +62,6 @@ class Merger(FlowComponent):
 
         Assumes the same heat capacity for all flows, thus possible over simplification for non-homogeneous flows.
         """
-        return sum(flow_state.mass_flow * flow_state.temperature / self.total_mass_flow
+        total_mass_flow = self.total_mass_flow
+        return sum(flow_state.mass_flow * flow_state.temperature / total_mass_flow
                    for flow_state in self.inlet_flow_states)
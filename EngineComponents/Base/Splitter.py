@@ -1,9 +1,9 @@
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field
+from math import fsum, isclose
 from typing import Optional
 
-import numpy as np
-
 from EngineComponents.Abstract.FlowComponent import FlowComponent
+from EngineComponents.Abstract.FlowState import FlowState
 
 
 @dataclass
@@ -21,8 +21,11 @@ class Splitter(FlowComponent):
     outlet_flow_names: Optional[tuple[str, ...]] = None
     resolved_mass_flows: tuple[float, ...] = field(init=False)
     outlet_flow_states: dict = field(init=False, default_factory=dict)
+    _required_sum: float = field(init=False, repr=False, default=0)
 
     def __post_init__(self):
+        if self.required_outlet_mass_flows is not None:
+            self._required_sum = fsum(self.required_outlet_mass_flows)
         self.split_flows()
 
     def split_flows(self):
@@ -39,12 +42,12 @@ class Splitter(FlowComponent):
         """Creates N+1 outlet mass flows, the value of the last outlet mass flow taken such that the total sum of outlet
          mass flows equals the inlet mass flow
         """
-        if np.isclose(self.required_outlet_mass_flows, self.inlet_flow_state.mass_flow, rtol=1e-7):
+        if isclose(self._required_sum, self.inlet_flow_state.mass_flow, rel_tol=1e-7, abs_tol=1e-8):
             final_mass_flow = 0
         else:
-            if sum(self.required_outlet_mass_flows) > self.inlet_flow_state.mass_flow:
+            if self._required_sum > self.inlet_flow_state.mass_flow:
                 raise ValueError('Sum of given mass flows must be less than the inlet mass flow')
-            final_mass_flow = self.inlet_mass_flow - sum(self.required_outlet_mass_flows)
+            final_mass_flow = self.inlet_mass_flow - self._required_sum
         self.resolved_mass_flows = self.required_outlet_mass_flows + (final_mass_flow,)
 
     def resolve_fractional_outlet_mass_flows(self):
@@ -62,10 +65,10 @@ class Splitter(FlowComponent):
                                  'generated, i.e. [len(outlet_mass_flows) + 1] or [len(mass_flow_fractions)] names')
             names = self.outlet_flow_names
         for name, mass_flow in zip(names, self.resolved_mass_flows):
-            state = replace(self.inlet_flow_state,
-                            pressure=self.outlet_pressure,
-                            temperature=self.outlet_temperature,
-                            mass_flow=mass_flow)
+            state = FlowState.get(self.inlet_flow_state,
+                                  pressure=self.outlet_pressure,
+                                  temperature=self.outlet_temperature,
+                                  mass_flow=mass_flow)
             self.outlet_flow_states[name] = state
             setattr(self,
                     f'outlet_flow_state_{name}',
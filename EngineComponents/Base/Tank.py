@@ -8,6 +8,8 @@ import numpy as np
 from EngineComponents.Abstract.PressureComponent import PressureComponent, NewPressureComponent
 from EngineComponents.Abstract.FlowComponent import FlowComponent
 
+_PI_OVER_3 = pi / 3
+
 
 # @dataclass
 # class Tank(FlowComponent, PressureComponent):
@@ -100,11 +102,11 @@ class Tank(FlowComponent, NewPressureComponent):
     @property
     def cap_height(self):
         r = self.radius
-        a = pi / 3
+        a = _PI_OVER_3
         b = -pi * r
-        c = 0
+        c = 0.0
         d = self.unused_volume
-        sols = np.roots(np.array([a,b,c,d]))
+        sols = np.roots(np.array([a, b, c, d]))
         sols = [sol for sol in sols if r > sol > 0]
         return min(sols)
 
@@ -4,7 +4,7 @@ from typing import Callable, Optional
 import scipy.integrate
 import scipy.optimize
 from numpy import linspace
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from EngineComponents.Base.CombustionChamber import CombustionChamber
 from EngineComponents.Base.Nozzle import Nozzle
 from EngineFunctions.IRTFunctions import get_local_mach
@@ -119,9 +119,12 @@ class ThrustChamberSection(ThrustChamber):
     max_distance: Optional[float] = None  # [m]
     min_distance_expansion_ratio: Optional[float] = None  # [-]
     max_distance_expansion_ratio: Optional[float] = None  # [-]
+    _min_distance_from_throat: float = field(init=False, repr=False, default=0)  # [m]
+    _max_distance_from_throat: float = field(init=False, repr=False, default=0)  # [m]
 
     def __post_init__(self):
         self.set_distances_from_eps()
+        self.resolve_distance_bounds()
 
     def set_distances_from_eps(self):
         """Set and override min_distance and/or max_distance if its respective distance_expansion_ratio is provided."""
@@ -139,22 +142,29 @@ class ThrustChamberSection(ThrustChamber):
                 distance = self.get_distance_for_divergent_expansion_ratio(eps)
                 setattr(self, f'{minmax}_distance', distance)
 
-    @property
-    def min_distance_from_throat(self):
+    def resolve_distance_bounds(self):
+        """Resolve the section bounds once and check them against the bounds of the complete ThrustChamber."""
+        chamber_min = ThrustChamber.min_distance_from_throat.fget(self)
+        chamber_max = ThrustChamber.max_distance_from_throat.fget(self)
         if self.min_distance is None:
-            return super().min_distance_from_throat
+            self._min_distance_from_throat = chamber_min
+        elif self.min_distance < chamber_min:
+            raise ValueError(
+                'ThrustChamberSection min distance (from throat) out of bounds of complete ThrustChamber')
         else:
-            if self.min_distance < super().min_distance_from_throat:
-                raise ValueError(
-                    'ThrustChamberSection min distance (from throat) out of bounds of complete ThrustChamber')
-            return self.min_distance
+            self._min_distance_from_throat = self.min_distance
+        if self.max_distance is None:
+            self._max_distance_from_throat = chamber_max
+        elif self.max_distance > chamber_max:
+            raise ValueError(
+                'ThrustChamberSection max distance (from throat) out of bounds of complete ThrustChamber')
+        else:
+            self._max_distance_from_throat = self.max_distance
+
+    @property
+    def min_distance_from_throat(self):
+        return self._min_distance_from_throat
 
     @property
     def max_distance_from_throat(self):
-        if self.max_distance is None:
-            return super().max_distance_from_throat
-        else:
-            if self.max_distance > super().max_distance_from_throat:
-                raise ValueError(
-                    'ThrustChamberSection max distance (from throat) out of bounds of complete ThrustChamber')
-            return self.max_distance
+        return self._max_distance_from_throat
@@ -1,6 +1,6 @@
 from EngineComponents.Abstract.PressureComponent import PressureComponent, NewPressureComponent
 from EngineComponents.Abstract.FlowState import ManualFlowState, DefaultFlowState, FlowState
-from dataclasses import dataclass, replace, field
+from dataclasses import dataclass, field
 from typing import Optional
 
 
@@ -24,9 +24,9 @@ class GasGenerator(NewPressureComponent):
 
     @property
     def outlet_flow_state(self) -> FlowState:
-        return replace(self.base_flow_state,
-                       mass_flow=self.outlet_mass_flow,
-                       temperature=self.outlet_temperature, )
+        return FlowState.get(self.base_flow_state,
+                             mass_flow=self.outlet_mass_flow,
+                             temperature=self.outlet_temperature, )
 
     # Mass Calculation Properties
     @property
@@ -3,6 +3,14 @@ from typing import Optional
 from EngineComponents.Abstract.FlowComponent import FlowComponent
 
 
+def get_turbine_mass_flow_required(power_required: float, efficiency: float, specific_heat_capacity: float,
+                                   heat_capacity_ratio: float, inlet_temperature: float, pressure_ratio: float):
+    """Numeric kernel of the turbine mass flow required to deliver power_required, only takes floats."""
+    y = heat_capacity_ratio
+    return power_required / (efficiency * specific_heat_capacity * inlet_temperature
+                             * (1 - pressure_ratio ** ((1 - y) / y)))
+
+
 @dataclass
 class Turbine(FlowComponent):
     power_required: float = 0  # [W]
@@ -22,9 +30,13 @@ class Turbine(FlowComponent):
 
     @property
     def mass_flow_required(self):
-        cp, y = self.inlet_flow_state.specific_heat_capacity, self.inlet_flow_state.heat_capacity_ratio
-        return (self.power_required / (self.efficiency * cp * self.inlet_temperature
-                                       * (1 - self.pressure_ratio ** ((1 - y) / y))))
+        inlet_flow_state = self.inlet_flow_state
+        return get_turbine_mass_flow_required(power_required=self.power_required,
+                                              efficiency=self.efficiency,
+                                              specific_heat_capacity=inlet_flow_state.specific_heat_capacity,
+                                              heat_capacity_ratio=inlet_flow_state.heat_capacity_ratio,
+                                              inlet_temperature=inlet_flow_state.temperature,
+                                              pressure_ratio=self.pressure_ratio)
 
     @property
     def temperature_change(self):
@@ -1,9 +1,11 @@
+import sys
 import warnings
 from dataclasses import dataclass, field
-from functools import cached_property
+from functools import lru_cache
 from math import log, exp
-from CoolProp import CoolProp
+from typing import Optional
 
+import numpy as np
 from scipy import constants as constants
 
 from EngineComponents.Base.CombustionChamber import CombustionChamber
@@ -20,8 +22,8 @@ from EngineComponents.Base.Pump import Pump
 from EngineComponents.Base.Merger import Merger
 from EngineComponents.Abstract.FlowState import FlowState, ManualFlowState
 from EngineComponents.Abstract.Material import Material
-from EngineFunctions.BaseFunctions import format_fancy_name
-from EngineFunctions.CEAFunctions import get_cea_dict, get_cea_chamber_dict
+from EngineFunctions.BaseFunctions import format_fancy_name, fast_cached_property
+from EngineFunctions.CEAFunctions import CEAArgs, get_cea_dict_cached, get_cea_chamber_dict_cached
 from EngineFunctions.IRTFunctions import get_expansion_ratio_from_p_ratio, \
     get_pressure_ratio_fsolve, get_throat_area, get_thrust_coefficient_from_ideal
 from EngineFunctions.AssumeValueFunctions import get_characteristic_length, get_initial_propellant_temperature, \
@@ -30,6 +32,57 @@ from EngineFunctions.AssumeValueFunctions import get_characteristic_length, get_
 from EngineFunctions.EmpiricalRelations import get_chamber_throat_area_ratio_estimate
 
 
+_G0 = constants.g
+_PI = constants.pi
+_P_SEA = constants.atm
+
+# (display name, attribute name) pairs of the components of each cycle class, components_list only depends on the class.
+# components_list itself stays a property: the mixins (e.g. GasGeneratorCycle_Mixin) extend it through super() for
+# whichever base cycle they are combined with and the Series variants remove entries, which a tuple concatenated at class
+# definition time cannot express. This cache makes components_masses allocation free after the first call per class.
+_COMPONENT_ATTRIBUTES: dict[type, tuple[tuple[str, str], ...]] = {}
+
+# (attribute, CEA output key) pairs of the values set by EngineCycle.set_cea
+_CEA_FIELD_MAP = (
+    ('characteristic_velocity', 'c_star'),
+    ('ideal_thrust_coefficient', 'C_F'),
+    ('combustion_temperature', 'T_C'),
+    ('cc_hot_gas_molar_mass', 'mm_cc'),
+    ('cc_hot_gas_heat_capacity_ratio', 'y_cc'),
+    ('cc_hot_gas_dynamic_viscosity', 'mu_cc'),
+    ('cc_hot_gas_prandtl_number', 'pr_cc'),
+    ('cc_hot_gas_specific_heat_capacity', 'cp_cc'),
+)
+
+
+def _get_mass_budget(dry_mass: np.ndarray, pressurant_mass: np.ndarray, props_mass: np.ndarray,
+                     overall_specific_impulse: np.ndarray,
+                     delta_v: Optional[np.ndarray] = None) -> dict[str, np.ndarray]:
+    """Vectorized equivalent of the EngineCycle mass ratio, delta v and payload relations."""
+    final_mass = dry_mass + pressurant_mass
+    initial_mass = final_mass + props_mass
+    mass_ratio = initial_mass / final_mass
+    effective_exhaust_velocity = overall_specific_impulse * _G0
+    budget = {'final_mass': final_mass,
+              'initial_mass': initial_mass,
+              'mass_ratio': mass_ratio,
+              'ideal_delta_v': effective_exhaust_velocity * np.log(mass_ratio)}
+    if delta_v is not None:
+        e_dv = np.exp(delta_v / effective_exhaust_velocity)
+        budget['payload'] = (initial_mass - final_mass * e_dv) / (e_dv - 1)
+    return budget
+
+
+@lru_cache
+def _get_abstract_state(backend: str, coolprop_name: str):
+    """Reusable low-level CoolProp state, avoids the input parsing and backend lookup of PropsSI."""
+    from CoolProp import CoolProp
+    return CoolProp.AbstractState(backend, coolprop_name)
+
+
+# Not slotted: the cached properties and the iteration cache live in the instance __dict__, and slotted dataclasses in
+# the mixin based cycle hierarchy (e.g. GasGeneratorCycle_Mixin + OpenEngineCycle) would have conflicting layouts. The
+# same holds for the subclasses and mixins, slotting only some of them would not remove the __dict__ of the instances.
 @dataclass
 class EngineCycle:
     thrust: float  # [N]
@@ -118,12 +171,76 @@ class EngineCycle:
     minimum_required_coolant_mass_flow: float = field(init=False, repr=False, default=0)
     _fuel_pump_outlet_pressure: float | None = field(init=False, repr=False, default=None)
     _oxidizer_pump_outlet_pressure: float | None = field(init=False, repr=False, default=None)
-    _expansion_ratio_end_cooling: float | None = field(init=False, repr=False, default=None)
     _cea_frozen: float | None = field(init=False, repr=False, default=None)
     _cea_frozenAtThroat: float | None = field(init=False, repr=False, default=None)
     verbose: bool = True
     iterate: bool = True
 
+    # Cached properties that depend on values which change during iteration, cleared when an iteration state is set
+    _iteration_cached_properties = (
+        'thrust_coefficient', 'chamber_mass_flow', 'throat_area', 'exit_area', 'exit_pressure', 'chamber_fuel_flow',
+        'chamber_oxidizer_flow', 'total_mass_flow', 'oxidizer_main_flow_state', 'fuel_main_flow_state', 'oxidizer',
+        'fuel', 'pressurant_initial_state', 'pressurant', 'pressurant_tank', 'oxidizer_tank', 'fuel_tank',
+        'oxidizer_pump', 'fuel_pump', 'injector', 'cooling_channel_section',
+        # Mass tree and performance summaries
+        'pumps_mass', 'tanks_mass', 'props_mass', 'mass_kwak', 'mass_ratio_kwak', 'inverse_mass_ratio_kwak',
+        'ideal_delta_v_kwak', 'total_thrust_chamber_mass', 'chamber_propellant_mass', 'feed_system_mass',
+        'cc_prop_group_mass', 'tanks_plus_pressurant', 'engine_dry_mass', 'dry_mass', 'initial_mass', 'final_mass',
+        'inverse_mass_ratio', 'mass_ratio', 'perct', 'ideal_delta_v', 'overall_specific_impulse', 'aggregate_masses',
+        'components_masses', 'combined_info', 'effective_exhaust_velocity',
+    )
+
+    # Attributes that are assigned during set-up and iteration, setting one always clears the cached properties above
+    _iteration_state_attributes = frozenset((
+        'mass_mixture_ratio', 'pressure_ratio', 'expansion_ratio', 'cc_hot_gas_heat_capacity_ratio', '_cea_frozen',
+        '_cea_frozenAtThroat', 'heat_flow_rate', 'heat_flux_func', 'minimum_required_coolant_mass_flow',
+        '_fuel_pump_outlet_pressure', '_oxidizer_pump_outlet_pressure', '_is_temp_calc_needed',
+    ))
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self._iteration_state_attributes:
+            self.clear_iteration_cache()
+
+    def clear_iteration_cache(self):
+        """Remove cached values that depend on iteration state, call after changing a (nested) attribute in place."""
+        instance_dict = self.__dict__
+        for name in self._iteration_cached_properties:
+            instance_dict.pop(name, None)
+
+    @classmethod
+    def batch(cls, thrust, combustion_chamber_pressure, mass_mixture_ratio,
+              attributes: tuple[str, ...] = ('overall_specific_impulse', 'engine_dry_mass', 'initial_mass',
+                                             'throat_area', 'total_mass_flow'),
+              **kwargs) -> dict[str, np.ndarray]:
+        """Evaluate the cycle for (broadcastable) arrays of thrust, chamber pressure and mixture ratio.
+
+        Returns an array per requested attribute instead of separate engine objects, with NaN for designs that raise a
+        ValueError. CEA is only called once per unique chamber pressure and mixture ratio, as its results are
+        memoized."""
+        thrusts, pressures, mixture_ratios = np.broadcast_arrays(thrust, combustion_chamber_pressure,
+                                                                 mass_mixture_ratio)
+        results = {attribute: np.empty(thrusts.shape) for attribute in attributes}
+        for index in np.ndindex(thrusts.shape):
+            try:
+                engine = cls(thrust=float(thrusts[index]),
+                             combustion_chamber_pressure=float(pressures[index]),
+                             mass_mixture_ratio=float(mixture_ratios[index]),
+                             **kwargs)
+                values = [getattr(engine, attribute) for attribute in attributes]
+            except ValueError:
+                # Infeasible design (e.g. cooling not possible), marked as NaN instead of aborting the whole batch
+                values = [np.nan] * len(attributes)
+            for attribute, value in zip(attributes, values):
+                results[attribute][index] = value
+        return results
+
+    @classmethod
+    def evaluate_batch(cls, arrays: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """Evaluate the mass ratio, delta v and (if 'delta_v' is given) payload relations for arrays of dry_mass,
+        pressurant_mass, props_mass and overall_specific_impulse, without building engines."""
+        return _get_mass_budget(**{key: np.asarray(value, dtype=float) for key, value in arrays.items()})
+
     def __post_init__(self):
         self.initialize_cea()
         self.set_initial_values()
@@ -163,9 +280,10 @@ class EngineCycle:
                 'Error calculating expansion ratio: Neither or both the pressure_ratio and expansion_ratio are given. Provide one and only one.'
             )
 
-        # Get heat capacity ratio before setting CEA (needed for pressure ratio calculation)
+        # Get heat capacity ratio before setting CEA (needed for pressure ratio calculation), only if not provided
         if self.pressure_ratio is None and self.expansion_ratio is not None:
-            self.cc_hot_gas_heat_capacity_ratio = self.get_heat_capacity_ratio()
+            if self.cc_hot_gas_heat_capacity_ratio is None:
+                self.cc_hot_gas_heat_capacity_ratio = self.get_heat_capacity_ratio()
             self.pressure_ratio = get_pressure_ratio_fsolve(self.expansion_ratio,
                                                             self.cc_hot_gas_heat_capacity_ratio)
 
@@ -180,43 +298,37 @@ class EngineCycle:
                 raise ValueError("Heat capacity ratio not available for expansion ratio calculation")
 
             self.expansion_ratio = get_expansion_ratio_from_p_ratio(self.pressure_ratio,
-                                                                    self.cc_hot_gas_heat_capacity_ratio)                                                 self.cc_hot_gas_heat_capacity_ratio)
+                                                                    self.cc_hot_gas_heat_capacity_ratio)
+
+    # (attribute, estimate) pairs for missing input values, estimates are called with the cycle. Order is important
+    _initial_value_estimates = (
+        ('specific_impulse_quality_factor',
+         lambda cycle: get_specific_impulse_quality_factor(propellant_mix=cycle.propellant_mix)),
+        ('fuel_initial_temperature',
+         lambda cycle: get_initial_propellant_temperature(propellant_name=cycle.fuel_name)),
+        ('oxidizer_initial_temperature',
+         lambda cycle: get_initial_propellant_temperature(propellant_name=cycle.oxidizer_name)),
+        ('chamber_characteristic_length',
+         lambda cycle: get_characteristic_length(propellant_mix=cycle.propellant_mix)),
+        ('area_ratio_chamber_throat',
+         lambda cycle: get_chamber_throat_area_ratio_estimate(throat_area=cycle.throat_area)),
+        ('cc_hot_gas_prandtl_number',
+         lambda cycle: get_prandtl_number_estimate(heat_capacity_ratio=cycle.cc_hot_gas_heat_capacity_ratio)),
+        ('recovery_factor',
+         lambda cycle: get_turbulent_recovery_factor(prandtl_number=cycle.cc_hot_gas_prandtl_number)),
+        ('cooling_section_pressure_drop',
+         lambda cycle: cycle.combustion_chamber_pressure * cycle.cooling_pressure_drop_factor),
+        ('injector_pressure_drop',
+         lambda cycle: cycle.combustion_chamber_pressure * cycle.injector_pressure_drop_factor),
+    )
 
     def set_initial_values(self):
         """Set missing input values."""
-        # Order is important
-        if self.specific_impulse_quality_factor is None:
-            self.specific_impulse_quality_factor = get_specific_impulse_quality_factor(
-                propellant_mix=self.propellant_mix
-            )
-        if self.fuel_initial_temperature is None:
-            self.fuel_initial_temperature = get_initial_propellant_temperature(
-                propellant_name=self.fuel_name
-            )
-        if self.oxidizer_initial_temperature is None:
-            self.oxidizer_initial_temperature = get_initial_propellant_temperature(
-                propellant_name=self.oxidizer_name
-            )
-        if self.chamber_characteristic_length is None:
-            self.chamber_characteristic_length = get_characteristic_length(
-                propellant_mix=self.propellant_mix
-            )
-        if self.area_ratio_chamber_throat is None:
-            self.area_ratio_chamber_throat = get_chamber_throat_area_ratio_estimate(
-                throat_area=self.throat_area
-            )
-        if self.cc_hot_gas_prandtl_number is None:
-            self.cc_hot_gas_prandtl_number = get_prandtl_number_estimate(
-                heat_capacity_ratio=self.cc_hot_gas_heat_capacity_ratio
-            )
-        if self.recovery_factor is None:
-            self.recovery_factor = get_turbulent_recovery_factor(
-                prandtl_number=self.cc_hot_gas_prandtl_number
-            )
-        if self.cooling_section_pressure_drop is None:
-            self.cooling_section_pressure_drop = self.combustion_chamber_pressure * self.cooling_pressure_drop_factor
-        if self.injector_pressure_drop is None:
-            self.injector_pressure_drop = self.combustion_chamber_pressure * self.injector_pressure_drop_factor
+        instance_dict = self.__dict__
+        for attribute, estimate in self._initial_value_estimates:
+            if instance_dict[attribute] is None:
+                instance_dict[attribute] = estimate(self)
+        self.clear_iteration_cache()
 
     def set_heat_transfer(self):
         heat_transfer = self.heat_transfer_section
@@ -226,6 +338,40 @@ class EngineCycle:
     def iterate_flow(self):
         raise NotImplementedError
 
+    @staticmethod
+    def _damped_update(old: float, new: float, frac: float = .5) -> float:
+        """Under-relaxed fixed-point update for iterate_flow. Steps are limited to a change of frac in ln(x) per
+        iteration, Λ = min(1, frac / |Δ ln x|), such that large jumps cannot overshoot and oscillate, while small
+        corrections close to convergence are applied in full. Subclasses should use this instead of assigning the new
+        estimate directly."""
+        if old <= 0 or new <= 0:
+            return new
+        delta_log = abs(log(new / old))
+        step_factor = 1 if delta_log <= frac else frac / delta_log
+        return old + step_factor * (new - old)
+
+    @staticmethod
+    def _adapt_relaxation_factor(relaxation_factor: float, step: float, previous_step: Optional[float],
+                                 minimum: float = .05) -> float:
+        """Halve the relaxation factor of a fixed-point update, down to minimum, when its steps change sign
+        (oscillation) and double it, up to 1, when they do not (monotone progress). The minimum keeps an oscillating
+        iteration from shrinking its steps until it stalls."""
+        if previous_step is None or step == 0 or previous_step == 0:
+            return relaxation_factor
+        if (step > 0) != (previous_step > 0):
+            return max(relaxation_factor / 2, minimum)
+        return min(1., relaxation_factor * 2)
+
+    @staticmethod
+    def _aitken_extrapolation(x0: float, x1: float, x2: float) -> float:
+        """Aitken delta-squared estimate of the limit of three successive fixed-point iterates, which turns linear
+        convergence rate ρ into ρ². Falls back to the last iterate if the estimate is undefined or not positive."""
+        denominator = x2 - 2 * x1 + x0
+        if denominator == 0:
+            return x2
+        x_acc = x2 - (x2 - x1) ** 2 / denominator
+        return x_acc if 0 < x_acc < float('inf') else x2
+
     @property
     def verbose_iteration_name(self):
         raise NotImplementedError
@@ -242,64 +388,55 @@ class EngineCycle:
         if self.verbose:
             print(f'Start {self.verbose_iteration_name} Iteration')
 
-    def print_verbose_iteration_message(self):
+    def print_verbose_iteration_message(self, actual: Optional[float] = None, required: Optional[float] = None):
+        """Print iteration progress, actual and required can be passed if already evaluated by the iteration."""
         if self.verbose:
-            print(f'Actual:   {self.verbose_iteration_actual:.5f} kg/s\t'
-                  f'Required: {self.verbose_iteration_required:.5f} kg/s')
+            actual = self.verbose_iteration_actual if actual is None else actual
+            required = self.verbose_iteration_required if required is None else required
+            print(f'Actual:   {actual:.5f} kg/s\t'
+                  f'Required: {required:.5f} kg/s')
 
     def print_verbose_end_iteration_message(self):
         if self.verbose:
             print(f'{self.verbose_iteration_name} Set\n')
 
-    @cached_property
+    @fast_cached_property
     def propellant_mix(self):
         return get_propellant_mixture(fuel_name=self.fuel_name, oxidizer_name=self.oxidizer_name)
 
-    @cached_property
-    def cea_dict(self):
-        return {'characteristic_velocity': 'c_star',
-                'ideal_thrust_coefficient': 'C_F',
-                'combustion_temperature': 'T_C',
-                'cc_hot_gas_molar_mass': 'mm_cc',
-                'cc_hot_gas_heat_capacity_ratio': 'y_cc',
-                'cc_hot_gas_dynamic_viscosity': 'mu_cc',
-                'cc_hot_gas_prandtl_number': 'pr_cc',
-                'cc_hot_gas_specific_heat_capacity': 'cp_cc'}
-
     @property
-    def cea_kwargs(self):
+    def cea_args(self):
         # CEA values always calculated from pressure ratio
         # TODO: Give option to calculate CEA values with given expansion ratio (eps)
-        return {'Pc': self.combustion_chamber_pressure,
-                'MR': self.mass_mixture_ratio,
-                'eps': None,
-                'PcOvPe': self.pressure_ratio,
-                'fuelName': self.fuel_name,
-                'oxName': self.oxidizer_name,
-                'frozen': self._cea_frozen,
-                'frozenAtThroat': self._cea_frozenAtThroat}
+        return CEAArgs(Pc=self.combustion_chamber_pressure,
+                       MR=self.mass_mixture_ratio,
+                       eps=None,
+                       PcOvPe=self.pressure_ratio,
+                       fuelName=self.fuel_name,
+                       oxName=self.oxidizer_name,
+                       frozen=self._cea_frozen,
+                       frozenAtThroat=self._cea_frozenAtThroat)
 
     def set_cea(self):
         # Checking if value is given, if not: assign value found by CEA. Despite this check for each attribute, it is
         # recommended to either provide none of the CEA properties or all of them
-        cea_attributes = self.cea_dict.keys()
-        cea_values = get_cea_dict(**self.cea_kwargs)
-        for attribute in cea_attributes:
-            cea_name = self.cea_dict[attribute]
-            if getattr(self, attribute) is None:
-                setattr(self, attribute, cea_values[cea_name])
+        instance_dict = self.__dict__
+        cea_values = get_cea_dict_cached(self.cea_args)
+        instance_dict.update({attribute: cea_values[cea_name] for attribute, cea_name in _CEA_FIELD_MAP
+                              if instance_dict.get(attribute) is None})
+        self.clear_iteration_cache()
 
     def update_cea(self):
-        cea_values = self.get_cea()
-        for attribute in self.cea_dict.keys():
-            cea_name = self.cea_dict[attribute]
-            setattr(self, attribute, cea_values[cea_name])
+        cea_values = get_cea_dict_cached(self.cea_args)
+        self.__dict__.update({attribute: cea_values[cea_name] for attribute, cea_name in _CEA_FIELD_MAP})
+        self.clear_iteration_cache()
 
     def get_heat_capacity_ratio(self)-> float:
         # Get the heat_capacity_ratio only, to be able to estimate a pressure ratio, which is required for setting all
         # other CEA values
-        kwargs = {key: value for key, value in self.cea_kwargs.items() if key not in ('eps', 'PcOvPe')}
-        return get_cea_chamber_dict(**kwargs)['y_cc']
+        args = self.cea_args
+        return get_cea_chamber_dict_cached(args.Pc, args.MR, args.fuelName, args.oxName, args.frozen,
+                                           args.frozenAtThroat)['y_cc']
 
     def set_pump_outlet_pressures(self):
         Merger._warn_pressure = False
@@ -307,8 +444,16 @@ class EngineCycle:
         Merger._warn_pressure = True
 
     def calc_pump_outlet_pressures(self):
-        self._fuel_pump_outlet_pressure = self.fuel_pump_expected_pressure if self.fuel_pump_outlet_pressure_forced is None else self.fuel_pump_outlet_pressure_forced
-        self._oxidizer_pump_outlet_pressure = self.oxidizer_pump_expected_pressure if self.oxidizer_pump_outlet_pressure_forced is None else self.oxidizer_pump_outlet_pressure_forced
+        # Resolve both pressures before assigning either: setting an attribute clears the cached injector and cooling
+        # channel section, which would otherwise be rebuilt for the second expected pressure
+        fuel_pressure = self.fuel_pump_outlet_pressure_forced
+        if fuel_pressure is None:
+            fuel_pressure = self.fuel_pump_expected_pressure
+        oxidizer_pressure = self.oxidizer_pump_outlet_pressure_forced
+        if oxidizer_pressure is None:
+            oxidizer_pressure = self.oxidizer_pump_expected_pressure
+        self._fuel_pump_outlet_pressure = fuel_pressure
+        self._oxidizer_pump_outlet_pressure = oxidizer_pressure
 
     @property
     def fuel_pump_expected_pressure(self):
@@ -321,7 +466,7 @@ class EngineCycle:
         return (self.combustion_chamber_pressure
                 - self.injector.pressure_change)
 
-    @property
+    @fast_cached_property
     def thrust_coefficient(self):
         return get_thrust_coefficient_from_ideal(ideal_thrust_coefficient=self.ideal_thrust_coefficient,
                                                  chamber_pressure=self.combustion_chamber_pressure,
@@ -329,23 +474,23 @@ class EngineCycle:
                                                  expansion_ratio=self.expansion_ratio,
                                                  ambient_pressure=self.ambient_pressure, )
 
-    @cached_property
+    @fast_cached_property
     def chamber_equivalent_velocity(self):
         return self.thrust_coefficient * self.characteristic_velocity
 
-    @cached_property
+    @fast_cached_property
     def chamber_specific_impulse(self):
-        return self.specific_impulse_quality_factor * self.chamber_equivalent_velocity / constants.g
+        return self.specific_impulse_quality_factor * self.chamber_equivalent_velocity / _G0
 
     @property
     def base_mass_flow(self):
-        return self.thrust / (self.chamber_specific_impulse * constants.g)
+        return self.thrust / (self.chamber_specific_impulse * _G0)
 
-    @property
+    @fast_cached_property
     def chamber_mass_flow(self):
-        return self.chamber_thrust / (self.chamber_specific_impulse * constants.g)
+        return self.chamber_thrust / (self.chamber_specific_impulse * _G0)
 
-    @property
+    @fast_cached_property
     def throat_area(self):
         return get_throat_area(molar_mass=self.cc_hot_gas_molar_mass,
                                heat_capacity_ratio=self.cc_hot_gas_heat_capacity_ratio,
@@ -353,19 +498,19 @@ class EngineCycle:
                                mass_flow=self.chamber_mass_flow,
                                chamber_pressure=self.combustion_chamber_pressure)
 
-    @property
+    @fast_cached_property
     def exit_area(self):
         return self.throat_area * self.expansion_ratio
 
-    @property
+    @fast_cached_property
     def exit_pressure(self):
         return self.combustion_chamber_pressure / self.pressure_ratio
 
-    @property
+    @fast_cached_property
     def chamber_fuel_flow(self):
         return self.chamber_mass_flow / (self.mass_mixture_ratio + 1)
 
-    @property
+    @fast_cached_property
     def chamber_oxidizer_flow(self):
         return (self.mass_mixture_ratio * self.chamber_mass_flow) / (self.mass_mixture_ratio + 1)
 
@@ -377,7 +522,7 @@ class EngineCycle:
     def main_oxidizer_flow(self):  # Default to chamber flow, overriden in child classes/cycles
         return self.chamber_oxidizer_flow
 
-    @property
+    @fast_cached_property
     def total_mass_flow(self):
         return self.main_oxidizer_flow + self.main_fuel_flow
 
@@ -397,35 +542,31 @@ class EngineCycle:
         else:
             return self.combustion_chamber_pressure * self._fuel_pump_pressure_factor_first_guess
 
-    @property
+    @fast_cached_property
     def oxidizer_main_flow_state(self):
-        return FlowState(propellant_name=self.oxidizer_name,
-                         temperature=self.oxidizer_initial_temperature,
-                         pressure=self.oxidizer_initial_pressure,
-                         mass_flow=self.main_oxidizer_flow,
-                         type='oxidizer', )
+        # Positional: propellant_name, temperature, pressure, mass_flow, type
+        return FlowState(self.oxidizer_name, self.oxidizer_initial_temperature, self.oxidizer_initial_pressure,
+                         self.main_oxidizer_flow, 'oxidizer')
 
-    @property
+    @fast_cached_property
     def fuel_main_flow_state(self):
-        return FlowState(propellant_name=self.fuel_name,
-                         temperature=self.fuel_initial_temperature,
-                         pressure=self.fuel_initial_pressure,
-                         mass_flow=self.main_fuel_flow,
-                         type='fuel', )
+        # Positional: propellant_name, temperature, pressure, mass_flow, type
+        return FlowState(self.fuel_name, self.fuel_initial_temperature, self.fuel_initial_pressure,
+                         self.main_fuel_flow, 'fuel')
 
-    @property
+    @fast_cached_property
     def oxidizer(self):
         return Propellant(main_flow_state=self.oxidizer_main_flow_state,
                           burn_time=self.burn_time,
                           margin_factor=self.propellant_margin_factor)
 
-    @property
+    @fast_cached_property
     def fuel(self):
         return Propellant(main_flow_state=self.fuel_main_flow_state,
                           burn_time=self.burn_time,
                           margin_factor=self.propellant_margin_factor)
 
-    @property
+    @fast_cached_property
     def pressurant_initial_state(self):
         return FlowState(propellant_name=self.pressurant_name,
                          temperature=self.pressurant_initial_temperature,
@@ -433,7 +574,7 @@ class EngineCycle:
                          mass_flow=None,
                          type='pressurant')
 
-    @property
+    @fast_cached_property
     def pressurant(self):
         return Pressurant(oxidizer_volume=self.oxidizer.volume,
                           fuel_volume=self.fuel.volume,
@@ -444,13 +585,13 @@ class EngineCycle:
                           final_pressure=self.pressurant_final_pressure,
                           propellant_tanks_ullage_factor=self.ullage_volume_factor)
 
-    @property
+    @fast_cached_property
     def pressurant_tank(self):
         return PressurantTank(structure_material=self.pressurant_tank_material,
                               safety_factor=self.pressurant_tank_safety_factor,
                               pressurant=self.pressurant)
 
-    @property
+    @fast_cached_property
     def oxidizer_tank(self):
         return Tank(inlet_flow_state=self.oxidizer_main_flow_state,
                     propellant_volume=self.oxidizer.volume,
@@ -460,7 +601,7 @@ class EngineCycle:
                     structure_material=self.oxidizer_tank_material,
                     safety_factor=self.tanks_structural_factor, )
 
-    @property
+    @fast_cached_property
     def fuel_tank(self):
         return Tank(inlet_flow_state=self.fuel_main_flow_state,
                     propellant_volume=self.fuel.volume,
@@ -470,14 +611,14 @@ class EngineCycle:
                     structure_material=self.fuel_tank_material,
                     safety_factor=self.tanks_structural_factor)
 
-    @property
+    @fast_cached_property
     def oxidizer_pump(self):
         return Pump(inlet_flow_state=self.oxidizer_tank.outlet_flow_state,
                     expected_outlet_pressure=self.oxidizer_pump_outlet_pressure,
                     efficiency=self.oxidizer_pump_efficiency,
                     specific_power=self.oxidizer_pump_specific_power, )
 
-    @property
+    @fast_cached_property
     def fuel_pump(self):
         return Pump(inlet_flow_state=self.fuel_tank.outlet_flow_state,
                     expected_outlet_pressure=self.fuel_pump_outlet_pressure,
@@ -488,7 +629,7 @@ class EngineCycle:
     def injector_inlet_flow_states(self):
         return self.cooling_channel_section.outlet_flow_state, self.oxidizer_pump.outlet_flow_state
 
-    @property
+    @fast_cached_property
     def injector(self):
         return Injector(inlet_flow_states=self.injector_inlet_flow_states,
                         combustion_chamber_pressure=self.combustion_chamber_pressure,
@@ -497,7 +638,7 @@ class EngineCycle:
                         safety_factor=self.injector_safety_factor,
                         pressure_drop=self.injector_pressure_drop, )
 
-    @cached_property
+    @fast_cached_property
     def nozzle(self):
         return Nozzle(throat_area=self.throat_area,
                       expansion_ratio=self.expansion_ratio,
@@ -510,7 +651,7 @@ class EngineCycle:
                       chamber_pressure=self.combustion_chamber_pressure,
                       safety_factor=self.nozzle_safety_factor, )
 
-    @cached_property
+    @fast_cached_property
     def combustion_chamber(self):
         return CombustionChamber(throat_area=self.throat_area,
                                  combustion_chamber_pressure=self.combustion_chamber_pressure,
@@ -520,33 +661,36 @@ class EngineCycle:
                                  safety_factor=self.combustion_chamber_safety_factor,
                                  structure_material=self.combustion_chamber_material, )
 
-    @cached_property
+    @fast_cached_property
     def thrust_chamber(self):
         return ThrustChamber(nozzle=self.nozzle,
                              chamber=self.combustion_chamber,
                              heat_capacity_ratio=self.cc_hot_gas_heat_capacity_ratio)
 
-    @property
-    def max_distance_from_throat_heat_transfer_section(self):
+    @fast_cached_property
+    def _cooling_end(self) -> tuple[float, float | None]:
+        """Distance from throat and expansion ratio at which the cooled section ends, resolved once."""
         if self.expansion_ratio_end_cooling:
             if self.verbose and self.distance_from_throat_end_cooling:
                 warnings.warn(
                     'Expansion_ratio_end_cooling is given, distance_from_throat_end_cooling is ignored, but also provided')
-            return self.thrust_chamber.get_distance_for_divergent_expansion_ratio(self.expansion_ratio_end_cooling)
+            return (self.thrust_chamber.get_distance_for_divergent_expansion_ratio(self.expansion_ratio_end_cooling),
+                    self.expansion_ratio_end_cooling)
         else:
             if self.distance_from_throat_end_cooling is None:
                 if self.expansion_ratio > 20:
                     warnings.warn('No end of cooling provided, limited to expansion ratio of 20')
-                    self._expansion_ratio_end_cooling = 20
-                    return self.thrust_chamber.get_distance_for_divergent_expansion_ratio(20)
+                    return self.thrust_chamber.get_distance_for_divergent_expansion_ratio(20), 20
                 else:
                     warnings.warn('No end of cooling provided, assumed to be end of nozzle')
-                    self._expansion_ratio_end_cooling = self.expansion_ratio
-                    return self.thrust_chamber.max_distance_from_throat
+                    return self.thrust_chamber.max_distance_from_throat, self.expansion_ratio
             else:
                 r_end = self.thrust_chamber.get_radius(self.distance_from_throat_end_cooling)
-                self._expansion_ratio_end_cooling = r_end ** 2 * constants.pi / self.throat_area
-                return self.distance_from_throat_end_cooling
+                return self.distance_from_throat_end_cooling, r_end * r_end * _PI / self.throat_area
+
+    @property
+    def max_distance_from_throat_heat_transfer_section(self):
+        return self._cooling_end[0]
 
     @property
     def min_distance_from_throat_heat_transfer_section(self):
@@ -574,11 +718,11 @@ class EngineCycle:
                 'recovery_factor': self.recovery_factor,
                 'verbose': self.verbose, }
 
-    @cached_property
+    @fast_cached_property
     def theoretical_convective_heat_transfer(self):
         return ConvectiveHeatTransfer(**self.convective_heat_transfer_args)
 
-    @cached_property
+    @fast_cached_property
     def radiative_heat_transfer(self):
         return RadiativeHeatTransfer(
             thrust_chamber=self.thrust_chamber,
@@ -589,7 +733,7 @@ class EngineCycle:
             theoretical_total_convective_heat_transfer=self.theoretical_convective_heat_transfer.total_convective_heat_transfer,
         )
 
-    @cached_property
+    @fast_cached_property
     def heat_transfer_section(self):
         return HeatTransferSection(**self.convective_heat_transfer_args,
                                    max_distance_section=self.max_distance_from_throat_heat_transfer_section,
@@ -602,11 +746,11 @@ class EngineCycle:
 
     def calc_minimum_required_coolant_mass_flow(self):
         """Determine minimum coolant flow required to keep outlet temp below maximum."""
+        from CoolProp.CoolProp import PT_INPUTS
         ccs_flow_state = self.cooling_inlet_flow_state
-        h_max = CoolProp.PropsSI('H',
-                                 'T', self.maximum_coolant_outlet_temperature,
-                                 'P', ccs_flow_state.pressure,
-                                 ccs_flow_state.coolprop_name)
+        coolant_state = _get_abstract_state('HEOS', ccs_flow_state.coolprop_name)
+        coolant_state.update(PT_INPUTS, ccs_flow_state.pressure, self.maximum_coolant_outlet_temperature)
+        h_max = coolant_state.hmass()
         h_in = ccs_flow_state.mass_specific_enthalpy
         delta_h_max = h_max - h_in
         q_tot = self.heat_flow_rate
@@ -620,7 +764,7 @@ class EngineCycle:
     def cooling_inlet_flow_state(self):
         return self.fuel_pump.outlet_flow_state
 
-    @property
+    @fast_cached_property
     def cooling_channel_section(self):
         return CoolingChannelSection(inlet_flow_state=self.cooling_inlet_flow_state,
                                      heat_flow_rate=self.heat_flow_rate,
@@ -630,10 +774,7 @@ class EngineCycle:
 
     @property
     def expansion_ratio_end(self):
-        if self.expansion_ratio_end_cooling:
-            return self.expansion_ratio_end_cooling
-        else:
-            return self._expansion_ratio_end_cooling
+        return self._cooling_end[1]
 
     @property
     def fuel_pumps_power_required(self):
@@ -651,47 +792,47 @@ class EngineCycle:
     def pumps_power_required(self):
         return self.fuel_pumps_power_required + self.oxidizer_pumps_power_required
 
-    @property
+    @fast_cached_property
     def pumps_mass(self):
         return self.fuel_pump.mass + self.oxidizer_pump.mass
 
-    @property
+    @fast_cached_property
     def tanks_mass(self):
         return self.fuel_tank.mass + self.oxidizer_tank.mass + self.pressurant_tank.mass
 
-    @property
+    @fast_cached_property
     def props_mass(self):
         return self.oxidizer.mass + self.fuel.mass
 
-    @property
+    @fast_cached_property
     def mass_kwak(self):
         return self.props_mass + self.tanks_mass + self.pumps_mass + self.pressurant.mass
 
-    @property
+    @fast_cached_property
     def mass_ratio_kwak(self):
         return 1 / self.inverse_mass_ratio_kwak
 
-    @property
+    @fast_cached_property
     def inverse_mass_ratio_kwak(self):
         return 1 - self.props_mass / self.mass_kwak
 
-    @property
+    @fast_cached_property
     def ideal_delta_v_kwak(self):
-        return self.overall_specific_impulse * log(self.mass_ratio_kwak) * constants.g
+        return self.effective_exhaust_velocity * log(self.mass_ratio_kwak)
 
-    @property
+    @fast_cached_property
     def total_thrust_chamber_mass(self):
         return self.thrust_chamber.mass + self.injector.mass + self.cooling_channel_section.mass
 
-    @property
+    @fast_cached_property
     def chamber_propellant_mass(self):
         return self.chamber_mass_flow * self.burn_time * self.propellant_margin_factor
 
-    @property
+    @fast_cached_property
     def feed_system_mass(self):
         return self.pumps_mass
 
-    @property
+    @fast_cached_property
     def cc_prop_group_mass(self):
         return self.chamber_propellant_mass + self.tanks_mass + self.pressurant.mass
 
@@ -735,47 +876,47 @@ class EngineCycle:
     def feed_system_ratio(self):
         return self.feed_system_mass / self.burn_time
 
-    @property
+    @fast_cached_property
     def tanks_plus_pressurant(self):
         return self.tanks_mass + self.pressurant.mass
 
-    @property
+    @fast_cached_property
     def engine_dry_mass(self):
         return self.feed_system_mass + self.total_thrust_chamber_mass
 
-    @property
+    @fast_cached_property
     def dry_mass(self):
         return self.engine_dry_mass + self.tanks_mass
 
-    @property
+    @fast_cached_property
     def initial_mass(self):
         return self.final_mass + self.props_mass
 
-    @property
+    @fast_cached_property
     def final_mass(self):
         return self.dry_mass + self.pressurant.mass
 
-    @property
+    @fast_cached_property
     def inverse_mass_ratio(self):
         return self.final_mass / self.initial_mass
 
-    @property
+    @fast_cached_property
     def mass_ratio(self):
         return self.initial_mass / self.final_mass
 
     def get_payload(self, delta_v: float) -> float:
-        e_dv = exp(delta_v / (self.overall_specific_impulse * constants.g))
+        e_dv = exp(delta_v / self.effective_exhaust_velocity)
         m0 = self.initial_mass
         mf = self.final_mass
         return (m0 - mf * e_dv) / (e_dv - 1)
 
-    @property
+    @fast_cached_property
     def perct(self):
         return (self.total_thrust_chamber_mass + self.feed_system_mass) / self.initial_mass
 
-    @property
+    @fast_cached_property
     def ideal_delta_v(self):
-        return self.overall_specific_impulse * log(1 / self.inverse_mass_ratio) * constants.g
+        return -self.effective_exhaust_velocity * log(self.inverse_mass_ratio)
 
     @property
     def change_in_velocity(self):
@@ -787,42 +928,46 @@ class EngineCycle:
 
     def get_payload_delta_v(self, payload_mass):
         mass_ratio = (self.final_mass + payload_mass) / (self.initial_mass + payload_mass)
-        return self.overall_specific_impulse * log(1 / mass_ratio) * constants.g
+        return -self.effective_exhaust_velocity * log(mass_ratio)
 
     @property
     def gravity_delta_v(self, vertical_fraction: float = 0.2):
-        return self.ideal_delta_v - constants.g * self.burn_time * vertical_fraction
+        return self.ideal_delta_v - _G0 * self.burn_time * vertical_fraction
 
-    @property
+    @fast_cached_property
     def overall_specific_impulse(self):
-        return self.thrust / self.total_mass_flow / constants.g
+        return self.thrust / self.total_mass_flow / _G0
+
+    @fast_cached_property
+    def effective_exhaust_velocity(self):
+        """Overall specific impulse expressed as velocity [m/s], used by the delta v and payload relations"""
+        return self.overall_specific_impulse * _G0
 
-    @cached_property
+    @fast_cached_property
     def vacuum_thrust_coefficient(self):
         return self.ideal_thrust_coefficient + self.exit_pressure / self.combustion_chamber_pressure * self.expansion_ratio
 
-    @cached_property
+    @fast_cached_property
     def sea_level_thrust_coefficient(self):
-        sea_level_pressure = 101325
-        return self.vacuum_thrust_coefficient - sea_level_pressure / self.combustion_chamber_pressure * self.expansion_ratio
+        return self.vacuum_thrust_coefficient - _P_SEA / self.combustion_chamber_pressure * self.expansion_ratio
 
-    @cached_property
+    @fast_cached_property
     def chamber_ideal_specific_impulse(self):
-        return self.ideal_thrust_coefficient * self.characteristic_velocity / constants.g
+        return self.ideal_thrust_coefficient * self.characteristic_velocity / _G0
 
-    @cached_property
+    @fast_cached_property
     def chamber_vacuum_specific_impulse(self):
-        return self.vacuum_thrust_coefficient * self.characteristic_velocity / constants.g
+        return self.vacuum_thrust_coefficient * self.characteristic_velocity / _G0
 
-    @cached_property
+    @fast_cached_property
     def chamber_sea_level_specific_impulse(self):
-        return self.sea_level_thrust_coefficient * self.characteristic_velocity / constants.g
+        return self.sea_level_thrust_coefficient * self.characteristic_velocity / _G0
 
     @property
     def payload_delta_v(self):
         payload = 10  # [kg]
-        return self.overall_specific_impulse * log(
-            self.mass + payload / (self.mass - self.props_mass + payload)) * constants.g
+        return self.effective_exhaust_velocity * log(
+            self.mass + payload / (self.mass - self.props_mass + payload))
 
     def adjusted_mass_ratio(self, payload=0, factor_0=1.1459, factor_f=1.9188, ):
         m_0_adj = self.initial_mass * factor_0 + payload
@@ -862,7 +1007,7 @@ class EngineCycle:
             'Cooling Channel Section',
         ]
 
-    @property
+    @fast_cached_property
     def aggregate_masses(self):
         return {
             'Initial': self.initial_mass,
@@ -879,25 +1024,27 @@ class EngineCycle:
 
         }
 
-    @property
+    @fast_cached_property
     def components_masses(self):
-        return {
-            name: getattr(self, format_fancy_name(name)).mass
-            for name in self.components_list
-        }
+        component_attributes = _COMPONENT_ATTRIBUTES.get(type(self))
+        if component_attributes is None:
+            component_attributes = _COMPONENT_ATTRIBUTES[type(self)] = tuple(
+                (name, format_fancy_name(name)) for name in self.components_list)
+        return {name: getattr(self, attribute).mass for name, attribute in component_attributes}
 
-    @property
+    @fast_cached_property
     def combined_info(self):
-        return self.components_masses | self.aggregate_masses | {
+        return {
+            **self.components_masses,
+            **self.aggregate_masses,
             'Specific Impulse [s]': self.overall_specific_impulse,
             'Mass Ratio [-]': self.mass_ratio,
             'Velocity Change [m/s]': self.change_in_velocity,
         }
 
     def print_masses(self, decimals: int = 2):
-        print('\nComponent Masses [kg]:')
-        for key, value in self.components_masses.items():
-            print(f'{key:<25}: {value:>10.{decimals}f}')
-        print('\nAggregation Masses [kg]:')
-        for key, value in self.aggregate_masses.items():
-            print(f'{key:<25}: {value:>10.{decimals}f}')
+        lines = ['\nComponent Masses [kg]:']
+        lines += [f'{key:<25}: {value:>10.{decimals}f}' for key, value in self.components_masses.items()]
+        lines.append('\nAggregation Masses [kg]:')
+        lines += [f'{key:<25}: {value:>10.{decimals}f}' for key, value in self.aggregate_masses.items()]
+        sys.stdout.write('\n'.join(lines) + '\n')
@@ -5,7 +5,30 @@ from EngineComponents.Other.SecondaryExhaust import SecondaryExhaust
 from EngineComponents.Base.Splitter import Splitter
 from dataclasses import dataclass, field
 from typing import Optional
-from functools import cached_property
+from EngineFunctions.BaseFunctions import fast_cached_property
+import warnings
+from math import isclose
+
+
+# Turbine side components rebuilt from the iteration state, cached per iteration step like the EngineCycle components
+_OPEN_CYCLE_CACHED_PROPERTIES = (
+    'turbine', 'secondary_exhaust', 'turbine_splitter', 'fuel_turbine', 'fuel_secondary_exhaust', 'oxidizer_turbine',
+    'oxidizer_secondary_exhaust', 'post_cooling_splitter',
+    # Feed system components of the GasGenerator and OpenExpander mixins
+    'post_oxidizer_pump_splitter', 'post_fuel_pump_splitter', 'gas_generator', 'pre_cooling_splitter',
+    'pre_injection_merger', 'secondary_fuel_pump',
+    # Combined requirement of both turbines
+    'turbine_mass_flow_required',
+)
+# Turbine flow iteration state and set-up values of the open cycles, see EngineCycle._iteration_state_attributes
+_OPEN_CYCLE_ITERATION_STATE_ATTRIBUTES = frozenset((
+    '_iterative_turbine_mass_flow', '_iterative_fuel_turbine_mass_flow', '_iterative_oxidizer_turbine_mass_flow',
+    '_exhaust_thrust_contribution', 'fuel_pump_specific_power', 'oxidizer_pump_specific_power',
+    'secondary_specific_impulse_quality_factor',
+))
+
+# Maximum number of fixed-point updates of the turbine flows, after which the iteration is stopped with a warning
+_MAX_FIXED_POINT_ITERATIONS = 100
 
 
 # Abstract class that has the attributes GasGenerator and OpenExpander share, the turbine_mass_flow property needs to be
@@ -23,6 +46,7 @@ class OpenEngineCycle(EngineCycle):
     exhaust_exit_pressure: Optional[float] = None  # [Pa]
     turbine_pressure_ratio: Optional[float] = None  # [-]
     turbine_outlet_pressure_forced: Optional[float] = None  # [Pa]
+    relaxation_factor: float = .7  # [-] Initial relaxation of the fixed-point update, adapted during iteration
 
     # Iteration attribute, not required at init
     _iterative_turbine_mass_flow: float = field(init=False, repr=False, default=1e-20)  # [kg/s]
@@ -32,15 +56,33 @@ class OpenEngineCycle(EngineCycle):
     fuel_pump_specific_power: float = field(init=False, repr=False, default=None)
     oxidizer_pump_specific_power: float = field(init=False, repr=False, default=None)
 
+    _iteration_cached_properties = EngineCycle._iteration_cached_properties + _OPEN_CYCLE_CACHED_PROPERTIES
+    _iteration_state_attributes = EngineCycle._iteration_state_attributes | _OPEN_CYCLE_ITERATION_STATE_ATTRIBUTES
+
     def __post_init__(self):
         super().__post_init__()
 
     def iterate_flow(self):
         self._iterative_turbine_mass_flow = self.turbine_mass_flow_initial_guess
-        while self.turbine_flow_error_larger_than_accuracy():
-            self.print_verbose_iteration_message()
-            self._iterative_turbine_mass_flow = self.turbine.mass_flow_required
+        # The required turbine mass flow is evaluated once per iteration, for both the convergence check and the
+        # relaxed update
+        iteration_accuracy = self.iteration_accuracy
+        relaxation_factor = self.relaxation_factor
+        previous_step = None
+        for _ in range(_MAX_FIXED_POINT_ITERATIONS):
+            mass_flow_required = self.turbine.mass_flow_required
+            if isclose(self.turbine_mass_flow, mass_flow_required, rel_tol=iteration_accuracy):
+                break
+            old_mass_flow = self._iterative_turbine_mass_flow
+            self.print_verbose_iteration_message(actual=old_mass_flow, required=mass_flow_required)
+            step = mass_flow_required - old_mass_flow
+            relaxation_factor = self._adapt_relaxation_factor(relaxation_factor, step, previous_step)
+            previous_step = step
+            self._iterative_turbine_mass_flow = self._damped_update(old_mass_flow,
+                                                                    old_mass_flow + relaxation_factor * step)
             self._exhaust_thrust_contribution = self.secondary_exhaust.thrust / self.thrust
+        else:
+            warnings.warn(f'Turbine mass flow did not converge within [{_MAX_FIXED_POINT_ITERATIONS}] iterations')
 
     @property
     def verbose_iteration_name(self):
@@ -54,7 +96,7 @@ class OpenEngineCycle(EngineCycle):
     def verbose_iteration_required(self):
         return self.turbine.mass_flow_required
 
-    @cached_property
+    @fast_cached_property
     def turbine_mass_flow_initial_guess(self):
         return 0.0
 
@@ -66,9 +108,7 @@ class OpenEngineCycle(EngineCycle):
             self.secondary_specific_impulse_quality_factor = self.specific_impulse_quality_factor
 
     def turbine_flow_error_larger_than_accuracy(self):
-        error = abs(self.turbine.mass_flow_required - self.turbine_mass_flow)
-        margin = self.turbine.mass_flow_required * self.iteration_accuracy
-        return error > margin
+        return not isclose(self.turbine_mass_flow, self.turbine.mass_flow_required, rel_tol=self.iteration_accuracy)
 
     @property
     def chamber_thrust(self):
@@ -82,7 +122,7 @@ class OpenEngineCycle(EngineCycle):
     def turbine_inlet_flow_state(self):
         return self.cooling_channel_section.outlet_flow_state
 
-    @property
+    @fast_cached_property
     def turbine(self):
         return Turbine(inlet_flow_state=self.turbine_inlet_flow_state,
                        power_required=self.pumps_power_required,
@@ -90,7 +130,7 @@ class OpenEngineCycle(EngineCycle):
                        pressure_ratio=self.turbine_pressure_ratio,
                        outlet_pressure_forced=self.turbine_outlet_pressure_forced, )
 
-    @property
+    @fast_cached_property
     def secondary_exhaust(self):
         return SecondaryExhaust(inlet_flow_state=self.turbine.outlet_flow_state,
                                 expansion_ratio=self.exhaust_expansion_ratio,
@@ -104,7 +144,7 @@ class OpenEngineCycle(EngineCycle):
     def secondary_specific_impulse(self):
         return self.secondary_exhaust.specific_impulse
 
-    @property
+    @fast_cached_property
     def feed_system_mass(self):
         return super().feed_system_mass + self.turbine.mass
 
@@ -116,7 +156,7 @@ class OpenEngineCycle(EngineCycle):
     def power_mass(self):
         return super().power_mass + self.turbine_propellant_mass
 
-    @property
+    @fast_cached_property
     def engine_dry_mass(self):
         return super().engine_dry_mass + self.secondary_exhaust.mass
 
@@ -135,7 +175,7 @@ class OpenEngineCycle(EngineCycle):
             'Secondary Exhaust',
         ]
 
-    @property
+    @fast_cached_property
     def aggregate_masses(self):
         return super().aggregate_masses | {
             'Turbine Propellant': self.turbine_propellant_mass
@@ -161,6 +201,7 @@ class OpenEngineCycle_DoubleTurbine(EngineCycle):
     fuel_exhaust_expansion_ratio: Optional[float] = None  # [-]
     fuel_turbine_pressure_ratio: Optional[float] = None  # [-]
     fuel_turbine_outlet_pressure_forced: Optional[float] = None  # [Pa]
+    relaxation_factor: float = .7  # [-] Initial relaxation of the fixed-point update, adapted during iteration
 
     # Iteration attribute, not required at init
     _iterative_oxidizer_turbine_mass_flow: float = field(init=False, repr=False, default=0.00001)  # [kg/s]
@@ -172,14 +213,35 @@ class OpenEngineCycle_DoubleTurbine(EngineCycle):
     fuel_pump_specific_power: float = field(init=False, repr=False, default=None)
     oxidizer_pump_specific_power: float = field(init=False, repr=False, default=None)
 
+    _iteration_cached_properties = EngineCycle._iteration_cached_properties + _OPEN_CYCLE_CACHED_PROPERTIES
+    _iteration_state_attributes = EngineCycle._iteration_state_attributes | _OPEN_CYCLE_ITERATION_STATE_ATTRIBUTES
+
     def iterate_flow(self):
         self._iterative_oxidizer_turbine_mass_flow = self.oxidizer_turbine_mass_flow_initial_guess
         self._iterative_fuel_turbine_mass_flow = self.fuel_turbine_mass_flow_initial_guess
-        while self.turbine_flow_error_larger_than_accuracy():
+        fuel_relaxation_factor = oxidizer_relaxation_factor = self.relaxation_factor
+        previous_fuel_step = previous_oxidizer_step = None
+        for _ in range(_MAX_FIXED_POINT_ITERATIONS):
+            if not self.turbine_flow_error_larger_than_accuracy():
+                break
             self.print_verbose_iteration_message()
-            self._iterative_fuel_turbine_mass_flow = self.fuel_turbine.mass_flow_required
-            self._iterative_oxidizer_turbine_mass_flow = self.oxidizer_turbine.mass_flow_required
+            old_fuel_mass_flow = self._iterative_fuel_turbine_mass_flow
+            fuel_step = self.fuel_turbine.mass_flow_required - old_fuel_mass_flow
+            fuel_relaxation_factor = self._adapt_relaxation_factor(fuel_relaxation_factor, fuel_step,
+                                                                   previous_fuel_step)
+            previous_fuel_step = fuel_step
+            self._iterative_fuel_turbine_mass_flow = self._damped_update(
+                old_fuel_mass_flow, old_fuel_mass_flow + fuel_relaxation_factor * fuel_step)
+            old_oxidizer_mass_flow = self._iterative_oxidizer_turbine_mass_flow
+            oxidizer_step = self.oxidizer_turbine.mass_flow_required - old_oxidizer_mass_flow
+            oxidizer_relaxation_factor = self._adapt_relaxation_factor(oxidizer_relaxation_factor, oxidizer_step,
+                                                                       previous_oxidizer_step)
+            previous_oxidizer_step = oxidizer_step
+            self._iterative_oxidizer_turbine_mass_flow = self._damped_update(
+                old_oxidizer_mass_flow, old_oxidizer_mass_flow + oxidizer_relaxation_factor * oxidizer_step)
             self._exhaust_thrust_contribution = self.exhaust_total_thrust / self.thrust
+        else:
+            warnings.warn(f'Turbine mass flows did not converge within [{_MAX_FIXED_POINT_ITERATIONS}] iterations')
 
     @property
     def verbose_iteration_name(self):
@@ -191,17 +253,22 @@ class OpenEngineCycle_DoubleTurbine(EngineCycle):
 
     @property
     def verbose_iteration_required(self):
+        return self.turbine_mass_flow_required
+
+    @fast_cached_property
+    def turbine_mass_flow_required(self):
+        """Total turbine mass flow required, shared by the accuracy check and the verbose message of a step."""
         return self.fuel_turbine.mass_flow_required + self.oxidizer_turbine.mass_flow_required
 
     @property
     def exhaust_total_thrust(self):
         return self.oxidizer_secondary_exhaust.thrust + self.fuel_secondary_exhaust.thrust
 
-    @cached_property
+    @fast_cached_property
     def oxidizer_turbine_mass_flow_initial_guess(self):
         return 0.0
 
-    @cached_property
+    @fast_cached_property
     def fuel_turbine_mass_flow_initial_guess(self):
         return 0.0
 
@@ -210,10 +277,7 @@ class OpenEngineCycle_DoubleTurbine(EngineCycle):
         self.fuel_pump_specific_power = self.oxidizer_pump_specific_power = self.turbopump_specific_power
 
     def turbine_flow_error_larger_than_accuracy(self):
-        required = self.oxidizer_turbine.mass_flow_required + self.fuel_turbine.mass_flow_required
-        error = abs(required - self.turbine_mass_flow)
-        margin = required * self.iteration_accuracy
-        return error > margin
+        return not isclose(self.turbine_mass_flow, self.turbine_mass_flow_required, rel_tol=self.iteration_accuracy)
 
     @property
     def chamber_thrust(self):
@@ -229,19 +293,19 @@ class OpenEngineCycle_DoubleTurbine(EngineCycle):
 
     @property
     def fuel_turbine_inlet_flow_state(self):
-        return self.turbine_splitter.outlet_flow_states['fuel_turbine']
+        return self.turbine_splitter.outlet_flow_state_fuel_turbine
 
     @property
     def oxidizer_turbine_inlet_flow_state(self):
-        return self.turbine_splitter.outlet_flow_states['oxidizer_turbine']
+        return self.turbine_splitter.outlet_flow_state_oxidizer_turbine
 
-    @property
+    @fast_cached_property
     def turbine_splitter(self):
         return Splitter(inlet_flow_state=self.turbine_inlet_flow_state,
                         required_outlet_mass_flows=(self._iterative_oxidizer_turbine_mass_flow,),
                         outlet_flow_names=('oxidizer_turbine', 'fuel_turbine'))
 
-    @property
+    @fast_cached_property
     def fuel_turbine(self):
         return Turbine(inlet_flow_state=self.fuel_turbine_inlet_flow_state,
                        power_required=self.fuel_pumps_power_required,
@@ -249,7 +313,7 @@ class OpenEngineCycle_DoubleTurbine(EngineCycle):
                        pressure_ratio=self.fuel_turbine_pressure_ratio,
                        outlet_pressure_forced=self.fuel_turbine_outlet_pressure_forced, )
 
-    @property
+    @fast_cached_property
     def fuel_secondary_exhaust(self):
         return SecondaryExhaust(
             inlet_flow_state=self.fuel_turbine.outlet_flow_state,
@@ -261,7 +325,7 @@ class OpenEngineCycle_DoubleTurbine(EngineCycle):
             safety_factor=self.exhaust_safety_factor,
         )
 
-    @property
+    @fast_cached_property
     def oxidizer_turbine(self):
         return Turbine(inlet_flow_state=self.oxidizer_turbine_inlet_flow_state,
                        power_required=self.oxidizer_pumps_power_required,
@@ -269,7 +333,7 @@ class OpenEngineCycle_DoubleTurbine(EngineCycle):
                        pressure_ratio=self.oxidizer_turbine_pressure_ratio,
                        outlet_pressure_forced=self.oxidizer_turbine_outlet_pressure_forced, )
 
-    @property
+    @fast_cached_property
     def oxidizer_secondary_exhaust(self):
         return SecondaryExhaust(
             inlet_flow_state=self.oxidizer_turbine.outlet_flow_state,
@@ -281,11 +345,11 @@ class OpenEngineCycle_DoubleTurbine(EngineCycle):
             safety_factor=self.exhaust_safety_factor,
         )
 
-    @property
+    @fast_cached_property
     def feed_system_mass(self):
         return super().feed_system_mass + self.fuel_turbine.mass + self.oxidizer_turbine.mass
 
-    @property
+    @fast_cached_property
     def engine_dry_mass(self):
         return super().engine_dry_mass + self.fuel_secondary_exhaust.mass + self.oxidizer_secondary_exhaust.mass
 
@@ -302,7 +366,7 @@ class OpenEngineCycle_DoubleTurbine(EngineCycle):
             'Oxidizer Secondary Exhaust',
         ]
 
-    @property
+    @fast_cached_property
     def aggregate_masses(self):
         return super().aggregate_masses | {
             'Turbine Propellant': self.turbine_propellant_mass
@@ -0,0 +1,32 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, Optional
+
+from EngineCycles.Abstract.EngineCycle import EngineCycle
+
+
+def _build(config: dict, cycle_class: type[EngineCycle], attributes: tuple[str, ...]) -> dict:
+    engine = cycle_class(**config)
+    return {attribute: getattr(engine, attribute) for attribute in attributes}
+
+
+def run_batch(cycle_class: type[EngineCycle], configs: Iterable[dict],
+              attributes: tuple[str, ...] = ('overall_specific_impulse', 'engine_dry_mass', 'initial_mass'),
+              max_workers: Optional[int] = None, chunksize: Optional[int] = None) -> list[dict]:
+    """Build an engine for every config in parallel worker processes and return the requested attributes per engine.
+
+    Engines are not returned themselves, as they hold lambdas (e.g. heat_flux_func) that cannot be pickled. Workers
+    share CEA results through the on-disk CEA cache, if enabled (see
+    EngineFunctions.CEAFunctions.cea_disk_cache). Must be called from within an if __name__ == '__main__' block on
+    platforms that spawn worker processes. If no chunksize is given, configs are sent to the workers in about four
+    chunks per worker (like multiprocessing.Pool.map), which keeps the pickling overhead low for large sweeps.
+    """
+    configs = list(configs)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(configs) // (4 * max_workers))
+    build = partial(_build, cycle_class=cycle_class, attributes=tuple(attributes))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(build, configs, chunksize=chunksize))
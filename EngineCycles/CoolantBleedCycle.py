@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from EngineFunctions.BaseFunctions import fast_cached_property
 from EngineComponents.Base.Splitter import Splitter
 from EngineCycles.Abstract.OpenCycle import OpenEngineCycle
 
@@ -17,7 +18,7 @@ class BaseCoolantBleedCycle_Mixin:
 @dataclass
 class CoolantBleedCycle_Mixin(BaseCoolantBleedCycle_Mixin):
 
-    @property
+    @fast_cached_property
     def post_cooling_splitter(self):
         """Splits flow into required chamber flow and "rest flow" which should be the turbine flow"""
         return Splitter(inlet_flow_state=self.cooling_channel_section.outlet_flow_state,
@@ -26,18 +27,18 @@ class CoolantBleedCycle_Mixin(BaseCoolantBleedCycle_Mixin):
 
     @property
     def turbine_inlet_flow_state(self):
-        return self.post_cooling_splitter.outlet_flow_states['turbine']
+        return self.post_cooling_splitter.outlet_flow_state_turbine
 
     @property
     def injector_inlet_flow_states(self):
-        return self.post_cooling_splitter.outlet_flow_states['chamber'], self.oxidizer_pump.outlet_flow_state
+        return self.post_cooling_splitter.outlet_flow_state_chamber, self.oxidizer_pump.outlet_flow_state
 
 
 @dataclass
 class CoolantBleedCycle2_Mixin(BaseCoolantBleedCycle_Mixin):
     """Same as CoolantBleedCycle but flow is split before coolingsection"""
 
-    @property
+    @fast_cached_property
     def pre_cooling_splitter(self):
         """Split fuel flow into required coolant flow and "rest" flow, which should be equal to primary chamber flow."""
         return Splitter(inlet_flow_state=self.fuel_pump.outlet_flow_state,
@@ -46,11 +47,11 @@ class CoolantBleedCycle2_Mixin(BaseCoolantBleedCycle_Mixin):
 
     @property
     def cooling_inlet_flow_state(self):
-        return self.pre_cooling_splitter.outlet_flow_states['cooling']
+        return self.pre_cooling_splitter.outlet_flow_state_cooling
 
     @property
     def injector_inlet_flow_states(self):
-        return self.pre_cooling_splitter.outlet_flow_states['chamber'], self.oxidizer_pump.outlet_flow_state
+        return self.pre_cooling_splitter.outlet_flow_state_chamber, self.oxidizer_pump.outlet_flow_state
 
     @property
     def turbine_inlet_flow_state(self):
@@ -58,9 +59,9 @@ class CoolantBleedCycle2_Mixin(BaseCoolantBleedCycle_Mixin):
 
     @property
     def fuel_pump_expected_pressure(self):
-        dp1 = self.combustion_chamber_pressure - self.injector.pressure_change
-        dp2 = self.combustion_chamber_pressure - self.cooling_channel_section.pressure_change
-        return max(dp1, dp2)
+        # max(pc - dp_injector, pc - dp_cooling)
+        return self.combustion_chamber_pressure - min(self.injector.pressure_change,
+                                                      self.cooling_channel_section.pressure_change)
 
 
 @dataclass
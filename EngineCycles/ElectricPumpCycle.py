@@ -1,4 +1,5 @@
-from dataclasses import dataclass, replace, field
+from dataclasses import dataclass, field
+from math import isclose
 from EngineCycles.Abstract.EngineCycle import EngineCycle
 from EngineComponents.Base.Pump import Pump
 from EngineComponents.Other.BatteryCooler import BatteryCooler
@@ -8,18 +9,36 @@ from EngineComponents.Other.Inverter import Inverter
 from EngineComponents.Base.Merger import Merger
 from EngineComponents.Base.Splitter import Splitter
 from EngineComponents.Abstract.FlowState import FlowState, DefaultFlowState
+from EngineFunctions.BaseFunctions import fast_cached_property
+
+
+def get_battery_cooler_outlet_temperature(fuel_pump_mass_flow: float, battery_coolant_mass_flow: float,
+                                          battery_coolant_temperature_change: float,
+                                          fuel_pump_temperature_change: float, fuel_tank_temperature: float) -> float:
+    """Battery cooler outlet temperature in the limit of the recirculation iteration, only takes floats."""
+    a = battery_coolant_mass_flow / fuel_pump_mass_flow
+    b = battery_coolant_temperature_change + fuel_pump_temperature_change
+    dt_expected = a * b / (1 - a)  # Mathematical limit
+    return dt_expected / a + fuel_tank_temperature
+
+
+# Electric feed system components rebuilt from the battery coolant iteration state, cached per iteration step. The error
+# check, the coolant state update and the verbose message of one step thereby share a single splitter and battery cooler
+_ELECTRIC_PUMP_CYCLE_CACHED_PROPERTIES = (
+    'pre_fuel_pump_merger', 'post_fuel_pump_splitter', 'electric_motor', 'inverter', 'battery', 'battery_cooler',
+    'cooling_inlet_flow_state', 'actual_battery_coolant_flow',
+)
+
 
 @dataclass(kw_only=True)
 class ElectricPumpCycle(EngineCycle):
-    # TODO: dataclass inheritance is dumb, so all inherited classes can only have default variables if baseclass has any
-    #  Solution is to update to 3.10 and use @dataclass(kw_only=True), probably not worth the hassle
-    electric_motor_specific_power: float = 0  # W/kg
-    inverter_specific_power: float = 0  # W/kg
-    battery_specific_power: float = 0  # W/kg
-    battery_specific_energy: float = 0  # J/kg
-    electric_motor_efficiency: float = 0  # -
-    inverter_efficiency: float = 0  # -
-    battery_structural_factor: float = 0  # -
+    electric_motor_specific_power: float  # W/kg
+    inverter_specific_power: float  # W/kg
+    battery_specific_power: float  # W/kg
+    battery_specific_energy: float  # J/kg
+    electric_motor_efficiency: float  # -
+    inverter_efficiency: float  # -
+    battery_structural_factor: float  # -
     battery_coolant_temperature_change: float = 0  # K
     electric_motor_heat_loss_factor: float = 0
     electric_motor_magnet_temp_limit: float = 0
@@ -30,6 +49,10 @@ class ElectricPumpCycle(EngineCycle):
     # Iteration attribute not required at init
     _iterative_battery_cooler_outlet_flow_state: FlowState = field(init=False, repr=False, default=DefaultFlowState())
 
+    _iteration_cached_properties = EngineCycle._iteration_cached_properties + _ELECTRIC_PUMP_CYCLE_CACHED_PROPERTIES
+    _iteration_state_attributes = EngineCycle._iteration_state_attributes | {
+        '_iterative_battery_cooler_outlet_flow_state'}
+
     def __post_init__(self):
         """"Initial iterative_flow_state """
         super().__post_init__()
@@ -37,33 +60,36 @@ class ElectricPumpCycle(EngineCycle):
 
     def set_initial_values(self):
         super().set_initial_values()
-        self._iterative_battery_cooler_outlet_flow_state = replace(self.fuel_tank.outlet_flow_state, mass_flow=0)
+        self._iterative_battery_cooler_outlet_flow_state = self.fuel_tank.outlet_flow_state.fast_replace(mass_flow=0)
 
     def iterate_flow(self):
+        # The fuel tank outlet temperature does not depend on the battery coolant flow, so the limit is fixed
+        maximum_pump_inlet_temperature = self.fuel_tank.outlet_temperature + self.max_pump_inlet_temp_increase
         while self.battery_flow_error_larger_than_accuracy():
             self._iterative_battery_cooler_outlet_flow_state = self.battery_cooler.outlet_flow_state
-            if self.pre_fuel_pump_merger.outlet_temperature > self.fuel_tank.outlet_temperature + self.max_pump_inlet_temp_increase:
+            if self.pre_fuel_pump_merger.outlet_temperature > maximum_pump_inlet_temperature:
                 raise ValueError('Battery Coolant too hot, will negatively affect pumps')
             self.print_verbose_iteration_message()
         self.set_battery_cooler_outlet_temp()
 
     def battery_flow_error_larger_than_accuracy(self):
-        error = abs(self.actual_battery_coolant_flow - self.battery_cooler.coolant_flow_required)
-        margin = self.battery_cooler.coolant_flow_required * self.iteration_accuracy
-        return error > margin
+        return not isclose(self.actual_battery_coolant_flow, self.battery_cooler.coolant_flow_required,
+                           rel_tol=self.iteration_accuracy)
 
     def set_battery_cooler_outlet_temp(self):
         """Set battery cooler outlet temperature according to limit instead of iteration."""
-        # Calculation of theoretical temperature difference between fuel tank outlet and fuel pump inlet
-        m_fp = self.fuel_pump.inlet_flow_state.mass_flow
-        m_bat_cl = self._iterative_battery_cooler_outlet_flow_state.mass_flow
-        a = m_bat_cl / m_fp # type: ignore
-        b = self.battery_coolant_temperature_change + self.fuel_pump.temperature_change
-        dt_expected = a * b / (1 - a)  # Mathematical limit
-        # Calculation of expected battery cooler outlet temperature
-        temp_ft = self.fuel_tank.outlet_flow_state.temperature
-        temp_bat_out_expected = dt_expected / a + temp_ft
-        self._iterative_battery_cooler_outlet_flow_state.temperature = temp_bat_out_expected
+        fuel_pump = self.fuel_pump
+        battery_cooler_outlet_flow_state = self._iterative_battery_cooler_outlet_flow_state
+        temperature = get_battery_cooler_outlet_temperature(
+            fuel_pump_mass_flow=fuel_pump.inlet_flow_state.mass_flow,
+            battery_coolant_mass_flow=battery_cooler_outlet_flow_state.mass_flow,
+            battery_coolant_temperature_change=self.battery_coolant_temperature_change,
+            fuel_pump_temperature_change=fuel_pump.temperature_change,
+            fuel_tank_temperature=self.fuel_tank.outlet_flow_state.temperature,
+        )
+        # Replaced instead of changed in place, as the outlet state may be shared (see FlowState.get)
+        self._iterative_battery_cooler_outlet_flow_state = battery_cooler_outlet_flow_state.fast_replace(
+            temperature=temperature)
 
     @property
     def verbose_iteration_name(self):
@@ -77,12 +103,12 @@ class ElectricPumpCycle(EngineCycle):
     def verbose_iteration_required(self):
         return self.battery_cooler.coolant_flow_required
 
-    @property
+    @fast_cached_property
     def pre_fuel_pump_merger(self):
         return Merger(
             inlet_flow_states=(self.fuel_tank.outlet_flow_state, self._iterative_battery_cooler_outlet_flow_state))
 
-    @property
+    @fast_cached_property
     def post_fuel_pump_splitter(self):
         if self.fuel_tank.outlet_mass_flow is None:
             raise ValueError('Fuel tank outlet mass flow is \'None\', cannot create post fuel pump splitter')
@@ -91,14 +117,14 @@ class ElectricPumpCycle(EngineCycle):
                         outlet_flow_names=('chamber', 'battery'))
 
     # Rewrite of fuel_pump to accommodate for recirculation of battery cooling fuel flow (instead of actual split flow)
-    @property
+    @fast_cached_property
     def fuel_pump(self):
         return Pump(inlet_flow_state=self.pre_fuel_pump_merger.outlet_flow_state,
                     expected_outlet_pressure=self.fuel_pump_outlet_pressure,
                     efficiency=self.fuel_pump_efficiency,
                     specific_power=self.fuel_pump_specific_power, )
 
-    @property
+    @fast_cached_property
     def electric_motor(self):
         return ElectricMotor(specific_power=self.electric_motor_specific_power,
                              electric_energy_efficiency=self.electric_motor_efficiency,
@@ -108,13 +134,13 @@ class ElectricPumpCycle(EngineCycle):
                              oxidizer_leakage_factor=self.electric_motor_ox_leak_factor,
                              magnet_temp_limit=self.electric_motor_magnet_temp_limit, )
 
-    @property
+    @fast_cached_property
     def inverter(self):
         return Inverter(specific_power=self.inverter_specific_power,
                         electric_energy_efficiency=self.inverter_efficiency,
                         output_power=self.electric_motor.input_power)
 
-    @property
+    @fast_cached_property
     def battery(self):
         return Battery(specific_power=self.battery_specific_power,
                        specific_energy=self.battery_specific_energy,
@@ -122,23 +148,23 @@ class ElectricPumpCycle(EngineCycle):
                        output_power=self.inverter.input_power,
                        burn_time=self.burn_time, )
 
-    @property
+    @fast_cached_property
     def battery_cooler(self):
-        return BatteryCooler(inlet_flow_state=self.post_fuel_pump_splitter.outlet_flow_states['battery'],
+        return BatteryCooler(inlet_flow_state=self.post_fuel_pump_splitter.outlet_flow_state_battery,
                              outlet_pressure_required=self.fuel_tank.outlet_pressure,
                              coolant_allowable_temperature_change=self.battery_coolant_temperature_change,
                              coolant_specific_heat_capacity=self.battery_coolant_specific_heat_capacity,
                              power_heat_loss=self.battery.power_heat_loss, )
 
-    @property
+    @fast_cached_property
     def cooling_inlet_flow_state(self):
-        return self.post_fuel_pump_splitter.outlet_flow_states['chamber']
+        return self.post_fuel_pump_splitter.outlet_flow_state_chamber
 
-    @property
+    @fast_cached_property
     def actual_battery_coolant_flow(self):
-        return self.post_fuel_pump_splitter.outlet_flow_states['battery'].mass_flow
+        return self.post_fuel_pump_splitter.outlet_flow_state_battery.mass_flow
 
-    @property
+    @fast_cached_property
     def feed_system_mass(self):
         return super().feed_system_mass + self.electric_motor.mass + self.inverter.mass
 
@@ -150,11 +176,11 @@ class ElectricPumpCycle(EngineCycle):
     def power_mass(self):
         return super().power_mass + self.battery.mass
 
-    @property
+    @fast_cached_property
     def dry_mass(self):
         return super().dry_mass + self.battery.mass
 
-    @property
+    @fast_cached_property
     def mass_kwak(self):
         return super().mass_kwak + self.battery.mass + self.inverter.mass + self.electric_motor.mass
 
@@ -1,32 +1,62 @@
 from dataclasses import dataclass, field, replace
 from typing import Optional
 import warnings
+import numpy as np
 from scipy import constants
 from EngineCycles.Abstract.OpenCycle import OpenEngineCycle, OpenEngineCycle_DoubleTurbine
 from EngineComponents.Base.Splitter import Splitter
 from EngineComponents.Other.GasGenerator import GasGenerator
 from EngineComponents.Abstract.Material import Material
 from EngineComponents.Abstract.FlowState import FlowState, DefaultFlowState, ManualFlowState
-from EngineFunctions.CEAFunctions import get_gas_generator_mmr, get_cea_dict_gg
+from EngineFunctions.CEAFunctions import get_gas_generator_mmr_cached, get_cea_dict_gg_cached
 from EngineFunctions.EmpiricalRelations import get_gas_generator_mmr_rp1
+from EngineFunctions.BaseFunctions import fast_cached_property
+
+
+def get_gas_generator_flow_split(gg_mass_flow: float, gg_mass_mixture_ratio: float) -> tuple[float, float]:
+    """Oxidizer and fuel flow of the gas generator, only uses arithmetic so it also works for numpy arrays."""
+    gg_fuel_flow = gg_mass_flow / (gg_mass_mixture_ratio + 1)
+    return gg_mass_mixture_ratio * gg_fuel_flow, gg_fuel_flow
+
+
+def _get_gas_generator_flows(gg_mass_mixture_ratio: np.ndarray, gg_mass_flow: np.ndarray,
+                             chamber_fuel_flow: np.ndarray, chamber_oxidizer_flow: np.ndarray,
+                             gg_pressure: np.ndarray, gg_molar_mass: np.ndarray,
+                             gg_temperature: np.ndarray) -> dict[str, np.ndarray]:
+    """Vectorized equivalent of the GasGeneratorCycle_Mixin flow and gas generator density relations."""
+    gg_oxidizer_flow, gg_fuel_flow = get_gas_generator_flow_split(gg_mass_flow, gg_mass_mixture_ratio)
+    return {'gg_oxidizer_flow': gg_oxidizer_flow,
+            'gg_fuel_flow': gg_fuel_flow,
+            'main_fuel_flow': chamber_fuel_flow + gg_fuel_flow,
+            'main_oxidizer_flow': chamber_oxidizer_flow + gg_oxidizer_flow,
+            'ideal_gas_densty_in_gas_generator': gg_pressure * gg_molar_mass / (constants.gas_constant * gg_temperature)}
 
 
 # Baseclass that can either inherit from single or double turbine OpenCycle (see next classes)
-@dataclass
+@dataclass(kw_only=True)
 class GasGeneratorCycle_Mixin:
-    # TODO: dataclass inheritance is stupid see EP-class
-    gg_stay_time: float = 0  # [s]
-    gg_structural_factor: float = 0  # [-]
-    gg_material: Material = None
+    gg_stay_time: float  # [s]
+    gg_structural_factor: float  # [-]
+    gg_material: Material
     gg_base_flow_state: Optional[FlowState] = None
     gg_is_frozen: Optional[bool] = None
     gg_pressure: Optional[float] = None  # [Pa]
     gg_mass_mixture_ratio: Optional[float] = None  # [-]
     _cea_gg_mmr: float = field(init=False, default=None)  # [-]
 
+    _iteration_state_attributes = OpenEngineCycle._iteration_state_attributes | {
+        'gg_base_flow_state', 'gg_is_frozen', 'gg_pressure', 'gg_mass_mixture_ratio', '_cea_gg_mmr'}
+
     def __post_init__(self):
         super().__post_init__()
 
+    @classmethod
+    def evaluate_gg_batch(cls, arrays: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """Evaluate the gas generator flow split and density for arrays of gg_mass_mixture_ratio, gg_mass_flow,
+        chamber_fuel_flow, chamber_oxidizer_flow, gg_pressure, gg_molar_mass and gg_temperature (e.g. collected with
+        batch()), without building engines. CEA derived arrays only need one (memoized) CEA call per unique input."""
+        return _get_gas_generator_flows(**{key: np.asarray(value, dtype=float) for key, value in arrays.items()})
+
     def set_initial_values(self):
         super().set_initial_values()
         if self.gg_is_frozen is None:
@@ -34,8 +64,8 @@ class GasGeneratorCycle_Mixin:
         if self.gg_pressure is None:
             self.gg_pressure = self.combustion_chamber_pressure
         if self.gg_mass_mixture_ratio is None:
-            self.gg_mass_mixture_ratio = get_gas_generator_mmr(temperature_limit=self.turbine_maximum_temperature,
-                                                               **self.cea_gg_kwargs)
+            self.gg_mass_mixture_ratio = get_gas_generator_mmr_cached(
+                temperature_limit=self.turbine_maximum_temperature, **self.cea_gg_kwargs)
             if self.gg_mass_mixture_ratio < 0.5 and 'RP' in self.fuel_name:
                 self._cea_gg_mmr = self.gg_mass_mixture_ratio
                 # CEA for fuel-rich RP1/LOX combustion is quite a ways off, this empirical relation is better
@@ -45,10 +75,10 @@ class GasGeneratorCycle_Mixin:
             # If an empirical mixture ratio is used (only happens if it's a better approximation than CEA)
             # this ratio is used in further calculation, EXCEPT for calculation of the gg_base_flow_state below
             mixture_ratio = self.gg_mass_mixture_ratio if self._cea_gg_mmr is None else self._cea_gg_mmr
-            cea_dict = get_cea_dict_gg(MR=mixture_ratio,
-                                       frozen=1 if self.gg_is_frozen else 0,
-                                       frozenAtThroat=1 if self.gg_is_frozen else 0,
-                                       **self.cea_gg_kwargs)
+            cea_dict = get_cea_dict_gg_cached(MR=float(mixture_ratio),
+                                              frozen=1 if self.gg_is_frozen else 0,
+                                              frozenAtThroat=1 if self.gg_is_frozen else 0,
+                                              **self.cea_gg_kwargs)
             self.gg_base_flow_state = ManualFlowState(propellant_name='ExhaustGas',
                                                       temperature=cea_dict['T_C'],
                                                       pressure=self.gg_pressure,
@@ -69,18 +99,20 @@ class GasGeneratorCycle_Mixin:
 
     @property
     def ideal_gas_densty_in_gas_generator(self):
-        r = constants.gas_constant / self.gg_base_flow_state.molar_mass
-        return self.gg_pressure / (r * self.gg_base_flow_state.temperature)
+        gg_base_flow_state = self.gg_base_flow_state
+        return self.gg_pressure / (gg_base_flow_state.specific_gas_constant * gg_base_flow_state.temperature)
 
     def check_gg_temp_and_pressure(self):
-        if self.gg_base_flow_state.temperature > self.turbine_maximum_temperature * 1.01:
+        gg_base_flow_state = self.gg_base_flow_state
+        combustion_temperature = gg_base_flow_state.temperature
+        if combustion_temperature > self.turbine_maximum_temperature * 1.01:
             warnings.warn(
                 f'The combustion temperature of the gas generator is higher than the maximum allowed turbine inlet '
                 f'temperature [{self.turbine_maximum_temperature}]. The combustion temperature '
-                f'[{self.gg_base_flow_state.temperature}] was either provided manually or calculated from a manually '
+                f'[{combustion_temperature}] was either provided manually or calculated from a manually '
                 f'provided mixture ratio [{self.gg_mass_mixture_ratio}]'
             )
-        if self.gg_base_flow_state.pressure != self.gg_pressure:
+        if gg_base_flow_state.pressure != self.gg_pressure:
             raise ValueError('Pressure provided through gg_base_flow_state must be the same as gg_pressure.')
 
     @property
@@ -88,7 +120,7 @@ class GasGeneratorCycle_Mixin:
         """Turbine operates with gas generator exhaust at maximum allowable temperature."""
         return self.gas_generator.outlet_flow_state
 
-    @property
+    @fast_cached_property
     def post_oxidizer_pump_splitter(self):
         """Splits the flow into the required chamber oxidizer flow and 'extra' flow, which will be equal to the required
         gas generator oxidizer flow after iteration"""
@@ -96,7 +128,7 @@ class GasGeneratorCycle_Mixin:
                         required_outlet_mass_flows=(self.chamber_oxidizer_flow,),
                         outlet_flow_names=('main', 'gg'))
 
-    @property
+    @fast_cached_property
     def post_fuel_pump_splitter(self):
         """Splits the flow into the required chamber fuel flow and 'extra' flow, which will be equal to the required gas
         generator fuel flow after iteration"""
@@ -110,11 +142,11 @@ class GasGeneratorCycle_Mixin:
 
     @property
     def gg_oxidizer_flow(self):
-        return self.gg_mass_mixture_ratio / (self.gg_mass_mixture_ratio + 1) * self.gg_mass_flow
+        return get_gas_generator_flow_split(self.gg_mass_flow, self.gg_mass_mixture_ratio)[0]
 
     @property
     def gg_fuel_flow(self):
-        return 1 / (self.gg_mass_mixture_ratio + 1) * self.gg_mass_flow
+        return get_gas_generator_flow_split(self.gg_mass_flow, self.gg_mass_mixture_ratio)[1]
 
     @property
     def main_fuel_flow(self):  # Override EngineCycle flows
@@ -133,7 +165,7 @@ class GasGeneratorCycle_Mixin:
     def injector_inlet_flow_states(self):
         return self.cooling_channel_section.outlet_flow_state, self.post_oxidizer_pump_splitter.outlet_flow_state_main
 
-    @property
+    @fast_cached_property
     def gas_generator(self):
         return GasGenerator(oxidizer_inlet_flow_state=self.post_oxidizer_pump_splitter.outlet_flow_state_gg,
                             fuel_inlet_flow_state=self.post_fuel_pump_splitter.outlet_flow_state_gg,
@@ -151,15 +183,15 @@ class GasGeneratorCycle_Mixin:
         p2 = self.gg_pressure
         return max(p1, p2)
 
-    @property
+    @fast_cached_property
     def feed_system_mass(self):
         return super().feed_system_mass + self.gas_generator.mass
 
-    @property
+    @fast_cached_property
     def mass_kwak(self):
         return super().mass_kwak + self.gas_generator.mass
 
-    @property
+    @fast_cached_property
     def engine_dry_mass(self):
         return super().engine_dry_mass + self.gas_generator.mass
 
@@ -212,11 +244,9 @@ class GasGeneratorCycle_DoubleTurbineSeries(GasGeneratorCycle_DoubleTurbine):
         raise NotImplementedError
 
     # Adjust iteration
-    def turbine_flow_error_larger_than_accuracy(self):
-        required = max(self.oxidizer_turbine.mass_flow_required, self.fuel_turbine.mass_flow_required)
-        error = abs(required - self.turbine_mass_flow)
-        margin = required * self.iteration_accuracy
-        return error > margin
+    @fast_cached_property
+    def turbine_mass_flow_required(self):
+        return max(self.oxidizer_turbine.mass_flow_required, self.fuel_turbine.mass_flow_required)
 
     @property
     def turbine_mass_flow(self):
@@ -236,15 +266,13 @@ class GasGeneratorCycle_DoubleTurbineSeries(GasGeneratorCycle_DoubleTurbine):
     def exhaust_total_thrust(self):
         return self.oxidizer_secondary_exhaust.thrust
 
-    @property
+    @fast_cached_property
     def engine_dry_mass(self):
         return self.feed_system_mass + self.thrust_chamber.mass + self.oxidizer_secondary_exhaust.mass
 
     @property
     def components_list(self):
-        components_list: list = super().components_list
-        components_list.remove('Fuel Secondary Exhaust')
-        return components_list
+        return [name for name in super().components_list if name != 'Fuel Secondary Exhaust']
 
 if __name__ == '__main__':
     from EngineArguments import DefaultArguments as args
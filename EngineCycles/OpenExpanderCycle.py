@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from EngineFunctions.BaseFunctions import fast_cached_property
 from typing import Optional
 from EngineCycles.Abstract.OpenCycle import OpenEngineCycle, OpenEngineCycle_DoubleTurbine
 from EngineComponents.Base.Merger import Merger
@@ -26,14 +27,14 @@ class OpenExpanderCycle_Mixin(BaseCoolantBleedCycle_Mixin):
             return self.turbine_mass_flow
 
     # New components required to split the flow before AND after the cooling channels
-    @property
+    @fast_cached_property
     def pre_cooling_splitter(self):
         """Split fuel flow into required coolant flow and "rest" flow, which should be equal to primary chamber flow."""
         return Splitter(inlet_flow_state=self.fuel_pump.outlet_flow_state,
                         required_outlet_mass_flows=(self.required_coolant_mass_flow,),
                         outlet_flow_names=('coolant', 'chamber'))
 
-    @property
+    @fast_cached_property
     def post_cooling_splitter(self):
         """Split coolant (fuel) flow into second chamber flow and "rest" flow, which should be equal to turbine flow."""
         chamber_flow1 = self.pre_cooling_splitter.outlet_flow_state_chamber.mass_flow
@@ -41,7 +42,7 @@ class OpenExpanderCycle_Mixin(BaseCoolantBleedCycle_Mixin):
                         required_outlet_mass_flows=(self.chamber_fuel_flow - chamber_flow1,),
                         outlet_flow_names=('chamber', 'turbine'))
 
-    @property
+    @fast_cached_property
     def pre_injection_merger(self):
         """Merge primary and secondary chamber fuel flows"""
         return Merger(inlet_flow_states=(self.post_cooling_splitter.outlet_flow_state_chamber,
@@ -49,7 +50,7 @@ class OpenExpanderCycle_Mixin(BaseCoolantBleedCycle_Mixin):
 
     @property
     def turbine_inlet_flow_state(self):
-        return self.post_cooling_splitter.outlet_flow_states['turbine']
+        return self.post_cooling_splitter.outlet_flow_state_turbine
 
     @property
     def injector_inlet_flow_states(self):
@@ -57,7 +58,7 @@ class OpenExpanderCycle_Mixin(BaseCoolantBleedCycle_Mixin):
 
     @property
     def cooling_inlet_flow_state(self):
-        return self.pre_cooling_splitter.outlet_flow_states['coolant']
+        return self.pre_cooling_splitter.outlet_flow_state_coolant
 
 
 @dataclass
@@ -68,6 +69,9 @@ class OpenExpanderCycle_DoublePump_Mixin(OpenExpanderCycle_Mixin):
     _secondary_fuel_pump_pressure_factor_first_guess: float = .3
     _secondary_fuel_pump_outlet_pressure: float = field(init=False, repr=False, default=None)
 
+    _iteration_state_attributes = OpenEngineCycle._iteration_state_attributes | {
+        '_secondary_fuel_pump_outlet_pressure'}
+
     def calc_pump_outlet_pressures(self):
         super().calc_pump_outlet_pressures()
         self._secondary_fuel_pump_outlet_pressure = self.secondary_fuel_pump_expected_pressure
@@ -80,7 +84,7 @@ class OpenExpanderCycle_DoublePump_Mixin(OpenExpanderCycle_Mixin):
         else:
             return self.combustion_chamber_pressure * self._secondary_fuel_pump_pressure_factor_first_guess + self.fuel_pump_outlet_pressure
 
-    @property
+    @fast_cached_property
     def secondary_fuel_pump(self):
         eta2 = self.secondary_fuel_pump_efficiency
         eta = self.fuel_pump_efficiency if eta2 is None else eta2
@@ -101,7 +105,7 @@ class OpenExpanderCycle_DoublePump_Mixin(OpenExpanderCycle_Mixin):
     def secondary_fuel_pump_expected_pressure(self):
         return self.fuel_pump_expected_pressure - self.cooling_channel_section.pressure_change
 
-    @property
+    @fast_cached_property
     def pumps_mass(self):
         return super().pumps_mass + self.secondary_fuel_pump.mass
 
@@ -180,24 +184,18 @@ class OpenExpanderCycle_DoubleTurbineSeries(OpenExpanderCycle_DoubleTurbine):
         raise NotImplementedError
 
     # Adjust iteration
-    def turbine_flow_error_larger_than_accuracy(self):
-        required = max(self.oxidizer_turbine.mass_flow_required, self.fuel_turbine.mass_flow_required)
-        error = abs(required - self.turbine_mass_flow)
-        margin = required * self.iteration_accuracy
-        return error > margin
+    @fast_cached_property
+    def turbine_mass_flow_required(self):
+        return max(self.oxidizer_turbine.mass_flow_required, self.fuel_turbine.mass_flow_required)
 
     @property
     def turbine_mass_flow(self):
         return max(self._iterative_oxidizer_turbine_mass_flow, self._iterative_fuel_turbine_mass_flow)
 
-    @property
-    def verbose_iteration_required(self):
-        return max(self.fuel_turbine.mass_flow_required,self.oxidizer_turbine.mass_flow_required)
-
     # Adjusted inlet flows
     @property
     def fuel_turbine_inlet_flow_state(self):
-        return self.post_cooling_splitter.outlet_flow_states['turbine']
+        return self.post_cooling_splitter.outlet_flow_state_turbine
 
     @property
     def oxidizer_turbine_inlet_flow_state(self):
@@ -208,13 +206,11 @@ class OpenExpanderCycle_DoubleTurbineSeries(OpenExpanderCycle_DoubleTurbine):
     def exhaust_total_thrust(self):
         return self.oxidizer_secondary_exhaust.thrust
 
-    @property
+    @fast_cached_property
     def engine_dry_mass(self):
         return self.feed_system_mass + self.thrust_chamber.mass + self.oxidizer_secondary_exhaust.mass
 
     @property
     def components_list(self):
-        components_list: list = super().components_list
-        components_list.remove('Fuel Secondary Exhaust')
-        return components_list
+        return [name for name in super().components_list if name != 'Fuel Secondary Exhaust']
 
@@ -2,6 +2,7 @@ import warnings
 from dataclasses import dataclass, replace, field
 from typing import Optional
 from EngineCycles.Abstract.EngineCycle import EngineCycle
+from EngineFunctions.BaseFunctions import fast_cached_property
 from EngineComponents.Base.Pump import Pump
 from EngineComponents.Base.Tank import Tank
 from EngineComponents.Other.ElectricMotor import SimpleElectricMotor
@@ -9,6 +10,11 @@ from EngineComponents.Other.Battery import Battery
 from EngineComponents.Other.Inverter import Inverter
 
 
+# Electric feed system components, cached like the EngineCycle components. The motor, inverter and battery chain is
+# thereby built once per iteration step and shared by feed_system_mass, dry_mass and mass_kwak
+_SIMPLE_ELECTRIC_PUMP_CYCLE_CACHED_PROPERTIES = ('electric_motor', 'inverter', 'battery', 'cooling_inlet_flow_state')
+
+
 @dataclass
 class SimpleElectricPumpCycle(EngineCycle):
     electric_motor_specific_power: float = 0  # W/kg
@@ -20,26 +26,29 @@ class SimpleElectricPumpCycle(EngineCycle):
     battery_structural_factor: float = 0  # -
     iterate: bool = False
 
-    @property
+    _iteration_cached_properties = (EngineCycle._iteration_cached_properties
+                                    + _SIMPLE_ELECTRIC_PUMP_CYCLE_CACHED_PROPERTIES)
+
+    @fast_cached_property
     def fuel_pump(self):
         return Pump(inlet_flow_state=self.fuel_tank.outlet_flow_state,
                     expected_outlet_pressure=self.fuel_pump_outlet_pressure,
                     efficiency=self.fuel_pump_efficiency,
                     specific_power=self.fuel_pump_specific_power, )
 
-    @property
+    @fast_cached_property
     def electric_motor(self):
         return SimpleElectricMotor(specific_power=self.electric_motor_specific_power,
                                    electric_energy_efficiency=self.electric_motor_efficiency,
                                    output_power=self.pumps_power_required, )
 
-    @property
+    @fast_cached_property
     def inverter(self):
         return Inverter(specific_power=self.inverter_specific_power,
                         electric_energy_efficiency=self.inverter_efficiency,
                         output_power=self.electric_motor.input_power)
 
-    @property
+    @fast_cached_property
     def battery(self):
         return Battery(specific_power=self.battery_specific_power,
                        specific_energy=self.battery_specific_energy,
@@ -47,11 +56,11 @@ class SimpleElectricPumpCycle(EngineCycle):
                        output_power=self.inverter.input_power,
                        burn_time=self.burn_time, )
 
-    @property
+    @fast_cached_property
     def cooling_inlet_flow_state(self):
         return self.fuel_pump.outlet_flow_state
 
-    @property
+    @fast_cached_property
     def oxidizer_tank(self):
         return Tank(inlet_flow_state=self.oxidizer_main_flow_state,
                     propellant_volume=self.oxidizer.volume,
@@ -61,18 +70,18 @@ class SimpleElectricPumpCycle(EngineCycle):
                     structure_material=self.oxidizer_tank_material,
                     safety_factor=self.tanks_structural_factor, )
 
-    @property
+    @fast_cached_property
     def tanks_mass(self):
         return self.oxidizer_tank.mass + self.fuel_tank.mass
 
-    @property
+    @fast_cached_property
     def feed_system_mass(self):
         return super().feed_system_mass + self.electric_motor.mass + self.inverter.mass
 
-    @property
+    @fast_cached_property
     def dry_mass(self):
         return super().dry_mass + self.battery.mass
 
-    @property
+    @fast_cached_property
     def mass_kwak(self):
         return super().mass_kwak + self.battery.mass + self.inverter.mass + self.electric_motor.mass - self.pressurant.mass
@@ -1,56 +1,62 @@
+from functools import cache
+
 propellant_mix_error_message = 'The only accepted propellant combinations are: ["LH2/LOX","LCH4/LOX","RP1/LOX"]'
 
+# Substrings of the propellant names, checked in order. Names are matched by substring (e.g. 'RP1_NASA'), the results
+# are cached per name, so the tables are only scanned once for every propellant.
+_OXIDIZER_SUBSTRINGS = ('LOX', 'LO2')
+_FUEL_SUBSTRING_TO_MIXTURE = (('LH2', 'LH2/LOX'), ('CH4', 'LCH4/LOX'), ('RP1', 'RP1/LOX'))
+_PROPELLANT_SUBSTRING_TO_INITIAL_TEMPERATURE = (('RP', 263.6), ('LH2', 20.25), ('CH4', 111.0), ('LOX', 90.19),
+                                                ('LO2', 90.19))
+
 
+@cache
 def get_propellant_mixture(fuel_name: str, oxidizer_name: str) -> str:
-    if 'LOX' in oxidizer_name or 'LO2' in oxidizer_name:
-        if 'LH2' in fuel_name:
-            return 'LH2/LOX'
-        elif 'CH4' in fuel_name:
-            return 'LCH4/LOX'
-        elif 'RP1' in fuel_name:
-            return 'RP1/LOX'
+    if any(substring in oxidizer_name for substring in _OXIDIZER_SUBSTRINGS):
+        return next((mixture for substring, mixture in _FUEL_SUBSTRING_TO_MIXTURE if substring in fuel_name), None)
     else:
         raise NotImplementedError(propellant_mix_error_message)
 
 
+# R.W. Humble, 1995 - "Space Propulsion Analysis and Design" p.220
+_CHARACTERISTIC_LENGTHS = {'LH2/LOX': 0.89, 'LCH4/LOX': 1.45, 'RP1/LOX': 1.145}
+
+
 def get_characteristic_length(propellant_mix: str) -> float:
     """Find the characteristic length in [m] based on propellant combination."""
-    switcher = {'LH2/LOX': 0.89, 'LCH4/LOX': 1.45, 'RP1/LOX': 1.145}
-    # R.W. Humble, 1995 - "Space Propulsion Analysis and Design" p.220
     try:
-        return switcher[propellant_mix]
+        return _CHARACTERISTIC_LENGTHS[propellant_mix]
     except KeyError:
         raise NotImplementedError(propellant_mix_error_message)
 
 
+_SPECIFIC_IMPULSE_QUALITY_FACTORS = {'LH2/LOX': 0.98, 'LCH4/LOX': 0.97, 'RP1/LOX': 0.95}
+
+
 def get_specific_impulse_quality_factor(propellant_mix: str) -> float:
     """Find the specific impulse correction/quality factor [-] based on propellant combination."""
-    switcher = {'LH2/LOX': 0.98, 'LCH4/LOX': 0.97, 'RP1/LOX': 0.95}
     try:
-        return switcher[propellant_mix]
+        return _SPECIFIC_IMPULSE_QUALITY_FACTORS[propellant_mix]
     except KeyError:
         raise NotImplementedError(propellant_mix_error_message)
 
 
+_MASS_MIXTURE_RATIOS = {'LH2/LOX': 5.6, 'LCH4/LOX': 3.6, 'RP1/LOX': 2.45}
+
+
 def get_mass_mixture_ratio(propellant_mix: str) -> float:
     """Get default mixture ratio [-] based on propellant combination"""
-    switcher = {'LH2/LOX': 5.6, 'LCH4/LOX': 3.6, 'RP1/LOX': 2.45}
     try:
-        return switcher[propellant_mix]
+        return _MASS_MIXTURE_RATIOS[propellant_mix]
     except KeyError:
         raise NotImplementedError(propellant_mix_error_message)
 
 
+@cache
 def get_initial_propellant_temperature(propellant_name: str) -> float:
     """Get the initial temperature of a propellant in [K]."""
-    if 'RP' in propellant_name:
-        return 263.6
-    elif 'LH2' in propellant_name:
-        return 20.25
-    elif 'CH4' in propellant_name:
-        return 111.0
-    elif 'LOX' in propellant_name or 'LO2' in propellant_name:
-        return 90.19
+    return next((temperature for substring, temperature in _PROPELLANT_SUBSTRING_TO_INITIAL_TEMPERATURE
+                 if substring in propellant_name), None)
 
 
 def get_prandtl_number_estimate(heat_capacity_ratio: float) -> float:
@@ -1,12 +1,11 @@
 from typing import Optional
 
 import matplotlib.pyplot as plt
-from numpy import log10
+from math import log10, floor
 
 
 def only_one_none(a, b, c):
-    a, b, c = a is None, b is None, c is None
-    return a ^ b ^ c ^ all((a, b, c))
+    return (a is None) + (b is None) + (c is None) == 1
 
 
 def multi_legend(axes: tuple[plt.Axes, ...], **kwargs):
@@ -21,30 +20,37 @@ def multi_legend(axes: tuple[plt.Axes, ...], **kwargs):
 
 
 def copy_without(origin_dict, iterable_keys):
-    copy_dict = origin_dict.copy()
-    for key in iterable_keys:
-        copy_dict.pop(key)
-    return copy_dict
+    skip_keys = set(iterable_keys)
+    missing_keys = skip_keys.difference(origin_dict)
+    if missing_keys:
+        raise KeyError(next(iter(missing_keys)))
+    return {key: value for key, value in origin_dict.items() if key not in skip_keys}
+
+
+_SI_PREFIXES = ('Y', 'Z', 'E', 'P', 'T', 'G', 'M', 'k', '', 'm', '\u03BC', 'n', 'p', 'f', 'a', 'z', 'y')
+_SI_PREFIX_INDICES = {prefix: index for index, prefix in enumerate(_SI_PREFIXES)}
+
+
+_DEFAULT_FORCE_PREFIX = {'g/s': 'k', 'Pa': 'M', 'W': 'M'}
 
 
 def format_si(value: float, unit: str, digits: int = 5, force_prefix: Optional[dict] = None):
     if force_prefix is None:
-        force_prefix = {'g/s': 'k', 'Pa': 'M', 'W': 'M'}
+        force_prefix = _DEFAULT_FORCE_PREFIX
 
-    si_prefixes = ('Y', 'Z', 'E', 'P', 'T', 'G', 'M', 'k', '', 'm', '\u03BC', 'n', 'p', 'f', 'a', 'z', 'y')
     si_index = 8
     if value == 0:
         return 0
-    n_before_comma = log10(abs(value)) // 1 + 1
+    n_before_comma = floor(log10(abs(value))) + 1
     if force_prefix is not None and unit in force_prefix:
         prefix = force_prefix[unit]
-        x = si_index - si_prefixes.index(prefix)
+        x = si_index - _SI_PREFIX_INDICES[prefix]
     else:
         x = round(n_before_comma / 3 - 1)
         if (1 > x > -2):
             x = 0
         si_index -= x
-        prefix = si_prefixes[si_index]
+        prefix = _SI_PREFIXES[si_index]
     value *= 10 ** (-3 * x)
     decimals = int(digits - (n_before_comma - (3 * x)))
     format = min(digits, decimals)
@@ -63,45 +69,77 @@ def format_fancy_name(name: str) -> str:
 def format_attr_name(attr_name: str) -> str:
     return attr_name.replace('_', ' ').replace('.', ' ').title()
 
+
+# Matched by substring in this order, so the first matching key (not the longest) determines the unit
+_UNITS = {
+    'energy_source_ratio': 'kg/s',
+    'cc_prop_group_ratio': 'kg/s',
+    '_mass': 'kg',
+    '.mass': 'kg',
+    'specific_impulse': 's',
+    'pressure': 'Pa',
+    'temp': 'K',
+    'mass_flow': 'kg/s',
+    'heat_capacity_ratio': '-',
+    'specific_heat_capacity': 'J/kg/K',
+    'molar_mass': 'kg/mol',
+    'power_ratio': 'kg/s',
+    'specific_power': 'W/kg',
+    'time': 's',
+    'ratio': '-',
+    'velocity': 'm/s',
+    'delta_v': 'm/s',
+    'density': r'kg/m$^3$',
+    'power': 'W',
+    'thrust': 'N',
+    'specific_energy': 'J/kg',
+}
+
+
 def get_unit(attribute_name: str):
-    unit_dict = {
-        'energy_source_ratio': 'kg/s',
-        'cc_prop_group_ratio': 'kg/s',
-        '_mass': 'kg',
-        '.mass': 'kg',
-        'specific_impulse': 's',
-        'pressure': 'Pa',
-        'temp': 'K',
-        'mass_flow': 'kg/s',
-        'heat_capacity_ratio': '-',
-        'specific_heat_capacity': 'J/kg/K',
-        'molar_mass': 'kg/mol',
-        'power_ratio': 'kg/s',
-        'specific_power': 'W/kg',
-        'time': 's',
-        'ratio': '-',
-        'velocity': 'm/s',
-        'delta_v': 'm/s',
-        'density': r'kg/m$^3$',
-        'power': 'W',
-        'thrust': 'N',
-        'specific_energy': 'J/kg',
-    }
-    for key, value in unit_dict.items():
+    for key, value in _UNITS.items():
         if key in attribute_name:
             return value
 
 
+_SYMBOLS = {
+    'initial_mass': r'$m_0$',
+    'overall_specific_impulse': r'$I_{sp}$',
+    'power_mass': r'$m_{pow}$',
+    'combustion_chamber_pressure': r'$p_{cc}$',
+    'turbine_maximum_temperature': r'$(T_{tu})_{max}$',
+    'burn_time': r'$t_b$',
+    'change_in_velocity': r'$\Delta V$',
+    'ideal_delta_v': r'$\Delta V$',
+    'battery_specific_power': r'$\delta_{P}$',
+}
+
+
 def get_symbol(attribute_name: str):
-    attr_switcher = {
-        'initial_mass': r'$m_0$',
-        'overall_specific_impulse': r'$I_{sp}$',
-        'power_mass': r'$m_{pow}$',
-        'combustion_chamber_pressure': r'$p_{cc}$',
-        'turbine_maximum_temperature': r'$(T_{tu})_{max}$',
-        'burn_time': r'$t_b$',
-        'change_in_velocity': r'$\Delta V$',
-        'ideal_delta_v': r'$\Delta V$',
-        'battery_specific_power': r'$\delta_{P}$',
-    }
-    return attr_switcher[attribute_name]
+    return _SYMBOLS[attribute_name]
+
+
+class fast_cached_property:
+    """Lock-free replacement of functools.cached_property for single threaded use.
+
+    The value is stored in the instance __dict__ under the same name, so later lookups never reach this (non-data)
+    descriptor and cached values can be invalidated by popping them from __dict__, as EngineCycle.clear_iteration_cache
+    does. Unlike functools.cached_property (Python < 3.12) no per-property lock is acquired on the first evaluation.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.func(instance)
+        # Reached through super() from an overriding property, the value of the override is the one to cache
+        if getattr(type(instance), self.name, None) is self:
+            instance.__dict__[self.name] = value
+        return value
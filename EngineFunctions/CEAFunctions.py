@@ -1,30 +1,85 @@
-import numpy as np
+import rocketcea
 from rocketcea.cea_obj import CEA_Obj
 from rocketcea.cea_obj_w_units import CEA_Obj as CEA_Obj_w_units
 import re
-from typing import Optional
-from functools import wraps
-from numpy import logspace, interp
+import os
+import pickle
+from hashlib import sha1
+from pathlib import Path
+from typing import Optional, NamedTuple
+from functools import wraps, lru_cache
+from scipy.optimize import brentq
 from EngineFunctions.EmpiricalRelations import get_gas_generator_mmr_rp1
 
 
+# Variable names are regular expressions (e.g. 'M, [(]1/n[)]'), so they are located with a compiled pattern and not with
+# str.find. The values behind the name are tokenized without regex, see _parse_cea_values
+@lru_cache(maxsize=None)
+def _get_variable_pattern(variable_name: str) -> re.Pattern:
+    return re.compile(fr'(?<={variable_name}) +([\s0-9.-]+)+')
+
+
 def get_match_from_cea_output(variable_name: str, full_output: str) -> list:
-    match = re.findall(fr'(?<={variable_name}) +([\s0-9.-]+)+', full_output)
-    if match is None:
+    match = _get_variable_pattern(variable_name).findall(full_output)
+    if not match:
         raise ValueError(f'No match found in full output for [{variable_name}]')
     return match
 
 
+def _parse_cea_values(value_string: str) -> list[float]:
+    """Split a row of CEA output values into floats, in a single pass over its whitespace delimited tokens.
+
+    CEA writes powers of ten without an 'E', either appended to the mantissa (6.3637-1) or, when positive, as a separate
+    integer token (1.0105 0). Mantissas always contain a decimal point, which tells both apart."""
+    values = []
+    for token in value_string.split():
+        if '.' not in token:
+            if values:
+                values[-1] *= 10 ** int(token)
+            continue
+        sign_index = max(token.rfind('-'), token.rfind('+'))
+        if sign_index > 0:
+            values.append(float(token[:sign_index]) * 10 ** int(token[sign_index:]))
+        else:
+            values.append(float(token))
+    return values
+
+
 def get_values_from_cea_output(variable_name: str, column: int, full_output: str) -> float:
-    match = get_match_from_cea_output(variable_name=variable_name, full_output=full_output)
-    values = re.findall(r'[0-9.]+', match[0])
-    exponents = re.findall(r'[ -][0-9]+ ', match[0])
-    value = float(values[column])
-    if exponents:
-        exponent = float(exponents[column])
-        return value * 10 ** exponent
-    else:
-        return value
+    # Only the first occurrence is used, so the output is not scanned beyond it
+    match = _get_variable_pattern(variable_name).search(full_output)
+    if match is None:
+        raise ValueError(f'No match found in full output for [{variable_name}]')
+    return _parse_cea_values(match[1])[column]
+
+
+@lru_cache(maxsize=16)
+def _get_cea_obj(fuelName: str, oxName: str) -> CEA_Obj:
+    """Shared CEA_Obj per propellant combination, constructing one reads the thermo data of the propellants."""
+    return CEA_Obj(fuelName=fuelName, oxName=oxName)
+
+
+@lru_cache(maxsize=None)
+def _get_variables_pattern(variable_names: tuple[str, ...]) -> re.Pattern:
+    names = '|'.join(f'(?P<variable_{index}>{variable_name})' for index, variable_name in enumerate(variable_names))
+    return re.compile(fr'(?:{names}) +(?P<values>[\s0-9.-]+)')
+
+
+def get_values_dict_from_cea_output(regex_dict: dict, full_output: str) -> dict:
+    """Equal to get_values_from_cea_output for every (variable_name, column) in regex_dict, but reads the output in a
+    single scan that stops as soon as all variables are found."""
+    variable_names = tuple(variable_name for variable_name, _ in regex_dict.values())
+    group_keys = {f'variable_{index}': key for index, key in enumerate(regex_dict)}
+    values_dict = {}
+    for match in _get_variables_pattern(variable_names).finditer(full_output):
+        group_name = next(name for name in group_keys if match[name] is not None)
+        key = group_keys[group_name]
+        if key not in values_dict:
+            values_dict[key] = _parse_cea_values(match['values'])[regex_dict[key][1]]
+            if len(values_dict) == len(regex_dict):
+                return {key: values_dict[key] for key in regex_dict}
+    missing_keys = [key for key in regex_dict if key not in values_dict]
+    raise ValueError(f'No match found in full output for {[regex_dict[key][0] for key in missing_keys]}')
 
 
 def cea_u_in_si_units(func):
@@ -48,6 +103,43 @@ def cea_u_in_si_units(func):
     return wrapper_func
 
 
+# The on-disk cache is opt-in, set the environment variable ROCAT_CEA_DISK_CACHE=1 to enable it (worker processes
+# inherit it). Bump CEA_CACHE_VERSION whenever a cached function changes its results, old entries are then ignored.
+CEA_CACHE_DIR = Path(__file__).resolve().parent.parent / '.cea_cache'
+CEA_CACHE_VERSION = 2
+_CEA_DISK_CACHE_VARIABLE = 'ROCAT_CEA_DISK_CACHE'
+
+
+def cea_disk_cache(func):
+    """Persist the results of func in CEA_CACHE_DIR if the on-disk cache is enabled, keyed on CEA_CACHE_VERSION, the
+    rocketcea version, the function name and its (hashable) arguments, so CEA results survive between runs. Entries
+    are written atomically, so parallel processes can share the cache."""
+    @wraps(func)
+    def wrapper_func(*args, **kwargs):
+        if os.environ.get(_CEA_DISK_CACHE_VARIABLE) != '1':
+            return func(*args, **kwargs)
+        key_args = (CEA_CACHE_VERSION, rocketcea.__version__, args, sorted(kwargs.items()))
+        key = sha1(repr(key_args).encode()).hexdigest()
+        path = CEA_CACHE_DIR / f'{func.__name__}_{key}.pkl'
+        try:
+            with open(path, 'rb') as file:
+                return pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass
+        output = func(*args, **kwargs)
+        try:
+            CEA_CACHE_DIR.mkdir(exist_ok=True)
+            temp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(temp_path, 'wb') as file:
+                pickle.dump(output, file)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+        return output
+
+    return wrapper_func
+
+
 complete_regex_dict = {
     'c_star': ('CSTAR, M/SEC', 1),
     'C_F': (r'CF', 1),
@@ -61,14 +153,33 @@ complete_regex_dict = {
 
 @cea_u_in_si_units
 def get_cea_dict(fuelName: str, oxName: str, regex_dict: Optional[dict] = None, **kwargs):
-    cea = CEA_Obj(fuelName=fuelName, oxName=oxName)
+    cea = _get_cea_obj(fuelName=fuelName, oxName=oxName)
     full_output = cea.get_full_cea_output(**kwargs, short_output=1, pc_units='bar', output='siunits')
     if regex_dict is None:
         regex_dict = complete_regex_dict
-    return {'full_output': full_output} | {key: get_values_from_cea_output(variable_name=value[0],
-                                                                           column=value[1],
-                                                                           full_output=full_output)
-                                           for key, value in regex_dict.items()}
+    return {'full_output': full_output} | get_values_dict_from_cea_output(regex_dict=regex_dict,
+                                                                          full_output=full_output)
+
+
+class CEAArgs(NamedTuple):
+    """Hashable set of CEA inputs, used as key by the memoized CEA functions."""
+    Pc: float
+    MR: float
+    eps: Optional[float]
+    PcOvPe: Optional[float]
+    fuelName: str
+    oxName: str
+    frozen: int
+    frozenAtThroat: int
+
+
+@lru_cache(maxsize=4096)
+@cea_disk_cache
+def get_cea_dict_cached(cea_args: CEAArgs) -> dict:
+    """Memoized get_cea_dict with the complete regex_dict. The returned dict is shared between calls, do not change it.
+
+    Call clear_cea_cache() after adding new propellants to rocketcea."""
+    return get_cea_dict(**cea_args._asdict())
 
 
 def get_cea_dict_gg(**kwargs):
@@ -83,6 +194,14 @@ def get_cea_dict_gg(**kwargs):
                         **kwargs)
 
 
+@lru_cache(maxsize=1024)
+@cea_disk_cache
+def get_cea_dict_gg_cached(Pc: float, MR: float, fuelName: str, oxName: str, frozen: int, frozenAtThroat: int) -> dict:
+    """Memoized get_cea_dict_gg. The returned dict is shared between calls, do not change it."""
+    return get_cea_dict_gg(Pc=Pc, MR=MR, fuelName=fuelName, oxName=oxName, frozen=frozen,
+                           frozenAtThroat=frozenAtThroat)
+
+
 def get_gas_generator_mmr(temperature_limit: float, fuelName: str, oxName: str, Pc: float):
     if 'LH2' in fuelName:
         range_tuple = (.01, 6.)
@@ -90,17 +209,28 @@ def get_gas_generator_mmr(temperature_limit: float, fuelName: str, oxName: str,
         range_tuple = (.01, 3.)
     elif 'CH4' in fuelName:
         range_tuple = (.01, 4.)
-    cea_obj = CEA_Obj(fuelName=fuelName, oxName=oxName)
+    cea_obj = _get_cea_obj(fuelName=fuelName, oxName=oxName)
+    pc_psia = Pc / 6894.76  # Pa to PSIA
 
-    def get_t_comb(MR: float, Pc: float):
-        Pc /= 6894.76  # Pa to PSIA
-        t_comb_rankine = cea_obj.get_Tcomb(Pc=Pc, MR=MR)
+    def get_t_comb(MR: float):
+        t_comb_rankine = cea_obj.get_Tcomb(Pc=pc_psia, MR=MR)
         return t_comb_rankine / 1.8  # Rankine to Kelvin
 
-    mixture_ratios = np.linspace(*range_tuple, num=100)
-    combustion_temperatures = [get_t_comb(MR=mr, Pc=Pc) for mr in mixture_ratios]
-    cea_mmr = np.interp(temperature_limit, combustion_temperatures, mixture_ratios)
-    return cea_mmr
+    # Combustion temperature rises monotonically with the mixture ratio in the fuel rich range, so the mixture ratio is
+    # found with a root finder, clamped to the range bounds if the limit is outside the temperatures of the range.
+    min_mmr, max_mmr = range_tuple
+    if temperature_limit <= get_t_comb(MR=min_mmr):
+        return min_mmr
+    if temperature_limit >= get_t_comb(MR=max_mmr):
+        return max_mmr
+    return brentq(lambda mr: get_t_comb(MR=mr) - temperature_limit, min_mmr, max_mmr, xtol=1e-5)
+
+
+@lru_cache(maxsize=1024)
+@cea_disk_cache
+def get_gas_generator_mmr_cached(temperature_limit: float, fuelName: str, oxName: str, Pc: float) -> float:
+    """Memoized get_gas_generator_mmr, which runs CEA for every step of the root finder."""
+    return float(get_gas_generator_mmr(temperature_limit=temperature_limit, fuelName=fuelName, oxName=oxName, Pc=Pc))
 
 
 
@@ -111,3 +241,21 @@ def get_cea_chamber_dict(**kwargs):
     return get_cea_dict(regex_dict=regex_dict, **kwargs, eps=None)
 
 
+@lru_cache(maxsize=4096)
+@cea_disk_cache
+def get_cea_chamber_dict_cached(Pc: float, MR: float, fuelName: str, oxName: str, frozen: int,
+                                frozenAtThroat: int) -> dict:
+    """Memoized get_cea_chamber_dict. The returned dict is shared between calls, do not change it."""
+    return get_cea_chamber_dict(Pc=Pc, MR=MR, fuelName=fuelName, oxName=oxName, frozen=frozen,
+                                frozenAtThroat=frozenAtThroat)
+
+
+def clear_cea_cache():
+    """Clear the in-memory and on-disk CEA caches, required after adding new propellants to rocketcea."""
+    get_cea_dict_cached.cache_clear()
+    get_cea_chamber_dict_cached.cache_clear()
+    get_cea_dict_gg_cached.cache_clear()
+    get_gas_generator_mmr_cached.cache_clear()
+    _get_cea_obj.cache_clear()
+    for path in CEA_CACHE_DIR.glob('*.pkl'):
+        path.unlink(missing_ok=True)
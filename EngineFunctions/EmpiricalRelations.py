@@ -1,6 +1,7 @@
-from math import log, tanh, sqrt, pi
+from math import exp, log, log10, tanh, sqrt, pi
 import warnings
 from typing import Optional
+import numpy as np
 from scipy import constants
 
 
@@ -80,6 +81,45 @@ def get_hot_gas_convective_heat_transfer_coefficient(
             raise ValueError('Select proper mode for estimation of the hot gas convective heat transfer coefficient')
         return factor * 1.213 * mf ** .8 * di ** -1.8 * mu ** .2 * cp * pr ** -prandtl_exp * (t0 / tf) ** temp_exp
 
+
+def get_coolant_convective_heat_transfer_coeff_array(coolant_conductivity, characteristic_dimension, coolant_reynolds,
+                                                     coolant_prandtl_number, coolant_bulk_temp, wall_temp,
+                                                     mode: str = 'SiederTate',
+                                                     length_to_start_channel=None) -> np.ndarray:
+    """Vectorized get_coolant_convective_heat_transfer_coeff, inputs are broadcast so a whole channel sweep is
+    evaluated at once."""
+    return np.asarray(get_coolant_convective_heat_transfer_coeff(
+        coolant_conductivity=np.asarray(coolant_conductivity, dtype=float),
+        characteristic_dimension=np.asarray(characteristic_dimension, dtype=float),
+        coolant_reynolds=np.asarray(coolant_reynolds, dtype=float),
+        coolant_prandtl_number=np.asarray(coolant_prandtl_number, dtype=float),
+        coolant_bulk_temp=np.asarray(coolant_bulk_temp, dtype=float),
+        wall_temp=np.asarray(wall_temp, dtype=float),
+        mode=mode,
+        length_to_start_channel=None if length_to_start_channel is None else np.asarray(length_to_start_channel,
+                                                                                        dtype=float),
+    ))
+
+
+def get_hot_gas_convective_heat_transfer_coefficient_array(mass_flow, local_diameter, dynamic_viscosity,
+                                                           specific_heat_capacity, prandtl_number, stagnation_temp,
+                                                           film_temp, mode: str = 'ModifiedBartz',
+                                                           **bartz_inputs) -> np.ndarray:
+    """Vectorized get_hot_gas_convective_heat_transfer_coefficient, inputs are broadcast so a whole nozzle sweep is
+    evaluated at once. The optional [Bartz]-mode inputs are passed as keywords."""
+    return np.asarray(get_hot_gas_convective_heat_transfer_coefficient(
+        mass_flow=np.asarray(mass_flow, dtype=float),
+        local_diameter=np.asarray(local_diameter, dtype=float),
+        dynamic_viscosity=np.asarray(dynamic_viscosity, dtype=float),
+        specific_heat_capacity=np.asarray(specific_heat_capacity, dtype=float),
+        prandtl_number=np.asarray(prandtl_number, dtype=float),
+        stagnation_temp=np.asarray(stagnation_temp, dtype=float),
+        film_temp=np.asarray(film_temp, dtype=float),
+        mode=mode,
+        **{key: None if value is None else np.asarray(value, dtype=float) for key, value in bartz_inputs.items()},
+    ))
+
+
 def get_netto_average_wall_radiative_heat_flux(combustion_temperature: float, maximum_wall_temperature: float,
                                                thrust_chamber_wall_emissivity: float, hot_gas_emissivity: float
                                                ) -> float:
@@ -114,6 +154,10 @@ def get_gas_generator_mmr_rp1(temperature_limit: float) -> float:
     return (temperature_limit - 409.3) / 1550.3
 
 
+# Reynolds number above which .184 * Re ** -.2 exceeds .316 * Re ** -.25 (about 4.9e4, within the range of both)
+_BLASIUS_CROSSOVER_REYNOLDS = (.316 / .184) ** 20
+
+
 def get_friction_factor(roughness_height: float, reynolds_number: float, diameter: float) -> float:
     """Estimate friction factor for a circular pipe.
 
@@ -125,7 +169,8 @@ def get_friction_factor(roughness_height: float, reynolds_number: float, diamete
     D = diameter
     re = reynolds_number
     rr = e / D
-    fds = {}
+    # Largest friction factor of the applicable correlations
+    fd = None
 
     # Ranges overlap such that there is a smooth transition (See also ISBN: 9780081024874)
     if 3000 < re and 0 < rr <= .05:
@@ -133,25 +178,29 @@ def get_friction_factor(roughness_height: float, reynolds_number: float, diamete
             warnings.warn(
                 'Explicit Colebrook Correlation for Friction Factor used with Reynolds number higher than verified range (above 1e8)')
         # Explicit Colebrook Correlation by Fang et al 2011
-        fd1 = 1.1613 * (log(.234 * rr ** 1.1007 - 60.525 * re ** -1.1105 + 56.291 * re ** 1.0712, 10)) ** -2
-        fds['Fang'] = fd1
+        # Both Reynolds powers share a single logarithm
+        log_re = log(re)
+        fd = 1.1613 * log10(.234 * rr ** 1.1007 - 60.525 * exp(-1.1105 * log_re) + 56.291 * exp(1.0712 * log_re)) ** -2
     if rr > 0:
         # Fall back to Nikuradse correlation for turbulent flow in non-smooth pipes
-        fd2 = 8 * (2.457 * log(3.707 * (1 / rr))) ** -2
-        fds['Nikuradse'] = fd2
+        fd2 = 8 * (2.457 * log(3.707 / rr)) ** -2
+        fd = fd2 if fd is None or fd2 > fd else fd
     if 1e7 > re > 1e3:
-        # Fall back to Blasius equation for turbulent flow in smooth pipes
-        fd3 = .184 * re ** -.2
-        fds['BlasiusHigh'] = fd3
-    if 1e5 > re > 1000:
-        # Blasius again
-        fd4 = .316 * re ** -.25
-        fds['BlasiusLow'] = fd4
+        # Fall back to Blasius equation for turbulent flow in smooth pipes. Both Blasius forms overlap between Reynolds
+        # numbers of 1e3 and 1e5, where only the larger one can contribute to the maximum
+        if re < _BLASIUS_CROSSOVER_REYNOLDS:
+            fd3 = .316 * re ** -.25
+        else:
+            fd3 = .184 * re ** -.2
+        fd = fd3 if fd is None or fd3 > fd else fd
     if 3000 > re > 0:
         # Fall back to Hagen-Pouseille law for internal laminar flow
         fd5 = 64 / re
-        fds['Laminar'] = fd5
-    return max(fds.values())
+        fd = fd5 if fd is None or fd5 > fd else fd
+    if fd is None:
+        raise ValueError(f'No friction factor correlation applies to Reynolds number [{re}] and relative roughness '
+                         f'[{rr}]')
+    return fd
 
 
 def get_roughness_correction(bulk_prandtl_number: float, bulk_reynolds_number: float, roughness_height: float,
@@ -183,3 +232,19 @@ def get_fin_correction(convective_heat_transfer_coeff: float, fin_thickness: flo
     eta = tanh(b) / b
     c_fin = (w_c + eta * 2 * ht_c) / (w_c + th_fin)
     return c_fin
+
+
+def get_fin_correction_array(convective_heat_transfer_coeff, fin_thickness, channel_height, channel_width,
+                             wall_conductivity) -> np.ndarray:
+    """Vectorized get_fin_correction, inputs are broadcast so all channel stations are evaluated at once. The fin
+    efficiency tanh(b)/b is taken as its limit of 1 where b is zero."""
+    h_c = np.asarray(convective_heat_transfer_coeff, dtype=float)
+    th_fin = np.asarray(fin_thickness, dtype=float)
+    ht_c = np.asarray(channel_height, dtype=float)
+    w_c = np.asarray(channel_width, dtype=float)
+    k = np.asarray(wall_conductivity, dtype=float)
+    b = np.sqrt(2 * h_c * th_fin / k) / th_fin * ht_c
+    with np.errstate(invalid='ignore', divide='ignore'):
+        eta = np.where(b == 0, 1., np.tanh(b) / b)
+    c_fin = (w_c + eta * 2 * ht_c) / (w_c + th_fin)
+    return c_fin
@@ -1,7 +1,8 @@
 from scipy.constants import g, gas_constant, Boltzmann, pi, R
-from typing import Optional
-from scipy.optimize import fsolve
+from scipy.optimize import brentq
+from typing import Optional, NamedTuple
 from math import sqrt, isclose
+from functools import lru_cache
 import numpy as np
 import warnings
 
@@ -9,6 +10,25 @@ import warnings
 # from sympy import nsolve, solve, Symbol, sqrt
 
 
+class GammaConstants(NamedTuple):
+    """Exponents and factors of the ideal rocket theory relations that only depend on the heat capacity ratio y."""
+    area_exponent: float  # (y + 1) / (2 * (y - 1))
+    pressure_exponent: float  # (y - 1) / y
+    velocity_factor: float  # 2 * y / (y - 1)
+    density_exponent: float  # 2 / y
+    kerckhove: float
+
+
+@lru_cache(maxsize=256)
+def get_gamma_constants(heat_capacity_ratio: float) -> GammaConstants:
+    y = heat_capacity_ratio
+    return GammaConstants(area_exponent=(y + 1) / (2 * (y - 1)),
+                          pressure_exponent=(y - 1) / y,
+                          velocity_factor=2 * y / (y - 1),
+                          density_exponent=2 / y,
+                          kerckhove=get_kerckhove(y))
+
+
 def get_mass_flow(chamber_pressure: float, throat_area: float, chamber_temperature: float, molar_mass: float,
                   heat_capacity_ratio: float) -> float:
     r = gas_constant / molar_mass
@@ -18,20 +38,21 @@ def get_mass_flow(chamber_pressure: float, throat_area: float, chamber_temperatu
 def get_expansion_ratio(mach_number: float, heat_capacity_ratio: float):
     m = mach_number
     y = heat_capacity_ratio
-    return ((y + 1) / 2) ** -((y + 1) / (2 * (y - 1))) * ((1 + (y - 1) / 2 * m ** 2) ** ((y + 1) / (2 * (y - 1)))) / m
+    area_exponent = get_gamma_constants(y).area_exponent
+    return ((y + 1) / 2) ** -area_exponent * ((1 + (y - 1) / 2 * m * m) ** area_exponent) / m
 
 
+@lru_cache(maxsize=256)
 def get_kerckhove(heat_capacity_ratio: float) -> float:
     y = heat_capacity_ratio
-    return np.sqrt(y) * (2 / (y + 1)) ** ((y + 1) / (2 * (y - 1)))
+    return sqrt(y) * (2 / (y + 1)) ** ((y + 1) / (2 * (y - 1)))
 
 
 def get_expansion_ratio_from_p_ratio(pressure_ratio: float, heat_capacity_ratio: float) -> float:
-    y = heat_capacity_ratio
-    G = get_kerckhove(y)
-    pe_pc = pressure_ratio ** -1
-    p1 = (2 * y / (y - 1)) * pe_pc ** (2 / y) * (1 - pe_pc ** ((y - 1) / y))
-    return float(G / np.sqrt(p1))
+    constants = get_gamma_constants(heat_capacity_ratio)
+    pe_pc = 1 / pressure_ratio
+    p1 = constants.velocity_factor * pe_pc ** constants.density_exponent * (1 - pe_pc ** constants.pressure_exponent)
+    return constants.kerckhove / sqrt(p1)
 
 
 def get_pressure_ratio(expansion_ratio: float, heat_capacity_ratio: float, sympy_solve: bool = False) -> float:
@@ -48,22 +69,55 @@ def get_pressure_ratio(expansion_ratio: float, heat_capacity_ratio: float, sympy
         return nsolve(equation, pr, 100)
 
 
+@lru_cache(maxsize=4096)
 def get_pressure_ratio_fsolve(expansion_ratio: float, heat_capacity_ratio: float,
-                              guess: Optional[float] = None) -> float:
-    def func(x):
-        eps = float(get_expansion_ratio_from_p_ratio(x, heat_capacity_ratio))
-        return np.array(eps - expansion_ratio, dtype=float)
-
-    if guess is None:
-        guess = 10 * expansion_ratio
-    solution = float(fsolve(func, np.array(guess, dtype=float))[0])
-    return solution
-    # # Check
-    # if check:
-    #     if not np.isclose(func(solution), [0.0]):
-    #         message = f'Found pressure ratio does not match given expansion ratio. ' \
-    #                   f'Given:[{expansion_ratio}], Found:[{get_expansion_ratio(solution, heat_capacity_ratio)}]'
-    #         raise ValueError(message)
+                              guess: Optional[float] = None, max_iterations: int = 50) -> float:
+    """Return the pressure ratio (pc/pe) of the supersonic nozzle flow for the given expansion ratio.
+
+    Solved with Newton-Raphson on the analytic derivative of the expansion ratio w.r.t. the pressure ratio, so unlike
+    scipy's fsolve no evaluations are spent on a finite difference Jacobian. Steps are halved (Armijo backtracking) when
+    they leave the supersonic branch or do not decrease the residual sufficiently.
+    """
+    # Same relation as get_expansion_ratio_from_p_ratio, with the constants that only depend on y evaluated once
+    y = heat_capacity_ratio
+    constants = get_gamma_constants(y)
+    G = constants.kerckhove
+    factor = constants.velocity_factor
+    exponent1 = constants.density_exponent
+    exponent2 = constants.pressure_exponent
+    critical_pressure_ratio = ((y + 1) / 2) ** (y / (y - 1))
+
+    def get_residual_and_derivative(pressure_ratio: float) -> tuple[float, float]:
+        pe_pc = 1 / pressure_ratio
+        x1 = pe_pc ** exponent1
+        x2 = pe_pc ** exponent2
+        p1 = factor * x1 * (1 - x2)
+        dp1_dpe_pc = factor * x1 / pe_pc * (exponent1 * (1 - x2) - exponent2 * x2)
+        eps = G / sqrt(p1)
+        deps_dpr = .5 * eps / p1 * dp1_dpe_pc * pe_pc ** 2
+        return eps - expansion_ratio, deps_dpr
+
+    # Plain Newton steps: Halley steps (with the analytic second derivative) needed as many residual evaluations here
+    pr = 10 * expansion_ratio if guess is None else float(guess)
+    residual, derivative = get_residual_and_derivative(pr)
+    for _ in range(max_iterations):
+        step = -residual / derivative
+        fraction = 1.
+        for _ in range(60):
+            new_pr = pr + fraction * step
+            if new_pr > critical_pressure_ratio:
+                new_residual, new_derivative = get_residual_and_derivative(new_pr)
+                if abs(new_residual) <= (1 - 1e-4 * fraction) * abs(residual):
+                    break
+            fraction *= .5
+        else:
+            raise ValueError(f'No supersonic pressure ratio found for expansion ratio [{expansion_ratio}]')
+        if abs(new_pr - pr) <= 1e-12 * new_pr:
+            return new_pr
+        pr, residual, derivative = new_pr, new_residual, new_derivative
+    warnings.warn(f'Pressure ratio for expansion ratio [{expansion_ratio}] did not converge within '
+                  f'[{max_iterations}] iterations')
+    return pr
 
 
 def get_characteristic_velocity(molar_mass: float, chamber_temperature: float,
@@ -75,8 +129,8 @@ def get_characteristic_velocity(molar_mass: float, chamber_temperature: float,
 
 def get_ideal_thrust_coefficient(pressure_ratio: float, heat_capacity_ratio: float) -> float:
     pe_pc = 1 / pressure_ratio
-    y = heat_capacity_ratio
-    return get_kerckhove(y) * sqrt(2 * y / (y - 1) * (1 - pe_pc ** ((y - 1) / y)))
+    constants = get_gamma_constants(heat_capacity_ratio)
+    return constants.kerckhove * sqrt(constants.velocity_factor * (1 - pe_pc ** constants.pressure_exponent))
 
 
 def get_thrust_coefficient_from_ideal(ideal_thrust_coefficient: float, chamber_pressure: float, exit_pressure: float,
@@ -125,9 +179,10 @@ def get_throat_area(molar_mass: float, heat_capacity_ratio: float, chamber_tempe
 
 def get_exhaust_velocity(molar_mass: float, heat_capacity_ratio: float, chamber_temperature: float,
                          pressure_ratio: float) -> float:
-    y = heat_capacity_ratio
+    constants = get_gamma_constants(heat_capacity_ratio)
     pe_pc = 1 / pressure_ratio
-    return sqrt(2 * y / (y - 1) * gas_constant / molar_mass * chamber_temperature * (1 - pe_pc ** ((y - 1) / y)))
+    return sqrt(constants.velocity_factor * gas_constant / molar_mass * chamber_temperature
+                * (1 - pe_pc ** constants.pressure_exponent))
 
 
 def is_choked(pressure_ratio: float, heat_capacity_ratio: float):
@@ -138,7 +193,7 @@ def is_choked(pressure_ratio: float, heat_capacity_ratio: float):
 
 def get_isp_simple_vac(molar_mass: float, heat_capacity_ratio: float, chamber_temperature: float,
                        chamber_pressure: float, expansion_ratio: float, complete: bool = False):
-    pr = get_pressure_ratio(expansion_ratio, heat_capacity_ratio)
+    pr = get_pressure_ratio_fsolve(expansion_ratio, heat_capacity_ratio)
     c_star = get_characteristic_velocity(molar_mass, chamber_temperature, heat_capacity_ratio)
     c_f = get_thrust_coefficient(pr, heat_capacity_ratio, expansion_ratio, chamber_pressure)
     i_sp = get_specific_impulse(c_f, c_star)
@@ -147,6 +202,24 @@ def get_isp_simple_vac(molar_mass: float, heat_capacity_ratio: float, chamber_te
     return i_sp
 
 
+def get_isp_simple_vac_array(molar_mass, heat_capacity_ratio, chamber_temperature, expansion_ratio) -> np.ndarray:
+    """Vectorized get_isp_simple_vac, inputs are broadcast so a grid of design points is evaluated at once.
+
+    The chamber pressure of get_isp_simple_vac is left out, since it does not affect the ideal vacuum specific impulse.
+    Only the pressure ratio is still solved point by point, with get_pressure_ratio_fsolve, once for every unique pair
+    of expansion ratio and heat capacity ratio.
+    """
+    mm, y, t_c, eps = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in
+                                            (molar_mass, heat_capacity_ratio, chamber_temperature, expansion_ratio)))
+    unique_pairs, inverse = np.unique(np.stack((eps.ravel(), y.ravel())), axis=1, return_inverse=True)
+    unique_prs = np.array([get_pressure_ratio_fsolve(float(eps_i), float(y_i)) for eps_i, y_i in unique_pairs.T])
+    pr = unique_prs[inverse].reshape(eps.shape)
+    kerckhove = np.sqrt(y) * (2 / (y + 1)) ** ((y + 1) / (2 * (y - 1)))
+    c_star = np.sqrt(gas_constant / mm * t_c) / kerckhove
+    c_f = kerckhove * np.sqrt(2 * y / (y - 1) * (1 - pr ** -((y - 1) / y)))
+    return c_f * c_star / g
+
+
 def get_mp_from_isp_itot(total_impulse: float, specific_impulse: float) -> float:
     # Specific Impulse (I_sp) in s, Total Impulse (I_tot) in Ns, g0 in m/s2
     # Assumption: Thrust is constant
@@ -171,29 +244,66 @@ def get_sonic_velocity(heat_capacity_ratio: float, molar_mass: float, temperatur
     return sqrt(heat_capacity_ratio * (R / molar_mass) * temperature)
 
 
+@lru_cache(maxsize=1024)
 def get_local_mach(local_area_ratio, heat_capacity_ratio, is_subsonic=False):
     if isclose(local_area_ratio, 1, rel_tol=1e-12):
         return 1
     p, q, r, a, s, r2, x0 = get_mach_b4wind_factors(local_area_ratio, is_subsonic, heat_capacity_ratio)
+    final = newton_raphson_plus(x0, p, q, r)
+    return sqrt(final) ** s
+
 
-    # Method adapted to Python from method by Karl Kneile from NASA used in B4Wind
-    def get_f_and_derivs(x):
-        f = (p + q * x) ** (1 / q) - r * x
-        df = (p + q * x) ** (1 / q - 1) - r
-        ddf = p * ((p + q * x) ** (1 / q - 2))
-        return f, df, ddf
-
-    def newton_raphson_plus(x):
-        while True:
-            f, df, ddf = get_f_and_derivs(x)
-            xnew = x - 2 * f / (df - sqrt(df ** 2 - 2 * f * ddf))
-            if abs(xnew - x) / xnew < .001:
+def get_local_mach_array(local_area_ratio, heat_capacity_ratio, is_subsonic=False, max_iterations: int = 50
+                         ) -> np.ndarray:
+    """Vectorized get_local_mach for arrays of local area ratios (e.g. all stations of a nozzle) on one branch.
+
+    All stations are iterated together with the Newton-Raphson step of newton_raphson_plus, stations stop changing once
+    converged. Area ratios of one are masked to Mach 1 afterwards instead of branching per station. Warns if not all
+    stations converged within max_iterations.
+    """
+    a_at, y = np.broadcast_arrays(np.asarray(local_area_ratio, dtype=float),
+                                  np.asarray(heat_capacity_ratio, dtype=float))
+    is_throat = np.isclose(a_at, 1, rtol=1e-12, atol=0)
+    p, q, r, a, s, r2, x = _get_b4wind_factors(a_at, is_subsonic, y, root=np.sqrt)
+    exponent = 1 / q - 2
+    converged = is_throat.copy()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for _ in range(max_iterations):
+            x_new = _newton_raphson_plus_step(x, p, q, r, exponent, root=np.sqrt)
+            newly_converged = ~converged & (np.abs(x_new - x) / x_new < .001)
+            x = np.where(converged, x, x_new)
+            converged |= newly_converged
+            if converged.all():
                 break
-            x = xnew
-        return xnew
+        else:
+            warnings.warn(f'get_local_mach_array did not converge within [{max_iterations}] iterations for '
+                          f'[{np.count_nonzero(~converged)}] of [{converged.size}] area ratios')
+        mach = np.sqrt(x) ** s
+    return np.where(is_throat, 1., mach)
 
-    final = newton_raphson_plus(x0)
-    return sqrt(final) ** s
+
+def newton_raphson_plus(x, p, q, r):
+    """Solve (p + q * x) ** (1 / q) - r * x = 0 for x (M**2 or M**-2) with a second order Newton-Raphson method.
+
+    Method adapted to Python from method by Karl Kneile from NASA used in B4Wind. The function and both derivatives
+    share a single power evaluation per iteration.
+    """
+    exponent = 1 / q - 2
+    while True:
+        xnew = _newton_raphson_plus_step(x, p, q, r, exponent)
+        if abs(xnew - x) / xnew < .001:
+            return xnew
+        x = xnew
+
+
+def _newton_raphson_plus_step(x, p, q, r, exponent, root=sqrt):
+    """Single step of newton_raphson_plus, also works for numpy arrays if root is np.sqrt."""
+    base = p + q * x
+    power = base ** exponent
+    ddf = p * power
+    df = power * base - r
+    f = power * base * base - r * x
+    return x - 2 * f / (df - root(df ** 2 - 2 * f * ddf))
 
 
 def get_approx_mach(local_area_ratio, is_subsonic=False, heat_capacity_ratio=1.14):
@@ -203,7 +313,13 @@ def get_approx_mach(local_area_ratio, is_subsonic=False, heat_capacity_ratio=1.1
     return x0 ** (s * .5)
 
 
+@lru_cache(maxsize=1024)
 def get_mach_b4wind_factors(local_area_ratio, is_subsonic=False, heat_capacity_ratio=1.14):
+    return _get_b4wind_factors(local_area_ratio, is_subsonic, heat_capacity_ratio)
+
+
+def _get_b4wind_factors(local_area_ratio, is_subsonic, heat_capacity_ratio, root=sqrt):
+    """Factors of get_mach_b4wind_factors, also works for numpy arrays of area ratios if root is np.sqrt."""
     a_at = local_area_ratio
     y = heat_capacity_ratio
     p = 2 / (y + 1)
@@ -213,7 +329,7 @@ def get_mach_b4wind_factors(local_area_ratio, is_subsonic=False, heat_capacity_r
     else:
         r, a, s = a_at ** (2 * q / p), q ** (1 / p), -1
     r2 = (r - 1) / (2 * a)
-    x0 = 1 / ((1 + r2) + sqrt(r2 * (r2 + 2)))  # Initial Guess to start iteration of M**2 or M**-2 (sub- or super-sonic)
+    x0 = 1 / ((1 + r2) + root(r2 * (r2 + 2)))  # Initial Guess to start iteration of M**2 or M**-2 (sub- or super-sonic)
     if not is_subsonic:
         p, q = q, p
     return p, q, r, a, s, r2, x0
@@ -222,25 +338,10 @@ def get_mach_b4wind_factors(local_area_ratio, is_subsonic=False, heat_capacity_r
 def get_local_mach_nasa(local_area_ratio, is_subsonic=False, heat_capacity_ratio=1.14):
     """Returns Mach, given local area ratio and heat capacity ratio.
 
-    Very unstable version, but simple and quick"""
-    ar = local_area_ratio
-    y = heat_capacity_ratio
-    ym1 = y - 1
-    yp1 = y + 1
-    f1 = yp1 / (2.0 * ym1)
-    ar0 = 2.2  # Initial Guess for area ratio
-    M0 = .3 if is_subsonic else 2.2  # Initial guess for mach
-    Mn = M0 + .05
-    iterations = 0
-    while abs(ar - ar0) > .00001 or not iter_started:
-        iter_started = True
-        f2 = 1 + .5 * ym1 * Mn ** 2
-        arn = (Mn * f2 ** (-1 * f1) * (yp1 / 2) ** f1) ** -1
-        deriv = (arn - ar0) / (Mn - M0)
-        ar0 = arn
-        M0 = Mn
-        Mn = M0 + (ar - ar0) / deriv
-        iterations += 1
-        if iterations > 10:
-            return 1
-    return M0
+    Simple and quick: the area-Mach relation is bracketed on the subsonic or supersonic branch and solved with Brent's
+    method."""
+    if local_area_ratio <= 1:
+        return 1
+    bracket = (1e-6, 1) if is_subsonic else (1, 100)
+    return brentq(lambda mach: get_expansion_ratio(mach, heat_capacity_ratio) - local_area_ratio, *bracket,
+                  xtol=1e-6)
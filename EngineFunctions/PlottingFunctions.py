@@ -1,3 +1,4 @@
+import numpy as np
 from EngineCycles.Abstract.EngineCycle import EngineCycle
 from EngineCycles.ElectricPumpCycle import ElectricPumpCycle
 from EngineCycles.GasGeneratorCycle import GasGeneratorCycle
@@ -15,18 +16,20 @@ def get_si_prefix_power(si_prefix: str):
         raise KeyError(f'Use a valid SI-prefix: {list(si_prefix_powers.keys())}')
 
 
+_AXIS_NAMES = {
+    'power_ratio': r'$\frac{\mathrm{Power\ Mass}}{\mathrm{Burn\ Time}}$',
+    'anti_power_ratio': r'$\frac{\mathrm{Anti\ Power\ Mass}}{\mathrm{Burn\ Time}}$',
+    'initial_mass_ratio': r'$\frac{\mathrm{Initial\ Mass}}{\mathrm{Burn\ Time}}$',
+    'turbine.inlet_flow_state.specific_heat_capacity': r'Turbine Specific Heat Capacity',
+    'turbine.inlet_flow_state.heat_capacity_ratio': r'Turbine Heat Capacity Ratio',
+    'energy_source_ratio': r'$\frac{\mathrm{Energy\ Source\ Mass}}{\mathrm{Burn\ Time}}$',
+    'cc_prop_group_ratio': r'$\frac{\mathrm{CC\ Prop.\ Group\ Mass}}{\mathrm{Burn\ Time}}$',
+    'tanks_plus_propellant': r'Tanks + Propellant Mass',
+}
+
+
 def make_axis_string(attribute_name: str, si_prefix: str):
-    format_switcher = {
-        'power_ratio': r'$\frac{\mathrm{Power\ Mass}}{\mathrm{Burn\ Time}}$',
-        'anti_power_ratio': r'$\frac{\mathrm{Anti\ Power\ Mass}}{\mathrm{Burn\ Time}}$',
-        'initial_mass_ratio': r'$\frac{\mathrm{Initial\ Mass}}{\mathrm{Burn\ Time}}$',
-        'turbine.inlet_flow_state.specific_heat_capacity': r'Turbine Specific Heat Capacity',
-        'turbine.inlet_flow_state.heat_capacity_ratio': r'Turbine Heat Capacity Ratio',
-        'energy_source_ratio': r'$\frac{\mathrm{Energy\ Source\ Mass}}{\mathrm{Burn\ Time}}$',
-        'cc_prop_group_ratio': r'$\frac{\mathrm{CC\ Prop.\ Group\ Mass}}{\mathrm{Burn\ Time}}$',
-        'tanks_plus_propellant': r'Tanks + Propellant Mass',
-    }
-    name = format_switcher[attribute_name] if attribute_name in format_switcher else format_attr_name(attribute_name)
+    name = _AXIS_NAMES.get(attribute_name) or format_attr_name(attribute_name)
     unit = get_unit(attribute_name)
     return f'{name} [{si_prefix}{unit}]'
 
@@ -40,46 +43,56 @@ def get_class_acronym(EngineClass: EngineCycle):
         return 'OE'
 
 
+_CLASS_COLOR_MARKERS = {
+    GasGeneratorCycle: ('blue', '^'),
+    ElectricPumpCycle: ('green', 's'),
+    OpenExpanderCycle: ('red', 'o'),
+}
+
+
 def get_class_color_marker(EngineClass: EngineCycle):
-    color_dict = {
-        GasGeneratorCycle: ('blue', '^'),
-        ElectricPumpCycle: ('green', 's'),
-        OpenExpanderCycle: ('red', 'o'),
-    }
-    return color_dict[EngineClass]
+    return _CLASS_COLOR_MARKERS[EngineClass]
+
+
+_CLASSES_BY_NAME = {EngineClass.__name__: EngineClass
+                    for EngineClass in (ElectricPumpCycle, GasGeneratorCycle, OpenExpanderCycle)}
+
 
 def get_class_from_name(engine_class_name: str) -> EngineCycle:
-    cycles = [ElectricPumpCycle, GasGeneratorCycle, OpenExpanderCycle]
-    class_dict = {EngineClass.__name__: EngineClass for EngineClass in cycles}
-    return class_dict[engine_class_name]
+    return _CLASSES_BY_NAME[engine_class_name]
+
+
+def adjust_values_to_prefix(values: list, si_prefix: str) -> np.ndarray:
+    factor = 10. ** get_si_prefix_power(si_prefix)
+    return np.asarray(values, dtype=float) * factor
 
-def adjust_values_to_prefix(values: list, si_prefix: str):
-    power = get_si_prefix_power(si_prefix)
-    return [val * 10 ** power for val in values]
 
+def adjust_joule_to_watt_hour(values: list) -> np.ndarray:
+    return np.asarray(values, dtype=float) / 3600
 
-def adjust_joule_to_watt_hour(values: list):
-    return [val /3600 for val in values]
+
+_LEGEND_NAMES = {
+    'turbine.inlet_flow_state.specific_heat_capacity': r'Turbine $c_p$',
+    'turbine.inlet_flow_state.heat_capacity_ratio': r'Turbine $\gamma$',
+    'tanks_plus_pressurant': r'Tanks + Pressurant',
+}
 
 
 def format_attr_name_for_legend(attribute: str):
-    switcher = {
-        'turbine.inlet_flow_state.specific_heat_capacity': r'Turbine $c_p$',
-        'turbine.inlet_flow_state.heat_capacity_ratio': r'Turbine $\gamma$',
-        'tanks_plus_pressurant': r'Tanks + Pressurant',
-    }
-    if attribute in switcher:
-        return switcher[attribute]
+    if attribute in _LEGEND_NAMES:
+        return _LEGEND_NAMES[attribute]
     else:
         return format_attr_name(attr_name=attribute)
 
 
+_AXIS_LABEL_NAMES = {
+    'turbine.inlet_flow_state.specific_heat_capacity': r'Turbine Specific Heat Capacity',
+    'turbine.inlet_flow_state.heat_capacity_ratio': r'Turbine Heat Capacity Ratio',
+}
+
+
 def format_attr_name_for_axis_label(attribute: str):
-    switcher = {
-        'turbine.inlet_flow_state.specific_heat_capacity': r'Turbine Specific Heat Capacity',
-        'turbine.inlet_flow_state.heat_capacity_ratio': r'Turbine Heat Capacity Ratio',
-    }
-    if attribute in switcher:
-        return switcher[attribute]
+    if attribute in _AXIS_LABEL_NAMES:
+        return _AXIS_LABEL_NAMES[attribute]
     else:
         return format_attr_name(attr_name=attribute)
@@ -2,9 +2,15 @@ from EngineCycles.Abstract.EngineCycle import EngineCycle
 from EngineCycles.GasGeneratorCycle import GasGeneratorCycle
 from EngineCycles.ElectricPumpCycle import ElectricPumpCycle
 from dataclasses import dataclass
+from math import isclose
+import warnings
 from scipy import constants
 from KwakFix.KwakFixComponents import KwakBattery, KwakPump, KwakTank, KwakPropellant
 from EngineComponents.Abstract.FlowState import ManualFlowState
+from EngineFunctions.BaseFunctions import fast_cached_property
+
+_G0 = constants.g
+_MAX_REPLICATION_ITERATIONS = 20
 
 
 @dataclass
@@ -18,7 +24,7 @@ class KwakEngineCycle(EngineCycle):
     def calc_pump_outlet_pressures(self):
         pass
 
-    @property
+    @fast_cached_property
     def pressurant_initial_state(self):
         super_state = super().pressurant_initial_state
         return ManualFlowState(propellant_name=super_state.propellant_name,
@@ -29,21 +35,21 @@ class KwakEngineCycle(EngineCycle):
                                _molar_mass=self.pressurant_molar_mass,
                                _heat_capacity_ratio=self.pressurant_heat_capacity_ratio, )
 
-    @property
+    @fast_cached_property
     def oxidizer(self):
         return KwakPropellant(main_flow_state=self.oxidizer_main_flow_state,
                               burn_time=self.burn_time,
                               margin_factor=self.propellant_margin_factor,
                               manual_propellant_density=self.manual_oxidizer_density)
 
-    @property
+    @fast_cached_property
     def fuel(self):
         return KwakPropellant(main_flow_state=self.fuel_main_flow_state,
                               burn_time=self.burn_time,
                               margin_factor=self.propellant_margin_factor,
                               manual_propellant_density=self.manual_fuel_density)
 
-    @property
+    @fast_cached_property
     def oxidizer_tank(self):
         return KwakTank(inlet_flow_state=self.oxidizer_main_flow_state,
                         propellant_volume=self.oxidizer.volume,
@@ -54,7 +60,7 @@ class KwakEngineCycle(EngineCycle):
                         safety_factor=self.tanks_structural_factor,
                         manual_propellant_density=self.manual_oxidizer_density, )
 
-    @property
+    @fast_cached_property
     def fuel_tank(self):
         return KwakTank(inlet_flow_state=self.fuel_main_flow_state,
                         propellant_volume=self.fuel.volume,
@@ -65,7 +71,7 @@ class KwakEngineCycle(EngineCycle):
                         safety_factor=self.tanks_structural_factor,
                         manual_propellant_density=self.manual_fuel_density, )
 
-    @property
+    @fast_cached_property
     def oxidizer_pump(self):
         return KwakPump(inlet_flow_state=self.oxidizer_tank.outlet_flow_state,
                         expected_outlet_pressure=self.oxidizer_pump_outlet_pressure,
@@ -73,7 +79,7 @@ class KwakEngineCycle(EngineCycle):
                         specific_power=self.oxidizer_pump_specific_power,
                         manual_propellant_density=self.manual_oxidizer_density, )
 
-    @property
+    @fast_cached_property
     def fuel_pump(self):
         return KwakPump(inlet_flow_state=self.fuel_tank.outlet_flow_state,
                         expected_outlet_pressure=self.fuel_pump_outlet_pressure,
@@ -87,10 +93,15 @@ class KwakFixGasGeneratorCycle(GasGeneratorCycle, KwakEngineCycle):
     _iteration_done: bool = False
     _exhaust_thrust_contribution: float = .01
 
+    _iteration_state_attributes = GasGeneratorCycle._iteration_state_attributes | {'mf', 'mo', '_iteration_done'}
+
     def set_initial_values(self):
         super().set_initial_values()
-        r = self.gg_base_flow_state.specific_gas_constant
-        self.gg_base_flow_state._density = self.gg_pressure / (r * self.turbine_maximum_temperature)
+        gg_base_flow_state = self.gg_base_flow_state
+        density = self.gg_pressure / (gg_base_flow_state.specific_gas_constant * self.turbine_maximum_temperature)
+        # Replaced instead of changed in place, so a flow state passed in by the user is left untouched and the
+        # components cached from the old density are cleared
+        self.gg_base_flow_state = gg_base_flow_state.fast_replace(_density=density)
 
     def iterate_flow(self):
         if not self.replication_mode:
@@ -105,12 +116,23 @@ class KwakFixGasGeneratorCycle(GasGeneratorCycle, KwakEngineCycle):
             self.mf = self.main_fuel_flow - m_gg_f
             self._iterative_turbine_mass_flow = m_tu
             self._iteration_done = True
-            print()
         else:
+            # Fixed-point update, evaluating the required turbine mass flow once per iteration. Every third iterate is
+            # replaced by its Aitken extrapolation.
             self._iterative_turbine_mass_flow = self.turbine_mass_flow_initial_guess
-            while self.turbine_flow_error_larger_than_accuracy():
-                self.print_verbose_iteration_message()
-                self._iterative_turbine_mass_flow = self.turbine.mass_flow_required
+            recent_mass_flows = [self._iterative_turbine_mass_flow]
+            for _ in range(_MAX_REPLICATION_ITERATIONS):
+                mass_flow_required = self.turbine.mass_flow_required
+                if isclose(self.turbine_mass_flow, mass_flow_required, rel_tol=self.iteration_accuracy):
+                    break
+                self.print_verbose_iteration_message(actual=self.turbine_mass_flow, required=mass_flow_required)
+                recent_mass_flows.append(mass_flow_required)
+                if len(recent_mass_flows) == 3:
+                    mass_flow_required = self._aitken_extrapolation(*recent_mass_flows)
+                    recent_mass_flows = [mass_flow_required]
+                self._iterative_turbine_mass_flow = mass_flow_required
+            else:
+                warnings.warn(f'Turbine mass flow did not converge within [{_MAX_REPLICATION_ITERATIONS}] iterations')
 
     @property
     def turbine_mass_flow_initial_guess(self):
@@ -120,11 +142,11 @@ class KwakFixGasGeneratorCycle(GasGeneratorCycle, KwakEngineCycle):
     def overall_specific_impulse(self):
         if not self.replication_mode:
             """Calculate specific impulse without accounting for turbine exhaust thrust contribution."""
-            return self.chamber_mass_flow * self.chamber_equivalent_velocity / self.total_mass_flow / constants.g
+            return self.chamber_mass_flow * self.chamber_equivalent_velocity / self.total_mass_flow / _G0
         else:
             return super().overall_specific_impulse
 
-    @property
+    @fast_cached_property
     def chamber_mass_flow(self):
         if not self.replication_mode:
             if self._iteration_done:
@@ -134,14 +156,14 @@ class KwakFixGasGeneratorCycle(GasGeneratorCycle, KwakEngineCycle):
         else:
             return super().chamber_mass_flow
 
-    @property
+    @fast_cached_property
     def chamber_fuel_flow(self):
         if self._iteration_done:
             return self.mf
         else:
             return super().chamber_fuel_flow
 
-    @property
+    @fast_cached_property
     def chamber_oxidizer_flow(self):
         if self._iteration_done:
             return self.mo
@@ -162,7 +184,7 @@ class KwakFixGasGeneratorCycle(GasGeneratorCycle, KwakEngineCycle):
         else:
             return super().chamber_propellant_mass
 
-    @property
+    @fast_cached_property
     def mass_kwak(self):
         return super().mass_kwak - self.props_mass + self.turbine_propellant_mass + self.chamber_propellant_mass
 
@@ -174,7 +196,7 @@ class KwakFixGasGeneratorCycle(GasGeneratorCycle, KwakEngineCycle):
 @dataclass
 class KwakFixElectricPumpCycle(ElectricPumpCycle, KwakEngineCycle):
 
-    @property
+    @fast_cached_property
     def battery(self):
         if not self.replication_mode:
             return KwakBattery(specific_power=self.battery_specific_power,
@@ -187,7 +209,7 @@ class KwakFixElectricPumpCycle(ElectricPumpCycle, KwakEngineCycle):
         else:
             return super().battery
 
-    @property
+    @fast_cached_property
     def fuel_pump(self):
         return KwakPump(inlet_flow_state=self.pre_fuel_pump_merger.outlet_flow_state,
                         expected_outlet_pressure=self.fuel_pump_outlet_pressure,
@@ -0,0 +1,25 @@
+import numpy as np
+from EngineCycles.Abstract.EngineCycle import EngineCycle
+
+# Design variables that are passed as columns instead of through total_kwargs
+_DESIGN_VARIABLES = ('thrust', 'combustion_chamber_pressure', 'mass_mixture_ratio')
+
+
+def evaluate_designs(CycleClass: type[EngineCycle], combustion_chamber_pressures, mass_mixture_ratios,
+                     total_kwargs: dict, attribute: str, is_max: bool = True):
+    """Evaluate attribute for (broadcastable) columns of chamber pressures [MPa] and mixture ratios.
+
+    The design variables are kept as numpy arrays and passed to EngineCycle.batch, which only returns the requested
+    attribute per design instead of the engines themselves. Infeasible designs are NaN and skipped. Returns the chamber
+    pressure, mixture ratio and value of the best design, followed by the array with the values of all designs.
+    """
+    pressures, mixture_ratios = np.broadcast_arrays(np.asarray(combustion_chamber_pressures, dtype=float),
+                                                    np.asarray(mass_mixture_ratios, dtype=float))
+    kwargs = {key: value for key, value in total_kwargs.items() if key not in _DESIGN_VARIABLES}
+    values = CycleClass.batch(thrust=total_kwargs['thrust'],
+                              combustion_chamber_pressure=pressures * 1e6,
+                              mass_mixture_ratio=mixture_ratios,
+                              attributes=(attribute,),
+                              **kwargs)[attribute]
+    best_index = np.unravel_index((np.nanargmax if is_max else np.nanargmin)(values), values.shape)
+    return pressures[best_index], mixture_ratios[best_index], values[best_index], values
@@ -1,28 +1,85 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Optional
 from scipy.optimize import minimize
 from EngineCycles.Abstract.EngineCycle import EngineCycle
 
 
-def engine_opt_func(params, CycleClass: EngineCycle, attribute: str, total_kwargs: dict, is_max:bool = True):
-    print(f'{params[0]:.3f} MPa, {params[1]:.3f}')
+def engine_opt_func(params, CycleClass: EngineCycle, attribute: str, total_kwargs: dict, is_max: bool = True,
+                    cache: Optional[dict] = None, verbose: bool = False):
+    """Return the (negated if is_max) attribute of the cycle at params = (chamber pressure [MPa], mixture ratio).
+
+    Results are stored in cache, if given, keyed on the rounded params, so points that the optimizer revisits do not
+    construct the cycle again.
+    """
+    key = (round(params[0], 6), round(params[1], 6))
+    if cache is not None and key in cache:
+        return cache[key]
+    if verbose:
+        print(f'{params[0]:.3f} MPa, {params[1]:.3f}')
     total_kwargs['combustion_chamber_pressure'] = params[0] * 1e6
     total_kwargs['mass_mixture_ratio'] = params[1]
     multiplier = -1 if is_max else 1
-    return multiplier * getattr(CycleClass(**total_kwargs), attribute)
+    value = multiplier * getattr(CycleClass(**total_kwargs), attribute)
+    if cache is not None:
+        cache[key] = value
+    return value
 
 
 def optimize_engine(CycleClass: EngineCycle, attribute: str, total_kwargs: dict, x0: tuple = (3, 2.4),
-                    bounds: tuple = ((1, 10), (1.5, 3.5)), tol: float = 1e-2, is_max: bool = True):
+                    bounds: tuple = ((1, 10), (1.5, 3.5)), tol: float = 1e-2, is_max: bool = True,
+                    verbose: bool = False, method: str = 'Powell'):
+    # Powell's line searches along the two (bounded) axes need fewer cycle constructions than a Nelder-Mead simplex
+    cache = {}
     res = minimize(
-        fun=lambda x: engine_opt_func(x, CycleClass, attribute, total_kwargs),
+        fun=lambda x: engine_opt_func(x, CycleClass, attribute, total_kwargs, is_max=is_max, cache=cache,
+                                      verbose=verbose),
         x0=x0,
         bounds=bounds,
-        method='Nelder-Mead',
+        method=method,
         tol=tol,
     )
     fun_val = -res.fun if is_max else res.fun
     return *res.x, fun_val
 
 
+def optimize_engine_parallel(CycleClass: EngineCycle, attribute: str, total_kwargs: dict, x0: tuple = (3, 2.4),
+                             bounds: tuple = ((1, 10), (1.5, 3.5)), initial_step: tuple = (1., .25),
+                             tol: float = 1e-2, is_max: bool = True, max_workers: Optional[int] = None,
+                             max_iterations: int = 100):
+    """Optimize the same problem as optimize_engine with a pattern search, of which the four axis neighbours of every
+    iteration are evaluated in parallel worker processes.
+
+    The best neighbour is taken if it improves on the current point, otherwise the steps are halved, until all steps
+    are below tol. Must be called from within an if __name__ == '__main__' block on platforms that spawn workers.
+    """
+    def clip(params):
+        return tuple(min(max(value, lower), upper) for value, (lower, upper) in zip(params, bounds))
+
+    evaluate = partial(engine_opt_func, CycleClass=CycleClass, attribute=attribute, total_kwargs=total_kwargs,
+                       is_max=is_max)
+    cache = {}
+    x = clip(x0)
+    steps = list(initial_step)
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1) as executor:
+        cache[x] = evaluate(x)
+        for _ in range(max_iterations):
+            if max(steps) < tol:
+                break
+            neighbours = {clip(x[:index] + (x[index] + sign * step,) + x[index + 1:])
+                          for index, step in enumerate(steps) for sign in (-1, 1)}
+            new_points = [point for point in neighbours if point not in cache]
+            cache.update(zip(new_points, executor.map(evaluate, new_points)))
+            best = min(neighbours, key=cache.__getitem__)
+            if cache[best] < cache[x]:
+                x = best
+            else:
+                steps = [step / 2 for step in steps]
+    fun_val = -cache[x] if is_max else cache[x]
+    return *x, fun_val
+
+
 if __name__ == '__main__':
     from EngineCycles.ElectricPumpCycle import ElectricPumpCycle
     from EngineArguments.get_default_arguments import get_default_kwargs
@@ -31,5 +88,5 @@ if __name__ == '__main__':
     total_kwargs = get_default_kwargs(ElectricPumpCycle) | engine_kwargs
     total_kwargs['burn_time'] = 1200
     print(
-        optimize_engine(ElectricPumpCycle, 'ideal_delta_v', total_kwargs)
+        optimize_engine(ElectricPumpCycle, 'ideal_delta_v', total_kwargs, verbose=True)
     )
@@ -5,116 +5,161 @@ from EngineCycles.ElectricPumpCycle import ElectricPumpCycle
 from EngineCycles.OpenExpanderCycle import OpenExpanderCycle, OpenExpanderCycle_DoublePump, \
     OpenExpanderCycle_DoublePumpTurbine
 from EngineCycles.CoolantBleedCycle import CoolantBleedCycle
-from EngineComponents.Abstract.FlowState import FlowState, ManualFlowState
-from EngineComponents.Base.Pump import Pump
-from EngineComponents.Other.Battery import Battery
-from EngineComponents.Abstract.ElectricalComponent import ElectricalComponent
-from EngineComponents.Other.Turbine import Turbine
-from numpy import isclose
-from typing import Optional, Iterator
+from dataclasses import dataclass
+from typing import Optional
+from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image, ImageDraw, ImageFont
-from EngineFunctions.BaseFunctions import format_si
-
-
-def make_mass_schematic(engine: EngineCycle):
-    name_switcher = {
-        ElectricPumpCycle: ('EP', (1100, 500), (5, 9, 10, 11, 20,)),
-        GasGeneratorCycle: ('GG', (1100, 500), (9, 20, 12, 13, 14, 15)),
-        CoolantBleedCycle: ('CB', (1100, 500), (9, 11, 20, 12, 13, 14, 15)),
-        OpenExpanderCycle: ('OE', (1100, 500), (9, 11, 20, 12, 13, 14, 15)),
-        OpenExpanderCycle_DoublePump: ('OE1', (1250, 500), (9, 11, 12, 13, 14, 15)),
-        GasGeneratorCycle_DoubleTurbine: ('GG2', (1100, 500), (9, 20, 12, 13, 14, 15)),
-        OpenExpanderCycle_DoublePumpTurbine: ('OE2', (1100, 500), (9, 11, 12, 13, 14, 15)),
-        GasGeneratorCycle_DoubleTurbineSeries: ('GG3', (1100, 500), (9, 20, 12, 13, 14, 15)),
-    }
-    for base_class, info in name_switcher.items():
-        if issubclass(type(engine), base_class):
-            cycle_name, start_coord, pop_tuple = info
-
-    values = get_mass_values(engine)
-    strings = list(format_values(values))
-    strings = [string for (i, string) in enumerate(strings, start=1) if i not in pop_tuple]
-    fontsize = 63
-    font_file = r'Schematics\Fonts\CamingoCode-Regular.ttf'
-    myfont = ImageFont.truetype(font_file, fontsize)
-    for number in ['2', '3']:
-        if number in cycle_name:
-            cycle_name = cycle_name.replace(number, '')
-    image_path = rf'Schematics\MassSchematics\{cycle_name}_Mass_Clean.png'
 
+_MASS_ATTRIBUTES = (
+    'fuel_tank',
+    'oxidizer_tank',
+    'fuel_pump',
+    'oxidizer_pump',
+    'turbine',
+    'heat_transfer_section',
+    'injector',
+    'thrust_chamber',
+    'splitter',
+    'secondary_exhaust',
+    'gas_generator',
+    'electric_motor',
+    'inverter',
+    'battery',
+    'battery_cooler',
+    'pressurant_tank',
+    'pressurant',
+    'fuel',
+    'oxidizer',
+    'secondary_fuel_pump',
+)
+
+_MASS_NAMES = (
+    'Fuel Tank',
+    'Oxidizer Tank',
+    'Fuel Pump',
+    'Oxidizer Pump',
+    'Turbine',
+    'Heat Exchanger',
+    'Injector',
+    'Chamber + Nozzle',
+    'Splitter',
+    'Turbine Exhaust',
+    'Gas Generator',
+    'Electric Motor',
+    'Inverter',
+    'Battery',
+    'Battery Cooler',
+    'Pressurant Tank',
+    'Pressurant',
+    'Fuel',
+    'Oxidizer',
+    '2nd Fuel Pump',
+)
+
+_FONT_FILE = Path('Schematics', 'Fonts', 'CamingoCode-Regular.ttf')
+_FONT_SIZE = 63
+_LINE_HEIGHT = _FONT_SIZE * 1.3
+# Variants with a second or series turbine share the schematic of their base cycle
+_TURBINE_VARIANT_DIGITS = str.maketrans('', '', '23')
+
+
+@dataclass(frozen=True)
+class MassSchematicSpec:
+    """Layout of the mass schematic of a cycle, see make_spec."""
+    template_path: Path
+    start_coord: tuple[int, int]
+    drawn_lines: tuple[int, ...]
+
+
+def make_spec(cycle_name: str, start_coord: tuple[int, int], skipped_lines: tuple[int, ...]) -> MassSchematicSpec:
+    """Create the layout from the name of the clean schematic, the coordinate of the first mass line and the numbers
+    (starting at 1) of the mass lines that are not drawn."""
+    file_name = f'{cycle_name.translate(_TURBINE_VARIANT_DIGITS)}_Mass_Clean.png'
+    return MassSchematicSpec(template_path=Path('Schematics', 'MassSchematics', file_name),
+                             start_coord=start_coord,
+                             drawn_lines=tuple(i for i in range(1, len(_MASS_NAMES) + 1) if i not in skipped_lines))
+
+
+# Looked up for the most specific class of an engine
+_SPECS = {
+    ElectricPumpCycle: make_spec('EP', (1100, 500), (5, 9, 10, 11, 20,)),
+    GasGeneratorCycle: make_spec('GG', (1100, 500), (9, 20, 12, 13, 14, 15)),
+    CoolantBleedCycle: make_spec('CB', (1100, 500), (9, 11, 20, 12, 13, 14, 15)),
+    OpenExpanderCycle: make_spec('OE', (1100, 500), (9, 11, 20, 12, 13, 14, 15)),
+    OpenExpanderCycle_DoublePump: make_spec('OE1', (1250, 500), (9, 11, 12, 13, 14, 15)),
+    GasGeneratorCycle_DoubleTurbine: make_spec('GG2', (1100, 500), (9, 20, 12, 13, 14, 15)),
+    OpenExpanderCycle_DoublePumpTurbine: make_spec('OE2', (1100, 500), (9, 11, 12, 13, 14, 15)),
+    GasGeneratorCycle_DoubleTurbineSeries: make_spec('GG3', (1100, 500), (9, 20, 12, 13, 14, 15)),
+}
+
+
+@lru_cache(maxsize=8)
+def _get_font(path: Path, size: int) -> ImageFont.FreeTypeFont:
+    """Shared font per file and size, loading one parses the font file."""
+    return ImageFont.truetype(str(path), size)
+
+
+@lru_cache(maxsize=16)
+def _load_template(path: Path) -> Image.Image:
+    """Decoded clean schematic, shared between calls, so draw on a copy."""
+    with Image.open(path) as img:
+        img.load()
+        return img.copy()
+
+
+def get_spec(engine: EngineCycle) -> MassSchematicSpec:
+    for EngineClass in type(engine).__mro__:
+        if EngineClass in _SPECS:
+            return _SPECS[EngineClass]
+    raise ValueError(f'No mass schematic available for [{type(engine).__name__}]')
+
+
+def make_mass_schematic(engine: EngineCycle, show: bool = False, save_path: Optional[str] = None) -> Image.Image:
+    """Draw the component masses of engine on its clean schematic and return the image, which is only shown in an
+    external viewer if show is True and only saved if a save_path is given."""
+    spec = get_spec(engine)
+    strings = format_values(get_mass_values(engine), lines=spec.drawn_lines)
     totals = [f'Initial: {engine.initial_mass:>8.1f} kg', f'Final  : {engine.final_mass:>8.1f} kg']
-    start_x = start_coord[0]
-    start_y = start_coord[1]
-    dy = fontsize * 1.3
-    with Image.open(image_path) as img:
-        drawer = ImageDraw.Draw(img)
-        for i, string in enumerate(strings):
-            coordinate = [start_x, start_y + i * dy]
-            drawer.text(coordinate, string, fill=(0, 0, 0), font=myfont)
-        for i, string in enumerate(totals):
-            coordinate = [start_x + 450, start_y - 300 + i * dy]
-            drawer.text(coordinate, string, fill=(0, 0, 0), font=myfont)
+    font = _get_font(_FONT_FILE, _FONT_SIZE)
+    start_x, start_y = spec.start_coord
+
+    img = _load_template(spec.template_path).copy()
+    # Text is drawn by the layout engine of Pillow instead of blitting glyphs from a pre-rendered atlas, which would lose
+    # kerning and anti-aliasing for a negligible gain with about twenty lines per schematic
+    drawer = ImageDraw.Draw(img)
+    # multiline_text advances each line by the height of 'A' plus spacing, so spacing is chosen to keep the line height
+    spacing = _LINE_HEIGHT - drawer.textbbox((0, 0), 'A', font=font)[3]
+    drawer.multiline_text((start_x, start_y), '\n'.join(strings), fill=(0, 0, 0), font=font, spacing=spacing)
+    drawer.multiline_text((start_x + 450, start_y - 300), '\n'.join(totals), fill=(0, 0, 0), font=font,
+                          spacing=spacing)
+    if save_path is not None:
+        img.save(save_path, optimize=True)
+    if show:
         img.show()
+    return img
 
 
 def get_mass_values(engine: EngineCycle):
-    mass_attributes = (
-        'fuel_tank',
-        'oxidizer_tank',
-        'fuel_pump',
-        'oxidizer_pump',
-        'turbine',
-        'heat_transfer_section',
-        'injector',
-        'thrust_chamber',
-        'splitter',
-        'secondary_exhaust',
-        'gas_generator',
-        'electric_motor',
-        'inverter',
-        'battery',
-        'battery_cooler',
-        'pressurant_tank',
-        'pressurant',
-        'fuel',
-        'oxidizer',
-        'secondary_fuel_pump',
-    )
+    return [getattr(getattr(engine, attribute, None), 'mass', 0) for attribute in _MASS_ATTRIBUTES]
 
-    mass_components = [getattr(engine, attribute, None) for attribute in mass_attributes]
-    for component in mass_components:
-        getattr(component, 'mass', 0)
-    return [getattr(component, 'mass', 0) for component in mass_components]
-
-
-def format_values(values: list[float, ...]) -> Iterator[str]:
-    mass_names = (
-        'Fuel Tank',
-        'Oxidizer Tank',
-        'Fuel Pump',
-        'Oxidizer Pump',
-        'Turbine',
-        'Heat Exchanger',
-        'Injector',
-        'Chamber + Nozzle',
-        'Splitter',
-        'Turbine Exhaust',
-        'Gas Generator',
-        'Electric Motor',
-        'Inverter',
-        'Battery',
-        'Battery Cooler',
-        'Pressurant Tank',
-        'Pressurant',
-        'Fuel',
-        'Oxidizer',
-        '2nd Fuel Pump',
-    )
-    for i, (value, name) in enumerate(zip(values, mass_names), start=1):
-        # yield f'{i:>3}: {str(value)[:8]:>10} kg - {name}'
-        if name == '2nd Fuel Pump':
-            yield f'{"3.2":>3}: {value:>8.1f} kg - {name}'
-        yield f'{i:>3}: {value:>8.1f} kg - {name}'
+
+def _format_mass_line(number: int, value: float, name: str) -> str:
+    # The second fuel pump is numbered as a sub-item of the (first) fuel pump in the schematics
+    return f'{"3.2" if name == "2nd Fuel Pump" else number:>3}: {value:>8.1f} kg - {name}'
+
+
+def format_values(values: list[float, ...], lines: Optional[tuple[int, ...]] = None) -> list[str]:
+    """Format the mass lines with the given numbers (starting at 1), all lines if none are given."""
+    if lines is None:
+        lines = range(1, len(values) + 1)
+    return [_format_mass_line(i, values[i - 1], _MASS_NAMES[i - 1]) for i in lines]
+
+
+def _render_mass_schematic(Cycle: type[EngineCycle], kwargs: dict) -> Image.Image:
+    # Engines cannot be pickled, so they are built in the worker process and only the image is returned
+    return make_mass_schematic(Cycle(**kwargs))
 
 
 if __name__ == '__main__':
@@ -135,7 +180,10 @@ if __name__ == '__main__':
         # (OpenExpanderCycle_DoublePump, args.oe1_arguments),
     )
 
-    for Cycle, extra_args in cycle_list:
-        complete_args = args.base_arguments | extra_args | design_args | {'verbose': True}
-        engine = Cycle(**complete_args)
-        make_mass_schematic(engine)
+    # The schematics are independent, so they are rendered in parallel and shown afterwards
+    with ProcessPoolExecutor() as executor:
+        images = executor.map(_render_mass_schematic,
+                              [Cycle for Cycle, _ in cycle_list],
+                              [args.base_arguments | extra_args | design_args for _, extra_args in cycle_list])
+        for image in images:
+            image.show()
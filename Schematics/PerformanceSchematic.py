@@ -5,54 +5,69 @@ from EngineCycles.ElectricPumpCycle import ElectricPumpCycle
 from EngineCycles.OpenExpanderCycle import OpenExpanderCycle, OpenExpanderCycle_DoublePump, \
     OpenExpanderCycle_DoublePumpTurbine
 from EngineCycles.CoolantBleedCycle import CoolantBleedCycle
-from EngineComponents.Abstract.FlowState import FlowState, ManualFlowState
+from EngineComponents.Abstract.FlowState import FlowState
 from EngineComponents.Base.Pump import Pump
-from EngineComponents.Other.Battery import Battery
 from EngineComponents.Abstract.ElectricalComponent import ElectricalComponent
 from EngineComponents.Other.Turbine import Turbine
 from EngineComponents.Other.GasGenerator import GasGenerator
 from numpy import isclose
-from typing import Optional, Iterator
+from typing import Optional
+from functools import lru_cache, cache
 from PIL import Image, ImageDraw, ImageFont
 from EngineFunctions.BaseFunctions import format_si
 
 
-def make_performance_schematic(engine: EngineCycle):
-    switcher = {
-        ElectricPumpCycle: (get_ep_components_coordinates, 'EP'),
-        GasGeneratorCycle: (get_gg_components_coordinates, 'GG'),
-        CoolantBleedCycle: (get_cb_components_coordinates, 'CB'),
-        OpenExpanderCycle: (get_oe_components_coordinates, 'OE'),
-        OpenExpanderCycle_DoublePump: (get_oe1_components_coordinates, 'OE1'),
-        GasGeneratorCycle_DoubleTurbine: (get_gg2_components_coordinates, 'GG2'),
-        OpenExpanderCycle_DoublePumpTurbine: (get_oe2_components_coordinates, 'OE2'),
-        GasGeneratorCycle_DoubleTurbineSeries: (get_gg3_components_coordinates, 'GG3'),
-    }
-    # Get the name and component and coordinate function of the Cycle of which input engine is a subclass
-    for base_class, value in switcher.items():
-        if issubclass(type(engine), base_class):
-            get_comps_coords, name = value
+@lru_cache(maxsize=8)
+def _get_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Shared font per file and size, loading one parses the font file."""
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=16)
+def _load_template(path: str) -> Image.Image:
+    """Decoded clean schematic, shared between calls, so draw on a copy."""
+    with Image.open(path) as img:
+        img.load()
+        return img.copy()
+
+
+def make_performance_schematic(engine: EngineCycle, show: bool = False, save_path: Optional[str] = None
+                               ) -> Image.Image:
+    """Draw the performance values of engine on its clean schematic and return the image, which is only shown in an
+    external viewer if show is True and only saved if a save_path is given."""
+    # Get the name and component and coordinate function of the most specific Cycle of which engine is an instance
+    for EngineClass in type(engine).__mro__:
+        if EngineClass in _SCHEMATIC_FUNCTIONS:
+            get_comps_coords, name = _SCHEMATIC_FUNCTIONS[EngineClass]
+            break
+    else:
+        raise ValueError(f'No performance schematic available for [{type(engine).__name__}]')
     # Get the component (values) and their respective coordinates on the final image
     comps, coords = get_comps_coords(engine)
 
     fontsize = 42
     font_file = r'Schematics\Fonts\DejaVuSans.ttf'
-    myfont = ImageFont.truetype(font_file, fontsize)
+    myfont = _get_font(font_file, fontsize)
 
     image_path = rf'Schematics\PerformanceSchematics\{name}_Cycle.png'
     # Format the components to output (groups of) string values
-    strings = tuple(format_values(comps))
+    strings = format_values(comps)
     # Write the string values on the image
-    with Image.open(image_path) as img:
-        drawer = ImageDraw.Draw(img)
-        for coord, string_row in zip(coords, strings):
-            coord_now = list(coord)
-            for string in string_row:
-                drawer.text(coord_now, string, fill=(0, 0, 0), font=myfont)
-                coord_now[1] = coord_now[1] + int(fontsize * 1.15)
+    img = _load_template(image_path).copy()
+    drawer = ImageDraw.Draw(img)
+    # Each group is drawn in one call. multiline_text advances each line by the height of 'A' plus spacing, so
+    # spacing is chosen to keep lines int(fontsize * 1.15) apart
+    spacing = int(fontsize * 1.15) - drawer.textbbox((0, 0), 'A', font=myfont)[3]
+    for coord, string_row in zip(coords, strings):
+        drawer.multiline_text(coord, '\n'.join(string_row), fill=(0, 0, 0), font=myfont, spacing=spacing)
+    if save_path is not None:
+        img.save(save_path, optimize=True)
+    if show:
         img.show()
+    return img
 
 
+@lru_cache(maxsize=64)
 def get_ambient_pressure_string(ambient_pressure: Optional[float]):
     if ambient_pressure is None:
         p_a = u'p\u2091'
@@ -65,6 +80,7 @@ def get_ambient_pressure_string(ambient_pressure: Optional[float]):
     return u'p\u2090' + f' = {p_a}'
 
 
+@lru_cache(maxsize=64)
 def get_exit_pressure_string(exit_pressure: float):
     if isclose(exit_pressure, 0):
         p_e = '0.0'
@@ -75,6 +91,16 @@ def get_exit_pressure_string(exit_pressure: float):
     return u'p\u2091' + f' = {p_e}'
 
 
+def get_propellant_label(propellant_name: str) -> str:
+    """Propellant name without the CEA variant suffix, e.g. 'LH2' for 'LH2_NASA'."""
+    return propellant_name.split('_', 1)[0]
+
+
+# Positions in the components of get_base_comps_coords, which the cycle specific functions replace or move
+_TURBINE_PLACEHOLDER_INDEX = 6
+_FUEL_NAME_INDEX = 12
+
+
 def get_base_comps_coords(engine: EngineCycle, x_y1: tuple, x_y2: tuple):
     ambient_string = get_ambient_pressure_string(engine.ambient_pressure)
 
@@ -88,14 +114,10 @@ def get_base_comps_coords(engine: EngineCycle, x_y1: tuple, x_y2: tuple):
         'placeholder',
         engine.oxidizer_pump,
         engine.oxidizer_pump.outlet_flow_state,
-        ManualFlowState(propellant_name='CombustionGas',
-                        temperature=engine.combustion_temperature,
-                        pressure=engine.combustion_chamber_pressure,
-                        mass_flow=engine.chamber_mass_flow,
-                        type='combusted'),
+        get_combustion_gas_strings(engine),
         (engine.chamber_thrust, engine.chamber_specific_impulse, engine.expansion_ratio, engine.mass_mixture_ratio),
-        engine.oxidizer_name.split('_')[0],
-        engine.fuel_name.split('_')[0],
+        get_propellant_label(engine.oxidizer_name),
+        get_propellant_label(engine.fuel_name),
         f"{ambient_string: >20}",
     ]
 
@@ -140,16 +162,12 @@ def get_ep_components_coordinates(engine: ElectricPumpCycle):
         engine.oxidizer_pump,
         engine.battery,
         engine.oxidizer_pump.outlet_flow_state,
-        ManualFlowState(propellant_name='CombustionGas',
-                        temperature=engine.combustion_temperature,
-                        pressure=engine.combustion_chamber_pressure,
-                        mass_flow=engine.chamber_mass_flow,
-                        type='combusted'),
+        get_combustion_gas_strings(engine),
         (engine.chamber_thrust, engine.chamber_specific_impulse, engine.expansion_ratio, engine.mass_mixture_ratio),
         f"{exit_string: >20}",
         f"{ambient_string: >20}",
-        engine.oxidizer_name.split('_')[0],  # Oxidizer
-        engine.fuel_name.split('_')[0],  # Fuel
+        get_propellant_label(engine.oxidizer_name),  # Oxidizer
+        get_propellant_label(engine.fuel_name),  # Fuel
         engine.electric_motor,
         engine.inverter,
         format_si(engine.thrust, 'N'),
@@ -190,9 +208,8 @@ def get_ep_components_coordinates(engine: ElectricPumpCycle):
 def get_gg_components_coordinates(engine: GasGeneratorCycle):
     x_y2 = (1420, 640)
     base_components, base_coords = get_base_comps_coords(engine, x_y1=(315, 645), x_y2=x_y2)
-    # Find and replace placeholder with battery component
-    i = base_components.index('placeholder')
-    base_components[i] = engine.turbine
+    # Replace placeholder with turbine component
+    base_components[_TURBINE_PLACEHOLDER_INDEX] = engine.turbine
 
     # Mass Flows after Splitters
     m_f_gg = engine.post_fuel_pump_splitter.outlet_flow_states['gg'].mass_flow
@@ -214,15 +231,11 @@ def get_gg_components_coordinates(engine: GasGeneratorCycle):
                   engine.oxidizer_pump.outlet_flow_state,
                   format_si(m_o_gg * 1e3, 'g/s'),
                   format_si(m_o_ch * 1e3, 'g/s'),
-                  ManualFlowState(propellant_name='CombustionGas',
-                                  temperature=engine.combustion_temperature,
-                                  pressure=engine.combustion_chamber_pressure,
-                                  mass_flow=engine.chamber_mass_flow,
-                                  type='combusted'),
+                  get_combustion_gas_strings(engine),
                   (engine.chamber_thrust, engine.chamber_specific_impulse, engine.expansion_ratio,
                    engine.mass_mixture_ratio),
-                  engine.oxidizer_name.split('_')[0],  # Oxidizer
-                  engine.fuel_name.split('_')[0],  # Fuel
+                  get_propellant_label(engine.oxidizer_name),  # Oxidizer
+                  get_propellant_label(engine.fuel_name),  # Fuel
                   f"{ambient_string: >20}",
                   engine.gas_generator.outlet_flow_state,
                   (engine.secondary_exhaust.thrust, engine.secondary_exhaust.specific_impulse,
@@ -299,11 +312,7 @@ def get_gg3_components_coordinates(engine: GasGeneratorCycle_DoubleTurbineSeries
         format_si(m_o_gg * 1e3, 'g/s'),
         engine.gas_generator,
         format_si(m_o_ch * 1e3, 'g/s'),
-        ManualFlowState(propellant_name='CombustionGas',
-                        temperature=engine.combustion_temperature,
-                        pressure=engine.combustion_chamber_pressure,
-                        mass_flow=engine.chamber_mass_flow,
-                        type='combusted'),
+        get_combustion_gas_strings(engine),
         (engine.chamber_thrust, engine.chamber_specific_impulse, engine.expansion_ratio, engine.mass_mixture_ratio),
         # Others
         engine.fuel_turbine.outlet_flow_state,
@@ -312,8 +321,8 @@ def get_gg3_components_coordinates(engine: GasGeneratorCycle_DoubleTurbineSeries
          engine.oxidizer_secondary_exhaust.expansion_ratio),
         engine.oxidizer_turbine.outlet_flow_state,
         engine.oxidizer_turbine,
-        engine.oxidizer_name.split('_')[0],  # Oxidizer
-        engine.fuel_name.split('_')[0],  # Fuel
+        get_propellant_label(engine.oxidizer_name),  # Oxidizer
+        get_propellant_label(engine.fuel_name),  # Fuel
         f"{ambient_string: >20}",
         format_si(engine.thrust, 'N'),
         format_si(engine.overall_specific_impulse, 's'),
@@ -361,9 +370,8 @@ def get_gg3_components_coordinates(engine: GasGeneratorCycle_DoubleTurbineSeries
 def get_cb_components_coordinates(engine: CoolantBleedCycle):
     x_y2 = (1420, 640)
     base_components, base_coords = get_base_comps_coords(engine, x_y1=(315, 645), x_y2=x_y2)
-    # Find and replace placeholder with battery component
-    i = base_components.index('placeholder')
-    base_components[i] = engine.turbine
+    # Replace placeholder with turbine component
+    base_components[_TURBINE_PLACEHOLDER_INDEX] = engine.turbine
 
     m_tu = engine.post_cooling_splitter.outlet_flow_states['turbine'].mass_flow
     m_ch = engine.post_cooling_splitter.outlet_flow_states['chamber'].mass_flow
@@ -402,12 +410,10 @@ def get_oe_components_coordinates(engine: OpenExpanderCycle):
     dy1 = 80
     dy3 = 193
     base_components, base_coords = get_base_comps_coords(engine, x_y1=(315, 635), x_y2=x_y2)
-    # Find and replace placeholder with battery component
-    i = base_components.index('placeholder')
-    base_components[i] = engine.turbine
+    # Replace placeholder with turbine component
+    base_components[_TURBINE_PLACEHOLDER_INDEX] = engine.turbine
     # Change fuel_tank coordinates
-    i_rp1 = base_components.index(engine.fuel_name.split('_')[0])
-    base_coords[i_rp1] = (595, 190)
+    base_coords[_FUEL_NAME_INDEX] = (595, 190)
     # Switchs positions of fuel pump and cooling outlet
     ccs_out, fp_out = base_components[2], base_components[3]
     base_components[3], base_components[2] = ccs_out, fp_out
@@ -458,12 +464,10 @@ def get_oe1_components_coordinates(engine: OpenExpanderCycle_DoublePump):
     dy1 = 80
     dy3 = 193
     base_components, base_coords = get_base_comps_coords(engine, x_y1=(315, 635), x_y2=x_y2)
-    # Find and replace placeholder with battery component
-    i = base_components.index('placeholder')
-    base_components[i] = engine.turbine
+    # Replace placeholder with turbine component
+    base_components[_TURBINE_PLACEHOLDER_INDEX] = engine.turbine
     # Change fuel_tank coordinates
-    i_rp1 = base_components.index(engine.fuel_name.split('_')[0])
-    base_coords[i_rp1] = (435, 190)
+    base_coords[_FUEL_NAME_INDEX] = (435, 190)
     # Switchs positions of fuel pump and cooling outlet
     ccs_out, fp_out = base_components[2], base_components[3]
     base_components[3], base_components[2] = ccs_out, fp_out
@@ -530,11 +534,7 @@ def get_oe2_components_coordinates(engine: OpenExpanderCycle_DoublePumpTurbine):
         engine.oxidizer_turbine,
         engine.fuel_turbine,
         engine.oxidizer_pump.outlet_flow_state,
-        ManualFlowState(propellant_name='CombustionGas',
-                        temperature=engine.combustion_temperature,
-                        pressure=engine.combustion_chamber_pressure,
-                        mass_flow=engine.chamber_mass_flow,
-                        type='combusted'),
+        get_combustion_gas_strings(engine),
         (engine.chamber_thrust, engine.chamber_specific_impulse, engine.expansion_ratio, engine.mass_mixture_ratio),
         # Fuel Col 2
         format_si(m_ch2 * 1e3, 'g/s', 5),
@@ -549,8 +549,8 @@ def get_oe2_components_coordinates(engine: OpenExpanderCycle_DoublePumpTurbine):
         engine.oxidizer_turbine.outlet_flow_state,
         # Other
         format_si(m_tu * 1e3, 'g/s', 5),
-        engine.oxidizer_name.split('_')[0],  # Oxidizer
-        engine.fuel_name.split('_')[0],  # Fuel
+        get_propellant_label(engine.oxidizer_name),  # Oxidizer
+        get_propellant_label(engine.fuel_name),  # Fuel
         f"{ambient_string: >20}",
         format_si(engine.thrust, 'N'),
         format_si(engine.overall_specific_impulse, 's'),
@@ -600,59 +600,110 @@ def get_oe2_components_coordinates(engine: OpenExpanderCycle_DoublePumpTurbine):
     return components, coords
 
 
+_SCHEMATIC_FUNCTIONS = {
+    ElectricPumpCycle: (get_ep_components_coordinates, 'EP'),
+    GasGeneratorCycle: (get_gg_components_coordinates, 'GG'),
+    CoolantBleedCycle: (get_cb_components_coordinates, 'CB'),
+    OpenExpanderCycle: (get_oe_components_coordinates, 'OE'),
+    OpenExpanderCycle_DoublePump: (get_oe1_components_coordinates, 'OE1'),
+    GasGeneratorCycle_DoubleTurbine: (get_gg2_components_coordinates, 'GG2'),
+    OpenExpanderCycle_DoublePumpTurbine: (get_oe2_components_coordinates, 'OE2'),
+    GasGeneratorCycle_DoubleTurbineSeries: (get_gg3_components_coordinates, 'GG3'),
+}
+
+
 eta_f = ' >15.2f'
 
 
 def format_power_comp(power: float, efficiency: float, **kwargs):
     try:
         return format_si(power, 'W', **kwargs), f'{efficiency:{eta_f}}'
-    except:
+    except (TypeError, ValueError, OverflowError):
+        # Missing (None) or non-finite values
         return '0', '0'
 
 
-def format_values(components: tuple) -> Iterator[tuple]:
-    for component in components:
-        if isinstance(component, FlowState):
-            pressure = format_si(component.pressure, 'Pa')
-            massflow = format_si(component.mass_flow * 1e3, 'g/s')
-            temperature = format_si(component.temperature, 'K')
-            yield massflow, pressure, temperature
-        elif isinstance(component, Pump):
-            power, efficiency = format_power_comp(component.power_required,
-                                                  component.efficiency)
-            yield power, efficiency
-        elif isinstance(component, EngineCycle):
-            power, efficiency = format_power_comp(component.heat_flow_rate,
-                                                  component.expansion_ratio_end)
-            yield power, efficiency
-
-        elif isinstance(component, tuple):
-            thrust = format_si(component[0], 'N')
-            isp = format_si(component[1], 's')
-            eps = format_si(component[2], '')
-            try:
-                mmr = f'    {format_si(component[3], "", 3)}'
-                yield thrust, isp, eps, mmr
-            except IndexError:
-                yield thrust, isp, eps
-
-        elif isinstance(component, ElectricalComponent):
-            digits = 5 if isinstance(component, Battery) else 5
-            power, efficiency = format_power_comp(component.output_power,
-                                                  component.electric_energy_efficiency,
-                                                  digits=digits)
-            yield power, efficiency
-
-        elif isinstance(component, Turbine):
-            power, efficiency = format_power_comp(component.power_required,
-                                                  component.efficiency)
-            yield power, efficiency
-        elif isinstance(component, str):
-            yield (component,)
-        elif isinstance(component, GasGenerator):
-            yield (f'{component.mass_mixture_ratio:{eta_f}}',)
-        else:
-            raise ValueError('Component type not in format list')
+class FormattedValues(tuple):
+    """Strings that are drawn as they are, instead of being formatted as a (thrust, isp, ...) tuple."""
+
+
+def _format_flow(mass_flow: float, pressure: float, temperature: float) -> tuple:
+    massflow = format_si(mass_flow * 1e3, 'g/s')
+    pressure = format_si(pressure, 'Pa')
+    temperature = format_si(temperature, 'K')
+    return massflow, pressure, temperature
+
+
+def get_combustion_gas_strings(engine: EngineCycle) -> FormattedValues:
+    """Chamber mass flow, pressure and temperature formatted like a flow state, without creating one."""
+    return FormattedValues(_format_flow(engine.chamber_mass_flow, engine.combustion_chamber_pressure,
+                                        engine.combustion_temperature))
+
+
+def _format_flow_state(flow_state: FlowState) -> tuple:
+    return _format_flow(flow_state.mass_flow, flow_state.pressure, flow_state.temperature)
+
+
+def _format_pump(pump: Pump) -> tuple:
+    return format_power_comp(pump.power_required, pump.efficiency)
+
+
+def _format_engine(engine: EngineCycle) -> tuple:
+    return format_power_comp(engine.heat_flow_rate, engine.expansion_ratio_end)
+
+
+def _format_performance(performance: tuple) -> tuple:
+    """Format (thrust, specific impulse, expansion ratio[, mass mixture ratio])."""
+    thrust = format_si(performance[0], 'N')
+    isp = format_si(performance[1], 's')
+    eps = format_si(performance[2], '')
+    if len(performance) > 3:
+        mmr = f'    {format_si(performance[3], "", 3)}'
+        return thrust, isp, eps, mmr
+    return thrust, isp, eps
+
+
+def _format_electrical_component(component: ElectricalComponent) -> tuple:
+    return format_power_comp(component.output_power, component.electric_energy_efficiency, digits=5)
+
+
+def _format_turbine(turbine: Turbine) -> tuple:
+    return format_power_comp(turbine.power_required, turbine.efficiency)
+
+
+def _format_string(string: str) -> tuple:
+    return (string,)
+
+
+def _format_gas_generator(gas_generator: GasGenerator) -> tuple:
+    return (f'{gas_generator.mass_mixture_ratio:{eta_f}}',)
+
+
+_FORMATTERS = {
+    FlowState: _format_flow_state,
+    Pump: _format_pump,
+    EngineCycle: _format_engine,
+    tuple: _format_performance,
+    ElectricalComponent: _format_electrical_component,
+    Turbine: _format_turbine,
+    str: _format_string,
+    FormattedValues: tuple,
+    GasGenerator: _format_gas_generator,
+}
+
+
+@cache
+def _get_formatter(component_type: type):
+    """Formatter of the first class of component_type in _FORMATTERS, resolved once per type."""
+    for base_type in component_type.__mro__:
+        if base_type in _FORMATTERS:
+            return _FORMATTERS[base_type]
+    raise ValueError('Component type not in format list')
+
+
+def format_values(components: tuple) -> list[tuple]:
+    """Format every component to a tuple of strings, one per line drawn on the schematic."""
+    return [_get_formatter(type(component))(component) for component in components]
 
 
 if __name__ == '__main__':
@@ -710,4 +761,4 @@ if __name__ == '__main__':
     for Cycle, extra_args in cycle_list:
         complete_args = args.base_arguments | extra_args | design_args
         engine = Cycle(**complete_args)
-        make_performance_schematic(engine)
+        make_performance_schematic(engine, show=True)
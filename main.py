@@ -21,4 +21,4 @@ Cycle = OpenExpanderCycle_DoublePumpTurbine
 # Do not change
 complete_args = get_default_kwargs(Cycle) | design_args
 engine = Cycle(**complete_args)
-make_performance_schematic(engine)
+make_performance_schematic(engine, show=True)